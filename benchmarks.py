@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Seeded micro-benchmarks for the simulation hot paths, reported as JSON.
+
+Every case runs against fresh games built from the same seed at each world
+size: the hand-written world (`static`) and procedural worlds of the requested
+sizes. `--memory-sessions N` also reports the bytes each
+additional session costs at each size, and `--startup N` the time from
+launching the game to its first prompt and from creating a worker pool to its
+first finished game (best and median of N). Example:
+
+    python benchmarks.py --sizes static 10000 1000000 --memory-sessions 500 --startup 5 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import multiprocessing
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+import sampling_profiler
+from instrumentation import Metrics
+from messages import BufferSink, NullSink
+from survival_moo import SurvivalGame
+from world_gen import ProceduralWorld
+
+STATIC = "static"  # the hand-written world, as opposed to a procedural one of some size
+WorldSize = Union[int, str]  # an environment count or STATIC
+GAME_SCRIPT = Path(__file__).with_name("survival_moo.py")
+PROMPT = b"\n> "
+DEFAULT_SIZES: Tuple[WorldSize, ...] = (STATIC, 10_000, 1_000_000)
+
+Case = Callable[[SurvivalGame, Path], Callable[[], None]]
+
+
+def _advance(hrs: int) -> Case:
+    return lambda game, _: lambda: game.advance_time(hrs)
+
+
+def _instrumented(hrs: int) -> Case:
+    def setup(game: SurvivalGame, _: Path) -> Callable[[], None]:
+        game.instrument(Metrics())
+        return lambda: game.advance_time(hrs)
+
+    return setup
+
+
+def _command(command: str) -> Case:
+    return lambda game, _: lambda: game.execute_command(command)
+
+
+def _craft(game: SurvivalGame, _: Path) -> Callable[[], None]:
+    game.player.inventory["fiber"] = 10**9  # never run out, so every call takes the crafting path
+    return lambda: game.execute_command("craft rope")
+
+
+def _describe(game: SurvivalGame, _: Path) -> Callable[[], None]:
+    sink = game.sink = BufferSink()
+
+    def op() -> None:
+        game.describe_location()
+        sink.drain_text()
+
+    return op
+
+
+def _idle(fast: bool) -> Case:
+    """1000 idle hours, stepped hourly or fast-forwarded; the player is kept alive so every hour counts."""
+
+    def setup(game: SurvivalGame, _: Path) -> Callable[[], None]:
+        def op() -> None:
+            game.running = True
+            game.player.health = 10**9
+            if fast:
+                game.fast_forward(1000)
+            else:
+                for _ in range(1000):
+                    game.advance_time(1)
+
+        return op
+
+    return setup
+
+
+def _save_load(game: SurvivalGame, tmp: Path) -> Callable[[], None]:
+    path = str(tmp / "bench.json")
+
+    def op() -> None:
+        game.save_game(path)
+        game.load_game(path)
+
+    return op
+
+
+def _try_command(game: SurvivalGame, _: Path) -> Callable[[], None]:
+    """A search agent's inner loop: try a command, then put the game back."""
+    snapshot = game.snapshot()
+
+    def op() -> None:
+        game.execute_command("gather")
+        game.restore(snapshot)
+
+    return op
+
+
+CASES: Dict[str, Case] = {
+    "advance_time_1h": _advance(1),
+    "advance_time_3h": _advance(3),
+    "advance_time_24h": _advance(24),
+    "advance_time_1000h": _advance(1000),
+    "advance_time_1h_instrumented": _instrumented(1),
+    "idle_1000h_hourly": _idle(fast=False),
+    "idle_1000h_fast_forward": _idle(fast=True),
+    "command_gather": _command("gather"),
+    "command_hunt": _command("hunt"),
+    "command_craft": _craft,
+    "describe_location": _describe,
+    "save_load_round_trip": _save_load,
+    "fork": lambda game, _: game.fork,
+    "snapshot": lambda game, _: game.snapshot,
+    "try_command_and_restore": _try_command,
+}
+
+
+def world_size(text: str) -> WorldSize:
+    """`--sizes` entries: `static` or a procedural environment count."""
+    return STATIC if text == STATIC else int(text)
+
+
+def make_game(size: WorldSize, seed: int) -> SurvivalGame:
+    world = None if size == STATIC else ProceduralWorld(size, seed=seed)
+    return SurvivalGame(world=world, sink=NullSink(), seed=seed)
+
+
+def time_case(case: Case, size: WorldSize, seed: int, repeat: int, min_time: float) -> dict:
+    """Time one case on a fresh game; per-op figures come from the fastest repeat."""
+    with tempfile.TemporaryDirectory() as tmp:
+        game = make_game(size, seed)
+        timer = timeit.Timer(case(game, Path(tmp)))
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        timings = [t / number for t in timer.repeat(repeat, number)]
+    best = min(timings)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best_us": best * 1e6,
+        "median_us": statistics.median(timings) * 1e6,
+        "ops_per_sec": 1 / best if best else float("inf"),
+    }
+
+
+def session_bytes(size: WorldSize, seed: int, sessions: int) -> dict:
+    """Bytes allocated per extra session, its own world's resources and loaded chunks included.
+
+    Only what every world shares (compiled world data, text, definitions) is
+    built before the measurement starts.
+    """
+    make_game(size, seed)  # warm shared caches outside the measurement
+    gc.collect()
+    tracemalloc.start()
+    try:
+        games = [make_game(size, seed + i) for i in range(sessions)]
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"world_size": size, "sessions": len(games), "bytes_per_session": allocated / sessions}
+
+
+def _first_prompt_seconds(seed: int) -> float:
+    start = time.perf_counter()
+    game = subprocess.Popen(
+        [sys.executable, str(GAME_SCRIPT), "--seed", str(seed)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        seen = b""
+        while not seen.endswith(PROMPT):
+            chunk = game.stdout.read1(4096)
+            if not chunk:
+                raise RuntimeError("game exited before its first prompt")
+            seen += chunk
+        return time.perf_counter() - start
+    finally:
+        game.kill()
+        game.wait()
+
+
+def _new_game(seed: int) -> int:
+    return SurvivalGame(sink=NullSink(), seed=seed).player.location
+
+
+def _worker_ready_seconds(seed: int, method: str) -> float:
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context(method)) as pool:
+        pool.submit(_new_game, seed).result()
+        return time.perf_counter() - start
+
+
+def _summary_ms(timings: Sequence[float]) -> dict:
+    return {"best_ms": min(timings) * 1e3, "median_ms": statistics.median(timings) * 1e3}
+
+
+def startup_times(seed: int, samples: int) -> dict:
+    """Time-to-first-prompt of the CLI, and worker-pool start to first game for each start method."""
+    report = {"first_prompt": _summary_ms([_first_prompt_seconds(seed) for _ in range(samples)])}
+    for method in multiprocessing.get_all_start_methods():
+        report[f"worker_{method}"] = _summary_ms([_worker_ready_seconds(seed, method) for _ in range(samples)])
+    return report
+
+
+def run_suite(
+    sizes: Sequence[WorldSize] = DEFAULT_SIZES,
+    cases: Sequence[str] | None = None,
+    seed: int = 0,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    memory_sessions: int = 0,
+    startup_samples: int = 0,
+) -> dict:
+    """Run every selected case at every world size and return a JSON-ready report."""
+    results: List[dict] = []
+    for size in sizes:
+        for name in cases or CASES:
+            results.append({"case": name, "world_size": size, **time_case(CASES[name], size, seed, repeat, min_time)})
+    report = {
+        "seed": seed,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+    if memory_sessions:
+        report["memory"] = [session_bytes(size, seed, memory_sessions) for size in sizes]
+    if startup_samples:
+        report["startup"] = startup_times(seed, startup_samples)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes", type=world_size, nargs="+", default=list(DEFAULT_SIZES), help=f"{STATIC!r} = hand-written world"
+    )
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), help="default: all")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds each timed repeat should last")
+    parser.add_argument("--memory-sessions", type=int, default=0, help="sessions to build for the memory report (0 = skip)")
+    parser.add_argument("--startup", type=int, default=0, metavar="N", help="samples for the startup report (0 = skip)")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    sampling_profiler.add_arguments(parser)
+    args = parser.parse_args()
+
+    with sampling_profiler.profiling(args):
+        report = run_suite(args.sizes, args.cases, args.seed, args.repeat, args.min_time, args.memory_sessions, args.startup)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
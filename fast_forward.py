@@ -0,0 +1,124 @@
+"""Closed forms for idle stretches, so long waits cost per event instead of per hour.
+
+Between discrete events (a weather change, the fire failing, a season turn,
+an event starting or ending, midnight) every rate in an hourly
+`advance_time(1)` step is fixed. Hunger, thirst, body temperature and health
+then follow the formulas here. Hourly rolls are memoryless, so one uniform
+draw samples the gap to the next weather change or fire failure.
+`SurvivalGame.fast_forward` strings these stretches together.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Tuple
+
+# In the order `SurvivalGame.resolve_survival` checks them; they cost 2, 3, 5 and 5 health an hour.
+CAUSES = ("starvation", "dehydration", "hypothermia", "hyperthermia")
+
+
+def geometric_gap(u: float, chance: float) -> int | None:
+    """Hours until an hourly roll at `chance` first succeeds (1 = the next hour), from a uniform `u` in [0, 1).
+
+    None when `chance` is 0: it never happens.
+    """
+    if chance <= 0.0:
+        return None
+    if chance >= 1.0:
+        return 1
+    return int(math.log1p(-u) / math.log1p(-chance)) + 1
+
+
+def hours_at_least(start: int, step: int, threshold: int, hours: int) -> int:
+    """How many of hours 1..`hours` have `start + step * hour >= threshold`."""
+    if step > 0:
+        first = max(1, -((start - threshold) // step))
+        return max(0, hours - first + 1)
+    if step == 0:
+        return hours if start >= threshold else 0
+    return max(0, min(hours, (start - threshold) // -step))
+
+
+def hours_at_most(start: int, step: int, threshold: int, hours: int) -> int:
+    """How many of hours 1..`hours` have `start + step * hour <= threshold`."""
+    return hours_at_least(-start, -step, -threshold, hours)
+
+
+def first_hour_at_least(start: int, step: int, threshold: int) -> int | None:
+    """The first hour (from 1) with `start + step * hour >= threshold`, or None if it never comes."""
+    if step > 0:
+        return max(1, -((start - threshold) // step))
+    return 1 if start + step >= threshold else None
+
+
+def comfort_after(comfort: int, fire_lit: bool, sheltered: bool, hours: int) -> int:
+    """Camp comfort after `hours` hourly updates: it builds by a fire and fades without shelter."""
+    if fire_lit:
+        return min(10, comfort + hours)
+    return comfort if sheltered else max(0, comfort - hours)
+
+
+@dataclass(frozen=True, slots=True)
+class Stretch:
+    """The player's needs after a stretch of hourly steps at fixed rates."""
+
+    hours: int
+    health: int
+    hunger: int
+    thirst: int
+    body_temp: int
+    causes: Tuple[str, ...]  # survival warnings that applied in at least one hour
+    fatal: Tuple[str, ...] | None  # the causes in the hour of death, or None if the player lived
+
+
+def integrate(
+    hours: int,
+    health: int,
+    hunger: int,
+    thirst: int,
+    body_temp: int,
+    hunger_rate: int,
+    thirst_rate: int,
+    temp_step: int,
+) -> Stretch:
+    """Apply `hours` hourly needs updates and survival checks, stopping in the hour the player dies.
+
+    Hunger and thirst are capped at 100 and `body_temp` must be within the
+    30-42 clamp, as they always are between steps; then each hourly warning
+    holds on a single run of hours and the damage taken is a sum of counts.
+    """
+
+    def counts(k: int) -> Tuple[int, int, int, int]:
+        return (
+            hours_at_least(hunger, hunger_rate, 90, k),
+            hours_at_least(thirst, thirst_rate, 90, k),
+            hours_at_most(body_temp, temp_step, 34, k),
+            hours_at_least(body_temp, temp_step, 40, k),
+        )
+
+    def damage(tally: Tuple[int, int, int, int]) -> int:
+        return 2 * tally[0] + 3 * tally[1] + 5 * (tally[2] + tally[3])
+
+    tally = counts(hours)
+    fatal = None
+    if health - damage(tally) <= 0:
+        lo, hi = 1, hours  # damage only grows, so bisect for the hour health runs out
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if health - damage(counts(mid)) <= 0:
+                hi = mid
+            else:
+                lo = mid + 1
+        hours, tally = lo, counts(lo)
+        fatal = tuple(cause for cause, now, before in zip(CAUSES, tally, counts(hours - 1)) if now > before)
+
+    return Stretch(
+        hours=hours,
+        health=health - damage(tally),
+        hunger=min(100, hunger + hunger_rate * hours),
+        thirst=min(100, thirst + thirst_rate * hours),
+        body_temp=max(30, min(42, body_temp + temp_step * hours)),
+        causes=tuple(cause for cause, count in zip(CAUSES, tally) if count),
+        fatal=fatal,
+    )
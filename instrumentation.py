@@ -0,0 +1,82 @@
+"""Named timers and counters for the simulation's hot paths, exported as JSON snapshots.
+
+Nothing here runs unless asked: `SurvivalGame.instrument(metrics)` replaces
+the game's stage methods and command handlers with timed wrappers on that one
+instance, and `instrument(None)` puts the plain ones back, so an uninstrumented
+game runs exactly the code it always did. Timers are inclusive: a stage that
+calls another (a season turn easing node stress) counts the inner time in
+both. Many games can share one `Metrics` to get totals for a whole server.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+
+class Metrics:
+    """Timers (calls, total and worst time per name) and plain counters."""
+
+    __slots__ = ("timers", "counters", "_started")
+
+    def __init__(self) -> None:
+        self.timers: Dict[str, List[int]] = {}  # name -> [calls, total_ns, max_ns]
+        self.counters: Dict[str, int] = {}
+        self._started = time.perf_counter_ns()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timed(self, name: str, func: F) -> F:
+        """`func`, recording every call under timer `name`; timers with the same name add up."""
+        entry = self.timers.setdefault(name, [0, 0, 0])
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - started
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+
+        return timed  # type: ignore[return-value]
+
+    def reset(self) -> None:
+        """Zero everything; wrappers already handed out keep recording."""
+        for entry in self.timers.values():
+            entry[:] = [0, 0, 0]
+        self.counters.clear()
+        self._started = time.perf_counter_ns()
+
+    def snapshot(self) -> dict:
+        """JSON-ready totals since creation or the last `reset`, busiest timers first."""
+        timers = sorted(self.timers.items(), key=lambda item: -item[1][1])
+        return {
+            "seconds": (time.perf_counter_ns() - self._started) / 1e9,
+            "timers": {
+                name: {
+                    "calls": calls,
+                    "total_ms": total / 1e6,
+                    "mean_us": total / calls / 1e3 if calls else 0.0,
+                    "max_us": worst / 1e3,
+                }
+                for name, (calls, total, worst) in timers
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def write(self, path: str | Path) -> None:
+        Path(path).write_text(self.to_json() + "\n", encoding="utf-8")
@@ -0,0 +1,141 @@
+"""Write-ahead command journal so a crashed session can be rebuilt.
+
+The journal directory holds one binary snapshot and the commands accepted
+since it was taken:
+
+    snapshot-000000001200.ccsave   game state after 1200 journaled commands
+    journal-000000001200.log       one JSON line per command after that
+
+Every state-changing command is appended (and flushed) before it runs, with
+the RNG draw positions it starts from. Every `snapshot_every` commands a new
+snapshot replaces the old one and a fresh log is started, so recovery is one
+snapshot load plus a short, silent replay.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, List, Tuple
+
+from messages import NullSink
+from rng_streams import STREAMS
+
+if TYPE_CHECKING:
+    from survival_moo import SurvivalGame
+
+# Commands that never change game state are not journaled.
+READ_ONLY_COMMANDS = {"help", "look", "status", "inventory", "save", "quit"}
+# A load replaces the whole state, so a snapshot is taken right after it instead.
+SNAPSHOT_COMMANDS = {"load"}
+_NAME = re.compile(r"^(snapshot|journal)-(\d{12})\.(ccsave|log)$")
+
+
+class CommandJournal:
+    """Journals one game's commands into `directory`; attach with `attach` or `recover`."""
+
+    def __init__(self, directory: str | Path, snapshot_every: int = 500, sync: bool = False) -> None:
+        """`sync=True` fsyncs every entry, surviving power loss at the cost of a disk flush per command."""
+        self.directory = Path(directory)
+        self.snapshot_every = snapshot_every
+        self.sync = sync
+        self.seq = 0
+        self._since_snapshot = 0
+        self._log: IO[str] | None = None
+
+    def _path(self, kind: str, seq: int) -> Path:
+        suffix = "ccsave" if kind == "snapshot" else "log"
+        return self.directory / f"{kind}-{seq:012d}.{suffix}"
+
+    def _files(self) -> List[Tuple[str, int, Path]]:
+        if not self.directory.exists():
+            return []
+        found = []
+        for path in self.directory.iterdir():
+            match = _NAME.match(path.name)
+            if match:
+                found.append((match.group(1), int(match.group(2)), path))
+        return found
+
+    def attach(self, game: SurvivalGame) -> None:
+        """Start journaling `game` from a fresh snapshot of its current state."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        game.journal = self
+        self.snapshot(game)
+
+    def snapshot(self, game: SurvivalGame) -> None:
+        """Replace the snapshot with the current state and start an empty log after it."""
+        target = self._path("snapshot", self.seq)
+        partial = target.with_name(target.name + ".tmp")
+        game.write_binary_save(partial)
+        os.replace(partial, target)  # atomic: recovery sees the old snapshot or the new one
+
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self._path("journal", self.seq), "w", encoding="utf-8")
+        self._since_snapshot = 0
+        for kind, seq, path in self._files():
+            if seq < self.seq:
+                path.unlink()
+
+    def record(self, game: SurvivalGame, command: str, raw: str) -> None:
+        """Append `raw` before it runs; called by `SurvivalGame.execute_command`."""
+        if command in READ_ONLY_COMMANDS or command in SNAPSHOT_COMMANDS or self._log is None:
+            return
+        positions = game.rng.getstate()
+        entry = {"cmd": raw, "rng": [positions[name] for name in STREAMS]}
+        self._log.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._log.flush()
+        if self.sync:
+            os.fsync(self._log.fileno())
+        self.seq += 1
+        self._since_snapshot += 1
+
+    def committed(self, game: SurvivalGame, command: str) -> None:
+        """Called after a command ran; compacts the log into a snapshot when it is due."""
+        if command in SNAPSHOT_COMMANDS or self._since_snapshot >= self.snapshot_every:
+            self.snapshot(game)
+
+    def recover(self, game: SurvivalGame) -> bool:
+        """Rebuild the journaled state into `game` (built with the same world), then keep journaling it.
+
+        Returns False, and simply attaches, when there is nothing to recover.
+        The replay runs headless: `game`'s sink sees nothing from it.
+        """
+        snapshots = sorted((seq, path) for kind, seq, path in self._files() if kind == "snapshot")
+        if not snapshots:
+            self.attach(game)
+            return False
+
+        self.seq, snapshot_path = snapshots[-1]
+        sink, game.sink = game.sink, NullSink()
+        game.journal = None
+        try:
+            game.read_binary_save(snapshot_path)
+            log_path = self._path("journal", self.seq)
+            if log_path.exists():
+                self._replay(game, log_path)
+        finally:
+            game.sink = sink
+        self.attach(game)
+        return True
+
+    def _replay(self, game: SurvivalGame, log_path: Path) -> None:
+        with open(log_path, encoding="utf-8") as log:
+            for line in log:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn final write from the crash
+                positions = game.rng.getstate()
+                if [positions[name] for name in STREAMS] != entry["rng"]:
+                    raise ValueError(f"Journal {log_path} diverged from replay at command {self.seq}")
+                game.execute_command(entry["cmd"])
+                self.seq += 1
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
@@ -0,0 +1,332 @@
+"""Typed game messages and the sinks that render (or drop) them.
+
+Game code emits a `Msg` id with plain parameters instead of printing text.
+Formatting only happens when a sink actually renders the message, so headless
+runs with `NullSink` never build any of the strings.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+HELP_TEXT = """
+Commands:
+ look, status, inventory
+ gather, hunt, drink, eat, rest, travel
+ wait <hours> | wait until dawn, healed, thirst <level>
+ craft <item>   (rope, spark_crystal, campfire, lean-to, hut)
+ cook, extinguish, save [file], load [file], help, quit
+"""
+
+
+class Msg(Enum):
+    """Every piece of player-facing feedback the game can produce."""
+
+    BANNER = "banner"
+    HELP = "help"
+    QUIT = "quit"
+    CRAFT_USAGE = "craft_usage"
+    UNKNOWN_COMMAND = "unknown_command"
+    LOCATION = "location"
+    STATUS = "status"
+    INVENTORY = "inventory"
+    SEASON_SHIFT = "season_shift"
+    EVENT_FADES = "event_fades"
+    EVENT_BEGINS = "event_begins"
+    FIRE_FAILS = "fire_fails"
+    AMBIENT = "ambient"
+    WEATHER_SHIFT = "weather_shift"
+    STARVING = "starving"
+    DEHYDRATED = "dehydrated"
+    HYPOTHERMIA = "hypothermia"
+    HYPERTHERMIA = "hyperthermia"
+    COLLAPSE = "collapse"
+    PICKED_CLEAN = "picked_clean"
+    GATHERED = "gathered"
+    PATCH_DEPLETED = "patch_depleted"
+    PATCH_STRESSED = "patch_stressed"
+    HUNT_SUCCESS = "hunt_success"
+    HUNT_ESCAPE = "hunt_escape"
+    DRINK = "drink"
+    BAD_WATER = "bad_water"
+    UNKNOWN_CRAFT = "unknown_craft"
+    MISSING_MATERIALS = "missing_materials"
+    CAMPFIRE_BUILT = "campfire_built"
+    LEAN_TO_BUILT = "lean_to_built"
+    HUT_BUILT = "hut_built"
+    CRAFTED = "crafted"
+    COOK_NEEDS_FIRE = "cook_needs_fire"
+    NOTHING_TO_COOK = "nothing_to_cook"
+    MUSHROOM_ROASTED = "mushroom_roasted"
+    COOKED = "cooked"
+    ATE_MEAT = "ate_meat"
+    ATE_BERRIES = "ate_berries"
+    ATE_MUSHROOM = "ate_mushroom"
+    NOTHING_EDIBLE = "nothing_edible"
+    RESTED = "rested"
+    WAIT_USAGE = "wait_usage"
+    WAITED = "waited"
+    TRAVELLED = "travelled"
+    FIRE_EXTINGUISHED = "fire_extinguished"
+    FIRE_ALREADY_OUT = "fire_already_out"
+    GAME_SAVED = "game_saved"
+    NO_SAVE_FILE = "no_save_file"
+    GAME_LOADED = "game_loaded"
+    BAD_SAVE_NAME = "bad_save_name"
+    SAVE_FAILED = "save_failed"
+    PLAYER = "player"
+    PLAYER_TAKEN = "player_taken"
+    SAVE_SLOTS = "save_slots"
+
+
+def stat_feedback(hunger: int, thirst: int, body_temp: int) -> List[str]:
+    """Return threshold-based survival feedback for hunger/thirst/temperature."""
+    feedback: List[str] = []
+    if hunger >= 80:
+        feedback.append("Your stomach is painfully empty.")
+    elif hunger >= 60:
+        feedback.append("You are hungry.")
+
+    if thirst >= 80:
+        feedback.append("Your mouth is desert dry.")
+    elif thirst >= 60:
+        feedback.append("You are thirsty.")
+
+    if body_temp <= 35:
+        feedback.append("You are chilled and shivering.")
+    elif body_temp >= 39:
+        feedback.append("You feel overheated.")
+
+    return feedback
+
+
+def _render_location(env, season, season_timer, season_length, weather, event, text) -> str:
+    lines = [
+        f"\n== {env.name} ==",
+        f"Terrain: {env.terrain}",
+        f"Season: {season.name} ({season_timer}/{season_length}h)",
+        f"Season Note: {season.description}",
+    ]
+
+    scene_setter, terrain_cover, ground_travel, air_light = (env.text[i] for i in env.flavor_sections)
+
+    lines.append(f"\n{scene_setter}")
+    if terrain_cover:
+        lines.append(f"\nTerrain & Cover: {terrain_cover}")
+    if ground_travel:
+        lines.append(f"Ground & Travel: {ground_travel}")
+    if air_light:
+        lines.append(f"Air & Light: {air_light}")
+
+    lines.append(f"\nWeather — {weather.name}: {text[weather.mood_id]}")
+    if event:
+        lines.append(f"Active Event — {event.name}: {event.description}")
+
+    lines.append("\nWater:")
+    lines.extend(f" - {w.name} ({w.quality}): {env.text[w.description_id]}" for w in env.water_sources)
+
+    lines.append("\nPoints of Interest:")
+    lines.extend(f" - {p.name}: {env.text[p.description_id]}" for p in env.pois)
+
+    notes: List[str] = []
+    if env.temp_bias <= -5:
+        notes.append("Exposure risk increases quickly if you are wet or inactive.")
+    elif env.temp_bias >= 3:
+        notes.append("Heat stress risk rises at midday; shade and pace matter.")
+
+    if weather.name in {"Rain", "Storm"}:
+        notes.append("Fire is harder to maintain in current conditions.")
+    elif weather.name == "Frostwind":
+        notes.append("Wind chill can outpace clothing insulation.")
+
+    if notes:
+        lines.append("\nNotes:")
+        lines.extend(f" - {note}" for note in notes[:2])
+    return "\n".join(lines)
+
+
+def _render_status(
+    health, hunger, thirst, body_temp, hours, shelter, fire_lit, season, event, event_timer, camp_comfort
+) -> str:
+    lines = [
+        f"\nHealth:{health} Hunger:{hunger}/100 Thirst:{thirst}/100 BodyTemp:{body_temp}C Time:{hours:02d}:00",
+        f"Shelter: {shelter} | Fire: {'lit' if fire_lit else 'out'} | Season: {season}",
+    ]
+    if event:
+        lines.append(f"Event: {event} ({event_timer}h left)")
+
+    tier = "Cold Camp" if camp_comfort <= 2 else "Settled Camp" if camp_comfort <= 6 else "Cozy Camp"
+    lines.append(f"Camp Comfort: {camp_comfort}/10 ({tier})")
+    lines.extend(f" - {msg}" for msg in stat_feedback(hunger, thirst, body_temp))
+    return "\n".join(lines)
+
+
+def _render_inventory(items: Iterable[Tuple[str, int]]) -> str:
+    lines = ["\nInventory:"]
+    lines.extend(f" - {item}: {count}" for item, count in sorted(items) if count > 0)
+    return "\n".join(lines)
+
+
+def _render_save_slots(slots) -> str:
+    if not slots:
+        return "No saved games yet."
+    lines = ["Saved games:"]
+    lines.extend(f" - {s.slot}: {s.season}, {s.hours}h survived, health {s.health}" for s in slots)
+    return "\n".join(lines)
+
+
+TEMPLATES: Dict[Msg, str | Callable[..., str]] = {
+    Msg.BANNER: (
+        "\n🌲 Campfire Cantos: a tiny survival fantasy 🌲\n"
+        "You awaken with one stone, one stick, and a clear need to make practical choices."
+    ),
+    Msg.HELP: HELP_TEXT,
+    Msg.QUIT: "You leave the wilderness with stories and at least one mysterious rash.",
+    Msg.CRAFT_USAGE: "Usage: craft <item>",
+    Msg.UNKNOWN_COMMAND: "Unknown command. Type 'help' for options.",
+    Msg.LOCATION: _render_location,
+    Msg.STATUS: _render_status,
+    Msg.INVENTORY: _render_inventory,
+    Msg.SEASON_SHIFT: "\nSeason shift! {season} settles over the land.",
+    Msg.EVENT_FADES: "\nEvent fades: {event} passes.",
+    Msg.EVENT_BEGINS: "\nEvent begins: {event}. {description}",
+    Msg.FIRE_FAILS: "A wet gust strips heat from the coals and the ember bed collapses to a dull red.",
+    Msg.AMBIENT: lambda text, line: f"Ambient: {text[line]}",
+    Msg.WEATHER_SHIFT: lambda weather: f"\nWeather shift! It is now {weather.lower()}.",
+    Msg.STARVING: "You are starving. Your stomach grumbles in a low, hollow cadence.",
+    Msg.DEHYDRATED: "You are dangerously dehydrated. Your mouth is dry and your tongue sits thick against your palate.",
+    Msg.HYPOTHERMIA: "Hypothermia risk! Shivering intensifies and fine motor control begins to fade.",
+    Msg.HYPERTHERMIA: "Hyperthermia risk! Heat stress builds and concentration becomes difficult.",
+    Msg.COLLAPSE: "\nYou collapse from cumulative exposure and dehydration.",
+    Msg.PICKED_CLEAN: "Local resources are picked clean. Maybe travel and return later.",
+    Msg.GATHERED: lambda amount, item, terrain: f"You gather {amount} x {item} from the {terrain.lower()}.",
+    Msg.PATCH_DEPLETED: "The nearby {item} patch is temporarily depleted and shows little recent regrowth.",
+    Msg.PATCH_STRESSED: "The patch looks thin from repeated harvesting and recovery is visibly slow.",
+    Msg.HUNT_SUCCESS: "Successful hunt: {target}. You recover {meat} raw meat and {hide} hide.",
+    Msg.HUNT_ESCAPE: lambda target, weather: f"The {target} breaks cover and escapes in the current {weather.lower()} conditions.",
+    Msg.DRINK: "You drink from {source}.",
+    Msg.BAD_WATER: "The water quality was poor; nausea and cramping set in.",
+    Msg.UNKNOWN_CRAFT: "Unknown craft. Try: rope, spark_crystal, campfire, lean-to, hut",
+    Msg.MISSING_MATERIALS: "Missing materials for {item}: {need}",
+    Msg.CAMPFIRE_BUILT: "You build a campfire and establish a stable heat source.",
+    Msg.LEAN_TO_BUILT: "You build a lean-to shelter.",
+    Msg.HUT_BUILT: "You reinforce your camp into a sturdy hut.",
+    Msg.CRAFTED: "You craft {item}.",
+    Msg.COOK_NEEDS_FIRE: "You need a lit campfire to cook.",
+    Msg.NOTHING_TO_COOK: "Nothing to cook right now.",
+    Msg.MUSHROOM_ROASTED: "You roast a mushroom cap; the aroma is earthy and clean.",
+    Msg.COOKED: "You cook {amount} meat over the fire.",
+    Msg.ATE_MEAT: "You eat cooked meat and feel your energy return.",
+    Msg.ATE_BERRIES: "You snack on berries.",
+    Msg.ATE_MUSHROOM: "You eat a mushroom with caution and monitor for any adverse effects.",
+    Msg.NOTHING_EDIBLE: "You have nothing edible right now.",
+    Msg.RESTED: "You rest in shelter and recover {heal} health.",
+    Msg.WAIT_USAGE: "Usage: wait <hours> | wait until dawn | wait until healed | wait until thirst <level>",
+    Msg.WAITED: "You rest for {hours} hours and recover {heal} health.",
+    Msg.TRAVELLED: "You travel from {origin} to {destination}.",
+    Msg.FIRE_EXTINGUISHED: "You extinguish the campfire and save some fuel for later.",
+    Msg.FIRE_ALREADY_OUT: "Your fire is already out.",
+    Msg.GAME_SAVED: "Game saved to {path}.",
+    Msg.NO_SAVE_FILE: "No save file found at {path}.",
+    Msg.GAME_LOADED: "Game loaded from {path}.",
+    Msg.BAD_SAVE_NAME: "{name!r} is not a save file name.",
+    Msg.SAVE_FAILED: "Could not {command} {path}: {reason}.",
+    Msg.PLAYER: "Saving as player {player}.",
+    Msg.PLAYER_TAKEN: "Player {player} is already connected.",
+    Msg.SAVE_SLOTS: _render_save_slots,
+}
+
+
+def render(msg: Msg, params: Dict[str, Any]) -> str:
+    """Format one message exactly as the game used to print it (without the trailing newline)."""
+    template = TEMPLATES[msg]
+    if callable(template):
+        return template(**params)
+    return template.format(**params) if params else template
+
+
+class RenderCache:
+    """LRU of rendered text for messages that are pure functions of their parameters.
+
+    `look` and the status line are re-rendered constantly with unchanged
+    inputs; the parameters themselves are the key, so a hit is never stale.
+    `invalidate` drops entries that can no longer be hit once conditions move on.
+    """
+
+    CACHED = frozenset({Msg.LOCATION, Msg.STATUS})
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        # hash(key) -> (key, text): the key's dataclasses are hashed once per lookup, not once per dict operation.
+        self.entries: OrderedDict[int, Tuple[tuple, str]] = OrderedDict()
+
+    def render(self, msg: Msg, params: Dict[str, Any]) -> str:
+        if msg not in self.CACHED:
+            return render(msg, params)
+        key = (msg, *params.values())  # each cached message is emitted from one place, in one argument order
+        digest = hash(key)
+        entry = self.entries.get(digest)
+        if entry is not None and entry[0] == key:
+            self.entries.move_to_end(digest)
+            return entry[1]
+        text = render(msg, params)
+        self.entries[digest] = (key, text)
+        self.entries.move_to_end(digest)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return text
+
+    def invalidate(self) -> None:
+        self.entries.clear()
+
+
+class MessageSink:
+    """Receives every message a game emits; subclasses decide whether and how to render."""
+
+    def emit(self, msg: Msg, **params: Any) -> None:
+        raise NotImplementedError
+
+    def invalidate(self) -> None:
+        """Called when weather, season or event change, so cached renders of the old conditions can go."""
+
+
+class NullSink(MessageSink):
+    """Drops messages without formatting them, for simulations and replays."""
+
+    def emit(self, msg: Msg, **params: Any) -> None:
+        pass
+
+
+class StdoutSink(MessageSink):
+    """Prints each message as soon as it is emitted, reproducing the classic console text."""
+
+    def __init__(self) -> None:
+        self.cache = RenderCache()
+
+    def emit(self, msg: Msg, **params: Any) -> None:
+        print(self.cache.render(msg, params))
+
+    def invalidate(self) -> None:
+        self.cache.invalidate()
+
+
+class BufferSink(MessageSink):
+    """Keeps emitted messages and renders them only when the text is asked for."""
+
+    def __init__(self) -> None:
+        self.records: List[Tuple[Msg, Dict[str, Any]]] = []
+        self.cache = RenderCache()
+
+    def emit(self, msg: Msg, **params: Any) -> None:
+        self.records.append((msg, params))
+
+    def drain_text(self) -> str:
+        """Render and clear everything buffered so far, one line break per message like `print`."""
+        text = "".join(self.cache.render(msg, params) + "\n" for msg, params in self.records)
+        self.records.clear()
+        return text
+
+    def invalidate(self) -> None:
+        self.cache.invalidate()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Monte Carlo survival runs: play scripted policies over many seeds on every core.
+
+A policy is any picklable callable taking an `Observation` and returning a
+command string, e.g. `forager`. Seeds are split into contiguous shards, one
+task per shard, so a given `(policy, start_seed, runs)` always plays the same
+games no matter how many workers run them or in which order shards finish.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import sampling_profiler
+from messages import NullSink
+from survival_moo import SurvivalGame
+
+
+@dataclass(frozen=True)
+class Observation:
+    """Read-only view of the state a policy may base its next command on."""
+
+    health: int
+    hunger: int
+    thirst: int
+    body_temp: int
+    hour: int
+    elapsed_hours: int
+    environment: str
+    inventory: Dict[str, int]
+    shelter_level: int
+    fire_lit: bool
+    camp_comfort: int
+    weather: str
+    season: str
+    event: str | None
+    ambient_temp: int
+
+
+def observe(game: SurvivalGame) -> Observation:
+    p = game.player
+    return Observation(
+        health=p.health,
+        hunger=p.hunger,
+        thirst=p.thirst,
+        body_temp=p.body_temp,
+        hour=p.hours,
+        elapsed_hours=game.elapsed_hours,
+        environment=game.current_env().name,
+        inventory=dict(p.inventory),
+        shelter_level=p.shelter.level,
+        fire_lit=p.fire_lit,
+        camp_comfort=p.camp_comfort,
+        weather=game.weather.name,
+        season=game.current_season.name,
+        event=game.active_event.name if game.active_event else None,
+        ambient_temp=game._ambient_temp(game.current_env()),
+    )
+
+
+Policy = Callable[[Observation], str]
+
+
+def idle(state: Observation) -> str:
+    """Baseline: never do anything but rest."""
+    return "rest"
+
+
+def forager(state: Observation) -> str:
+    """Keep water and food topped up, build a fire and shelter, otherwise gather."""
+    inv = state.inventory
+    if state.thirst >= 50:
+        return "drink"
+    if state.hunger >= 50 and (inv["cooked_meat"] or inv["berries"] or inv["mushroom"]):
+        return "eat"
+    if state.fire_lit and inv["raw_meat"]:
+        return "cook"
+    if not state.fire_lit and inv["stick"] >= 3 and inv["stone"] >= 2:
+        return "craft campfire"
+    if state.shelter_level == 0 and inv["stick"] >= 5 and inv["fiber"] >= 4:
+        return "craft lean-to"
+    if state.health < 60:
+        return "rest"
+    if state.hunger >= 40 and state.fire_lit:
+        return "hunt"
+    return "gather"
+
+
+POLICIES: Dict[str, Policy] = {"idle": idle, "forager": forager}
+
+
+@dataclass(frozen=True)
+class RunResult:
+    seed: int
+    hours_survived: int
+    cause_of_death: str
+    season_reached: str
+    commands: int
+
+
+def play(policy: Policy, seed: int, max_hours: int = 2_000, max_commands: int = 20_000) -> RunResult:
+    """Play one silent game until death, `max_hours` in-game hours, or `max_commands` commands."""
+    game = SurvivalGame(sink=NullSink(), seed=seed)
+    commands = 0
+    while game.running and game.elapsed_hours < max_hours and commands < max_commands:
+        game.execute_command(policy(observe(game)))
+        commands += 1
+    return RunResult(
+        seed=seed,
+        hours_survived=game.elapsed_hours,
+        cause_of_death=game.cause_of_death or "survived",
+        season_reached=game.current_season.name,
+        commands=commands,
+    )
+
+
+def _play_shard(policy: Policy, seeds: range, max_hours: int, max_commands: int) -> List[RunResult]:
+    return [play(policy, seed, max_hours, max_commands) for seed in seeds]
+
+
+def shard_seeds(start_seed: int, runs: int, shard_size: int) -> List[range]:
+    """Split `runs` consecutive seeds into contiguous shards of at most `shard_size`."""
+    stop = start_seed + runs
+    return [range(lo, min(lo + shard_size, stop)) for lo in range(start_seed, stop, shard_size)]
+
+
+class Aggregate:
+    """Running totals over run results; exact and independent of arrival order."""
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.total_hours = 0
+        self.total_hours_sq = 0
+        self.min_hours: int | None = None
+        self.max_hours = 0
+        self.causes: Counter[str] = Counter()
+        self.seasons: Counter[str] = Counter()
+
+    def add(self, result: RunResult) -> None:
+        hours = result.hours_survived
+        self.runs += 1
+        self.total_hours += hours
+        self.total_hours_sq += hours * hours
+        self.min_hours = hours if self.min_hours is None else min(self.min_hours, hours)
+        self.max_hours = max(self.max_hours, hours)
+        self.causes[result.cause_of_death] += 1
+        self.seasons[result.season_reached] += 1
+
+    def summary(self) -> dict:
+        mean = self.total_hours / self.runs if self.runs else 0.0
+        variance = self.total_hours_sq / self.runs - mean * mean if self.runs else 0.0
+        return {
+            "runs": self.runs,
+            "mean_hours": mean,
+            "stdev_hours": max(0.0, variance) ** 0.5,
+            "min_hours": self.min_hours or 0,
+            "max_hours": self.max_hours,
+            "causes": dict(sorted(self.causes.items())),
+            "seasons": dict(sorted(self.seasons.items())),
+        }
+
+
+def iter_results(
+    policy: Policy,
+    runs: int,
+    start_seed: int = 0,
+    workers: int | None = None,
+    shard_size: int = 256,
+    max_hours: int = 2_000,
+    max_commands: int = 20_000,
+) -> Iterator[RunResult]:
+    """Yield results as shards finish; `workers=0` plays every shard in this process.
+
+    At most two shards per worker are in flight, so memory stays flat however
+    many runs are requested.
+    """
+    shards = shard_seeds(start_seed, runs, shard_size)
+    if workers == 0:
+        for seeds in shards:
+            yield from _play_shard(policy, seeds, max_hours, max_commands)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    pending_shards = iter(shards)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        for seeds in pending_shards:
+            in_flight.add(pool.submit(_play_shard, policy, seeds, max_hours, max_commands))
+            if len(in_flight) >= 2 * workers:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                seeds = next(pending_shards, None)
+                if seeds is not None:
+                    in_flight.add(pool.submit(_play_shard, policy, seeds, max_hours, max_commands))
+
+
+def run_monte_carlo(
+    policy: Policy,
+    runs: int,
+    start_seed: int = 0,
+    workers: int | None = None,
+    shard_size: int = 256,
+    max_hours: int = 2_000,
+    max_commands: int = 20_000,
+    on_result: Callable[[RunResult, Aggregate, float], None] | None = None,
+) -> Tuple[Aggregate, float]:
+    """Aggregate `runs` games; returns the totals and throughput in runs per second.
+
+    `on_result(result, aggregate, runs_per_sec)` is called as each result arrives.
+    """
+    aggregate = Aggregate()
+    started = time.perf_counter()
+    for result in iter_results(policy, runs, start_seed, workers, shard_size, max_hours, max_commands):
+        aggregate.add(result)
+        if on_result is not None:
+            on_result(result, aggregate, aggregate.runs / max(time.perf_counter() - started, 1e-9))
+    return aggregate, aggregate.runs / max(time.perf_counter() - started, 1e-9)
+
+
+def resolve_policy(name: str) -> Policy:
+    """Accept a built-in policy name or `module:function`."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise SystemExit(f"Unknown policy {name!r}; use one of {sorted(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module), attr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--policy", default="forager", help="built-in policy name or module:function")
+    parser.add_argument("--runs", type=int, default=10_000)
+    parser.add_argument("--start-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores, 0: in-process)")
+    parser.add_argument("--shard-size", type=int, default=256, help="consecutive seeds per task")
+    parser.add_argument("--max-hours", type=int, default=2_000)
+    parser.add_argument("--results", metavar="PATH", help="also write every run as a JSON line")
+    sampling_profiler.add_arguments(parser)
+    args = parser.parse_args()
+
+    out = open(args.results, "w", encoding="utf-8") if args.results else None
+    last_report = time.perf_counter()
+
+    def on_result(result: RunResult, aggregate: Aggregate, runs_per_sec: float) -> None:
+        nonlocal last_report
+        if out is not None:
+            out.write(json.dumps(asdict(result)) + "\n")
+        if time.perf_counter() - last_report >= 1.0:
+            last_report = time.perf_counter()
+            print(f"{aggregate.runs}/{args.runs} runs, {runs_per_sec:.0f} runs/sec", flush=True)
+
+    try:
+        # Only this process is sampled: profile with --workers 0 to see the games themselves.
+        with sampling_profiler.profiling(args):
+            aggregate, runs_per_sec = run_monte_carlo(
+                resolve_policy(args.policy),
+                args.runs,
+                start_seed=args.start_seed,
+                workers=args.workers,
+                shard_size=args.shard_size,
+                max_hours=args.max_hours,
+                on_result=on_result,
+            )
+    finally:
+        if out is not None:
+            out.close()
+    print(json.dumps({**aggregate.summary(), "runs_per_sec": runs_per_sec}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
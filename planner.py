@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Monte Carlo tree search over `SurvivalGame` commands: a player assistant and a strength benchmark.
+
+The search is open loop. A tree node is a sequence of commands from the
+current state, and every iteration replays it on a silent fork under fresh
+random draws, so the statistics average over hunts, weather and events
+instead of peeking at the game's own upcoming rolls. A new leaf is scored by
+playing a rollout policy (`montecarlo.forager` by default) up to
+`horizon_hours` ahead. Rollouts can run on worker processes, and the subtree
+under the command actually played is kept for the next turn.
+
+By default the planner plays a silent game and reports how long it survived
+and its rollouts per second; `--assist` instead plays interactively, showing
+its suggestion before each prompt. Example:
+
+    python planner.py --seed 3 --turns 200 --iterations 300 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+import sampling_profiler
+from messages import NullSink
+from montecarlo import Policy, forager, observe, resolve_policy
+from survival_moo import RECIPES, GameSnapshot, StaticWorld, SurvivalGame
+
+# Simulation `i` draws from every stream `i * SIM_STREAM_SPACING` ahead of the game, far past anything it will use.
+SIM_STREAM_SPACING = 1 << 32
+ROLLOUT_COMMANDS = 500  # a rollout stops after this many commands even if the horizon is not reached
+
+
+def legal_commands(game: SurvivalGame) -> List[str]:
+    """Commands that would change something now; the rest only print a refusal."""
+    p = game.player
+    inv = p.inventory
+    commands = ["gather", "hunt", "drink", "rest", "travel"]
+    if inv.cooked_meat or inv.berries or inv.mushroom:
+        commands.append("eat")
+    if p.fire_lit and (inv.raw_meat or inv.mushroom):
+        commands.append("cook")
+    built = {"campfire": p.fire_lit, "lean-to": p.shelter.level >= 1, "hut": p.shelter.level >= 2}
+    for item, need in RECIPES.items():
+        if not built.get(item) and all(inv[k] >= v for k, v in need.items()):
+            commands.append(f"craft {item}")
+    return commands
+
+
+def score(game: SurvivalGame, start_hour: int, horizon_hours: int) -> float:
+    """Value in [0, 1]: below 0.5 for a death (more for dying later), above it for surviving in better shape."""
+    lived = min(game.elapsed_hours - start_hour, horizon_hours)
+    if game.cause_of_death is not None:
+        return 0.5 * lived / horizon_hours
+    p = game.player
+    return 0.5 + 0.5 * (p.health + (100 - p.hunger) + (100 - p.thirst)) / 300
+
+
+def rollout(game: SurvivalGame, policy: Policy, start_hour: int, horizon_hours: int) -> float:
+    """Play `policy` until death or the horizon, then `score` the result."""
+    commands = 0
+    while game.running and game.elapsed_hours - start_hour < horizon_hours and commands < ROLLOUT_COMMANDS:
+        game.execute_command(policy(observe(game)))
+        commands += 1
+    return score(game, start_hour, horizon_hours)
+
+
+@functools.lru_cache(maxsize=1)
+def _simulator() -> SurvivalGame:
+    """One silent game per worker process, restored from each snapshot it is sent."""
+    return SurvivalGame(sink=NullSink(), seed=0)
+
+
+def _rollout_batch(snapshots: Sequence[GameSnapshot], policy: Policy, start_hour: int, horizon_hours: int) -> List[float]:
+    game = _simulator()
+    values = []
+    for snapshot in snapshots:
+        game.restore(snapshot)
+        values.append(rollout(game, policy, start_hour, horizon_hours))
+    return values
+
+
+@dataclass(slots=True, eq=False)
+class Node:
+    """Statistics for one command sequence; `visits` counts a pass as soon as it is selected."""
+
+    visits: int = 0
+    value: float = 0.0
+    children: Dict[str, Node] = field(default_factory=dict)
+
+    @property
+    def mean(self) -> float:
+        return self.value / self.visits if self.visits else 0.0
+
+
+@dataclass(frozen=True)
+class SearchStats:
+    rollouts: int
+    seconds: float
+    rollouts_per_sec: float
+    visits: Dict[str, int]  # per legal root command
+    values: Dict[str, float]  # mean score per legal root command
+
+
+class MctsPlanner:
+    """Pick commands by UCT search; reuse one planner for a whole game so its tree carries over."""
+
+    def __init__(
+        self,
+        iterations: int | None = 300,
+        seconds: float | None = None,
+        horizon_hours: int = 72,
+        exploration: float = 0.5,
+        workers: int = 0,
+        batch: int = 4,
+        policy: Policy = forager,
+        seed: int = 0,
+    ) -> None:
+        """Search until `iterations` rollouts or `seconds` of wall time, whichever comes first.
+
+        With `workers` > 0, rollouts run on that many processes, `batch` per
+        worker per round; this needs the hand-written world. `policy` must be
+        picklable to run on workers.
+        """
+        if iterations is None and seconds is None:
+            raise ValueError("Give the planner an iteration budget, a time budget or both")
+        self.iterations = iterations
+        self.seconds = seconds
+        self.horizon_hours = horizon_hours
+        self.exploration = exploration
+        self.workers = workers
+        self.batch = batch
+        self.policy = policy
+        self.root = Node()
+        self.last_stats: SearchStats | None = None
+        self._rng = random.Random(seed)
+        self._simulations = 0
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> MctsPlanner:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def choose(self, game: SurvivalGame) -> str:
+        """Search from `game`'s current state and return the most visited legal command.
+
+        `game` itself is not changed. Call `advance` with the command played
+        so the next search starts from its subtree.
+        """
+        if self.workers and not isinstance(game.world, StaticWorld):
+            raise ValueError("Parallel rollouts need the hand-written world; use workers=0 for other worlds")
+        commands = legal_commands(game)
+        snapshot = game.snapshot()
+        sim = game.fork()
+        start = game.elapsed_hours
+        started = time.perf_counter()
+        deadline = math.inf if self.seconds is None else started + self.seconds
+        done = 0
+        while (self.iterations is None or done < self.iterations) and time.perf_counter() < deadline:
+            count = self.batch * self.workers if self.workers else 1
+            if self.iterations is not None:
+                count = min(count, self.iterations - done)
+            pending: List[Tuple[List[Node], GameSnapshot]] = []
+            for _ in range(count):
+                path = self._descend(sim, snapshot, start)
+                if sim.running and sim.elapsed_hours - start < self.horizon_hours:
+                    if self.workers:
+                        pending.append((path, sim.snapshot()))
+                        continue
+                    value = rollout(sim, self.policy, start, self.horizon_hours)
+                else:
+                    value = score(sim, start, self.horizon_hours)
+                self._backup(path, value)
+            for (path, _), value in zip(pending, self._parallel_rollouts([leaf for _, leaf in pending], start)):
+                self._backup(path, value)
+            done += count
+
+        seconds = time.perf_counter() - started
+        children = {command: self.root.children[command] for command in commands if command in self.root.children}
+        self.last_stats = SearchStats(
+            rollouts=done,
+            seconds=seconds,
+            rollouts_per_sec=done / max(seconds, 1e-9),
+            visits={command: child.visits for command, child in children.items()},
+            values={command: child.mean for command, child in children.items()},
+        )
+        if not children:
+            return commands[0]
+        return max(children, key=lambda command: (children[command].visits, children[command].mean))
+
+    def advance(self, command: str) -> None:
+        """Keep only the subtree under `command`, which the game has just played."""
+        self.root = self.root.children.get(command) or Node()
+
+    def step(self, game: SurvivalGame) -> str:
+        """Choose a command, play it on `game` and advance the tree; returns the command."""
+        command = self.choose(game)
+        game.execute_command(command)
+        self.advance(command)
+        return command
+
+    def _descend(self, sim: SurvivalGame, snapshot: GameSnapshot, start: int) -> List[Node]:
+        """Replay the tree policy on `sim` from `snapshot` until it adds a node or the simulation ends."""
+        sim.restore(snapshot)
+        self._simulations += 1
+        for stream in sim.rng.streams().values():
+            stream.jump(self._simulations * SIM_STREAM_SPACING)
+
+        node = self.root
+        node.visits += 1
+        path = [node]
+        while sim.running and sim.elapsed_hours - start < self.horizon_hours:
+            commands = legal_commands(sim)
+            untried = [command for command in commands if command not in node.children]
+            if untried:
+                command = self._rng.choice(untried)
+                node.children[command] = Node()
+            else:
+                log_visits = math.log(node.visits)
+                command = max(commands, key=lambda c: self._ucb(node.children[c], log_visits))
+            sim.execute_command(command)
+            node = node.children[command]
+            node.visits += 1
+            path.append(node)
+            if untried:
+                break
+        return path
+
+    def _ucb(self, child: Node, log_parent_visits: float) -> float:
+        return child.mean + self.exploration * math.sqrt(log_parent_visits / child.visits)
+
+    @staticmethod
+    def _backup(path: List[Node], value: float) -> None:
+        for node in path:
+            node.value += value
+
+    def _parallel_rollouts(self, leaves: List[GameSnapshot], start: int) -> List[float]:
+        if not leaves:
+            return []
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        size = -(-len(leaves) // self.workers)
+        batches = [leaves[i : i + size] for i in range(0, len(leaves), size)]
+        futures = [self._pool.submit(_rollout_batch, batch, self.policy, start, self.horizon_hours) for batch in batches]
+        return [value for future in futures for value in future.result()]
+
+
+def assist(game: SurvivalGame, planner: MctsPlanner) -> None:
+    """The classic console game, with the planner's suggestion before each prompt; Enter plays it."""
+    game.intro()
+    while game.running:
+        game.status()
+        suggestion = planner.choose(game)
+        print(f"Planner suggests: {suggestion} ({planner.last_stats.rollouts_per_sec:.0f} rollouts/sec)")
+        command = input("\n> ").strip().lower() or suggestion
+        game.execute_command(command)
+        planner.advance(command)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="game seed")
+    parser.add_argument("--turns", type=int, default=100, help="commands to play unless the player dies first")
+    parser.add_argument("--iterations", type=int, help="rollouts per turn (default 300 unless --seconds is given)")
+    parser.add_argument("--seconds", type=float, help="wall-clock budget per turn")
+    parser.add_argument("--horizon", type=int, default=72, help="hours each rollout looks ahead")
+    parser.add_argument("--workers", type=int, default=0, help="rollout processes (0: in-process)")
+    parser.add_argument("--policy", default="forager", help="rollout policy: built-in name or module:function")
+    parser.add_argument("--assist", action="store_true", help="play interactively with the planner's suggestions")
+    sampling_profiler.add_arguments(parser)
+    args = parser.parse_args()
+
+    iterations = args.iterations if args.iterations is not None or args.seconds is not None else 300
+    game = SurvivalGame(sink=None if args.assist else NullSink(), seed=args.seed)
+    rollouts = 0
+    searching = 0.0
+    with sampling_profiler.profiling(args), MctsPlanner(
+        iterations=iterations,
+        seconds=args.seconds,
+        horizon_hours=args.horizon,
+        workers=args.workers,
+        policy=resolve_policy(args.policy),
+        seed=args.seed,
+    ) as planner:
+        if args.assist:
+            assist(game, planner)
+            return
+        turn = 0
+        while game.running and turn < args.turns:
+            command = planner.step(game)
+            stats = planner.last_stats
+            rollouts += stats.rollouts
+            searching += stats.seconds
+            turn += 1
+            print(f"turn {turn}: {command} (hour {game.elapsed_hours}, {stats.rollouts_per_sec:.0f} rollouts/sec)", flush=True)
+    print(
+        json.dumps(
+            {
+                "hours_survived": game.elapsed_hours,
+                "cause_of_death": game.cause_of_death or "survived",
+                "commands": turn,
+                "rollouts": rollouts,
+                "rollouts_per_sec": rollouts / max(searching, 1e-9),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,454 @@
+"""Columnar storage for resource nodes, with lazy closed-form regeneration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+LEDGER_COMPACT_SEGMENTS = 1024
+# One node per record: environment id, index into `ResourceStore.items`, then its values.
+RECORD_DTYPE = np.dtype(
+    [
+        ("env", "<u4"),
+        ("item", "<u4"),
+        ("count", "<i4"),
+        ("max_count", "<i4"),
+        ("regen_rate", "<i4"),
+        ("stress", "<i4"),
+    ]
+)
+
+
+class RegenLedger:
+    """Append-only log of world-wide regeneration pressure for lazy node settlement.
+
+    Every `advance_time` step records one segment: its length in hours and the
+    combined season/event regen modifier. Stress decay ticks (season shifts and
+    midnights) are counted globally. A node remembers the segment position and
+    decay count it was last settled at, and `regrowth` works out what it gained
+    since then in closed form, so untouched nodes cost nothing per tick.
+    """
+
+    def __init__(self) -> None:
+        self.position = 0
+        self.decay_count = 0
+        self.modifiers: List[int] = []
+        # Allocated on the first record, so idle stores (e.g. fresh sessions) stay small.
+        self._decays = np.zeros(0, dtype=np.int64)
+        self._hours = np.zeros((0, 1), dtype=np.int64)
+
+    @property
+    def segment_decays(self) -> np.ndarray:
+        return self._decays[: self.position]
+
+    def record(self, hrs: int, modifier: int) -> None:
+        """Append a segment of `hrs` hours regenerating under `modifier`."""
+        if self.position == len(self._decays):
+            capacity = max(64, 2 * len(self._decays))
+            self._decays = np.concatenate([self._decays, np.zeros(capacity - len(self._decays), dtype=np.int64)])
+            grown = np.zeros((len(self.modifiers), capacity + 1), dtype=np.int64)
+            grown[:, : self._hours.shape[1]] = self._hours
+            self._hours = grown
+        if modifier not in self.modifiers:
+            self.modifiers.append(modifier)
+            self._hours = np.vstack([self._hours, np.zeros((1, self._hours.shape[1]), dtype=np.int64)])
+
+        row = self.modifiers.index(modifier)
+        self._decays[self.position] = self.decay_count
+        self._hours[:, self.position + 1] = self._hours[:, self.position]
+        self._hours[row, self.position + 1] += hrs
+        self.position += 1
+
+    def decay(self, amount: int = 1) -> None:
+        """Recover `amount` stress on every node without touching any of them."""
+        self.decay_count += amount
+
+    def copy(self) -> RegenLedger:
+        clone = RegenLedger.__new__(RegenLedger)
+        clone.position = self.position
+        clone.decay_count = self.decay_count
+        clone.modifiers = list(self.modifiers)
+        clone._decays = self._decays.copy()
+        clone._hours = self._hours.copy()
+        return clone
+
+    def reset(self) -> None:
+        """Forget all segments; every node must have been settled to the current position first."""
+        self.position = 0
+        self.decay_count = 0
+        self._hours[:] = 0
+
+    def regrowth(
+        self,
+        regen_rate: np.ndarray,
+        stress: np.ndarray,
+        settled_at: np.ndarray,
+        settled_decay: np.ndarray,
+        bonus: int = 0,
+    ) -> np.ndarray:
+        """Return units regrown by each node since it was settled (before the `max_count` cap)."""
+        end = self.position
+        decays = self.segment_decays
+        cumulative = self._hours[:, : end + 1]
+        gained = np.zeros(len(regen_rate), dtype=np.int64)
+        lo = settled_at.astype(np.int64)
+        max_penalty = int(stress.max(initial=0)) // 3
+
+        # Stress only falls over time, so stress // 3 walks down through a handful of phases.
+        for penalty in range(max_penalty, -1, -1):
+            if penalty > 0:
+                threshold = settled_decay + stress - 3 * penalty + 1
+                hi = np.clip(np.searchsorted(decays, threshold, side="left"), lo, end)
+            else:
+                hi = np.full_like(lo, end)
+            for row, mod in enumerate(self.modifiers):
+                per_hour = np.maximum(0, regen_rate + mod - penalty + bonus)
+                gained += per_hour * (cumulative[row, hi] - cumulative[row, lo])
+            lo = hi
+        return gained
+
+
+@dataclass(frozen=True, slots=True)
+class StoreSnapshot:
+    """A `ResourceStore`'s state at one moment; restoring it leaves it intact for the next restore."""
+
+    columns: Tuple[np.ndarray, ...]  # `ResourceStore.COLUMNS`, in order
+    dirty: np.ndarray
+    layouts: Tuple[tuple, ...]
+    free_rows: Tuple[int, ...]
+    row_count: int
+    ledger: RegenLedger
+
+
+class ResourceStore:
+    """Resource node state for a whole world as contiguous (row, item_id) arrays.
+
+    A row holds one environment; for hand-written worlds the row is the env id.
+    `layouts[row]` lists the items an environment actually has, in definition
+    order; other slots stay at zero capacity. Counts and stress are
+    settled lazily against the `ledger`: `settle` brings a set of rows
+    up to date in one vectorized update.
+
+    Streamed worlds `allocate_row` when an environment becomes resident and
+    `release_row` when it is evicted; `dirty` flags rows changed by play.
+    """
+
+    COLUMNS = ("count", "max_count", "regen_rate", "stress", "settled_at", "settled_decay")
+
+    def __init__(self, env_count: int, items: Sequence[str]) -> None:
+        self.items = list(items)
+        self.item_index = {item: i for i, item in enumerate(self.items)}
+        shape = (env_count, len(self.items))
+        self.count = np.zeros(shape, dtype=np.int32)
+        self.max_count = np.zeros(shape, dtype=np.int32)
+        self.regen_rate = np.zeros(shape, dtype=np.int32)
+        self.stress = np.zeros(shape, dtype=np.int32)
+        self.settled_at = np.zeros(shape, dtype=np.int32)
+        self.settled_decay = np.zeros(shape, dtype=np.int32)
+        self.dirty = np.zeros(env_count, dtype=bool)
+        self.layouts: List[tuple] = [()] * env_count
+        self.ledger = RegenLedger()
+        self._free_rows: List[int] = []
+        self._row_count = env_count
+
+    @classmethod
+    def from_world_data(cls, world_data: Sequence[dict]) -> ResourceStore:
+        """Build a store from `WORLD_DATA`-style environment definitions."""
+        return cls.from_node_rows(
+            [
+                [(item, node["count"], node["max"], node["regen"], node.get("stress", 0)) for item, node in entry["resource_nodes"].items()]
+                for entry in world_data
+            ]
+        )
+
+    @classmethod
+    def from_node_rows(cls, rows: Sequence[Sequence[tuple]]) -> ResourceStore:
+        """Build a store from one `(item, count, max, regen, stress)` sequence per environment."""
+        items = sorted({node[0] for row in rows for node in row})
+        store = cls(len(rows), items)
+        for env_id, row in enumerate(rows):
+            for item, count, max_count, regen_rate, stress in row:
+                store.set_node(env_id, item, count, max_count, regen_rate, stress)
+        return store
+
+    def copy(self) -> ResourceStore:
+        """An independent store with the same nodes, settled and with a fresh ledger.
+
+        Item names and layout tuples are immutable and shared with this store.
+        """
+        self.settle_all()
+        clone = self.fork()
+        clone.settled_at[:] = 0
+        clone.settled_decay[:] = 0
+        clone.ledger = RegenLedger()
+        return clone
+
+    def snapshot(self) -> StoreSnapshot:
+        """Copy the node arrays and the ledger as they stand.
+
+        Unlike `copy`, nothing is settled: a camp's comfort bonus settles one
+        row mid-step, so settling early could change what replay produces.
+        """
+        return StoreSnapshot(
+            columns=tuple(getattr(self, name).copy() for name in self.COLUMNS),
+            dirty=self.dirty.copy(),
+            layouts=tuple(self.layouts),
+            free_rows=tuple(self._free_rows),
+            row_count=self._row_count,
+            ledger=self.ledger.copy(),
+        )
+
+    def restore(self, snapshot: StoreSnapshot) -> None:
+        """Return every node and the ledger to `snapshot`; node views of this store stay valid."""
+        for name, column in zip(self.COLUMNS, snapshot.columns):
+            setattr(self, name, column.copy())
+        self.dirty = snapshot.dirty.copy()
+        self.layouts = list(snapshot.layouts)
+        self._free_rows = list(snapshot.free_rows)
+        self._row_count = snapshot.row_count
+        self.ledger = snapshot.ledger.copy()
+
+    def fork(self) -> ResourceStore:
+        """An independent store in exactly this state, ledger included; see `snapshot`."""
+        clone = ResourceStore.__new__(ResourceStore)
+        clone.items = self.items
+        clone.item_index = self.item_index
+        for name in self.COLUMNS:
+            setattr(clone, name, getattr(self, name).copy())
+        clone.dirty = self.dirty.copy()
+        clone.layouts = list(self.layouts)
+        clone.ledger = self.ledger.copy()
+        clone._free_rows = list(self._free_rows)
+        clone._row_count = self._row_count
+        return clone
+
+    @property
+    def env_count(self) -> int:
+        return self._row_count
+
+    def allocate_row(self) -> int:
+        """Reserve an empty row, growing the arrays geometrically when full."""
+        if self._free_rows:
+            return self._free_rows.pop()
+        if self._row_count == self.count.shape[0]:
+            extra = max(16, self._row_count)
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros((extra, column.shape[1]), dtype=column.dtype)]))
+            self.dirty = np.concatenate([self.dirty, np.zeros(extra, dtype=bool)])
+            self.layouts.extend([()] * extra)
+        row = self._row_count
+        self._row_count += 1
+        return row
+
+    def release_row(self, row: int) -> None:
+        """Clear a row and make it available to `allocate_row` again."""
+        for name in self.COLUMNS:
+            getattr(self, name)[row] = 0
+        self.dirty[row] = False
+        self.layouts[row] = ()
+        self._free_rows.append(row)
+
+    def set_node(self, row: int, item: str, count: int, max_count: int, regen_rate: int, stress: int = 0) -> None:
+        """Create or overwrite a node; its values are taken as current."""
+        slot = (row, self.item_index[item])
+        self.count[slot] = count
+        self.max_count[slot] = max_count
+        self.regen_rate[slot] = regen_rate
+        self.stress[slot] = stress
+        if item not in self.layouts[row]:
+            self.layouts[row] = self.layouts[row] + (item,)
+        self.settled_at[slot] = self.ledger.position
+        self.settled_decay[slot] = self.ledger.decay_count
+
+    def nodes(self, row: int) -> ResourceNodes:
+        return ResourceNodes(self, row)
+
+    def record(self, hrs: int, modifier: int) -> None:
+        if self.ledger.position >= LEDGER_COMPACT_SEGMENTS:
+            self.compact()
+        self.ledger.record(hrs, modifier)
+
+    def decay(self, amount: int = 1) -> None:
+        self.ledger.decay(amount)
+
+    def settle(self, rows: int | Sequence[int] | slice, bonus: int = 0) -> None:
+        """Bring the given rows' nodes up to date; `bonus` adds per-hour regen over the span."""
+        ledger = self.ledger
+        settled_at = self.settled_at[rows]
+        settled_decay = self.settled_decay[rows]
+        if not np.any((settled_at != ledger.position) | (settled_decay != ledger.decay_count)):
+            return
+
+        stress = self.stress[rows]
+        gained = ledger.regrowth(
+            self.regen_rate[rows].ravel(),
+            stress.ravel(),
+            settled_at.ravel(),
+            settled_decay.ravel(),
+            bonus,
+        ).reshape(stress.shape)
+        self.count[rows] = np.minimum(self.max_count[rows], self.count[rows] + gained)
+        self.stress[rows] = np.maximum(0, stress - (ledger.decay_count - settled_decay))
+        self.settled_at[rows] = ledger.position
+        self.settled_decay[rows] = ledger.decay_count
+
+    def settle_all(self) -> None:
+        self.settle(slice(0, self._row_count))
+
+    def mark_all(self) -> None:
+        """Declare every stored count and stress current, e.g. after bulk writes."""
+        self.settled_at[: self._row_count] = self.ledger.position
+        self.settled_decay[: self._row_count] = self.ledger.decay_count
+
+    def compact(self) -> None:
+        """Settle every node and drop the ledger history so it never grows without bound."""
+        self.settle_all()
+        self.ledger.reset()
+        self.mark_all()
+
+    def to_payload(self, rows: Iterable[int] | None = None) -> List[Dict[str, dict]]:
+        """Serialize the given rows' nodes (default: all rows) in the JSON save layout."""
+        self.settle_all()
+        rows = range(self._row_count) if rows is None else rows
+        columns = [self.count.tolist(), self.max_count.tolist(), self.regen_rate.tolist(), self.stress.tolist()]
+        index = self.item_index
+        payload: List[Dict[str, dict]] = []
+        for row in rows:
+            counts, maxes, regens, stresses = (column[row] for column in columns)
+            payload.append(
+                {
+                    item: {
+                        "item": item,
+                        "count": counts[index[item]],
+                        "max_count": maxes[index[item]],
+                        "regen_rate": regens[index[item]],
+                        "stress": stresses[index[item]],
+                    }
+                    for item in self.layouts[row]
+                }
+            )
+        return payload
+
+    def load_payload(self, payload: Iterable[Dict[str, dict]], rows: Iterable[int] | None = None) -> None:
+        """Restore nodes written by `to_payload` (or by older per-node JSON saves)."""
+        rows = range(self._row_count) if rows is None else rows
+        for row, env_nodes in zip(rows, payload):
+            for item, node in env_nodes.items():
+                self.set_node(row, item, node["count"], node["max_count"], node["regen_rate"], node.get("stress", 0))
+            self.dirty[row] = True
+
+    def to_records(self, rows: Sequence[int], env_ids: Sequence[int]) -> np.ndarray:
+        """Return the given rows' nodes as `RECORD_DTYPE` records, in layout order per row."""
+        self.settle_all()
+        index = self.item_index
+        slots = [(row, env_id, index[item]) for row, env_id in zip(rows, env_ids) for item in self.layouts[row]]
+        records = np.zeros(len(slots), dtype=RECORD_DTYPE)
+        if slots:
+            row_ids, env_column, item_ids = (np.array(column) for column in zip(*slots))
+            records["env"] = env_column
+            records["item"] = item_ids
+            for name in ("count", "max_count", "regen_rate", "stress"):
+                records[name] = getattr(self, name)[row_ids, item_ids]
+        return records
+
+    def load_records(self, records: np.ndarray, rows: np.ndarray) -> None:
+        """Restore `to_records` output; `rows[i]` is the row receiving `records[i]`."""
+        slots = (rows, records["item"])
+        for name in ("count", "max_count", "regen_rate", "stress"):
+            getattr(self, name)[slots] = records[name]
+        self.settled_at[slots] = self.ledger.position
+        self.settled_decay[slots] = self.ledger.decay_count
+        self.dirty[rows] = True
+        for row, item_id in zip(rows.tolist(), records["item"].tolist()):
+            item = self.items[item_id]
+            if item not in self.layouts[row]:
+                self.layouts[row] = self.layouts[row] + (item,)
+
+
+class ResourceNode:
+    """Lightweight view of one (environment, item) slot in a `ResourceStore`.
+
+    Reads return the stored values, so settle the environment first; writes
+    settle it themselves so the new value is taken as current.
+    """
+
+    __slots__ = ("_store", "_slot", "item")
+
+    def __init__(self, store: ResourceStore, row: int, item: str) -> None:
+        self._store = store
+        self._slot = (row, store.item_index[item])
+        self.item = item
+
+    @property
+    def count(self) -> int:
+        return int(self._store.count[self._slot])
+
+    @count.setter
+    def count(self, value: int) -> None:
+        self._touch()
+        self._store.count[self._slot] = value
+
+    @property
+    def max_count(self) -> int:
+        return int(self._store.max_count[self._slot])
+
+    @property
+    def regen_rate(self) -> int:
+        return int(self._store.regen_rate[self._slot])
+
+    @property
+    def stress(self) -> int:
+        return int(self._store.stress[self._slot])
+
+    @stress.setter
+    def stress(self, value: int) -> None:
+        self._touch()
+        self._store.stress[self._slot] = value
+
+    def _touch(self) -> None:
+        """Settle the row before a write so the new value counts as current, and flag it dirty."""
+        row = self._slot[0]
+        self._store.settle(row)
+        self._store.dirty[row] = True
+
+    def harvest(self, amount: int) -> int:
+        """Take up to `amount` resources from the node and return actual harvested quantity."""
+        taken = min(self.count, amount)
+        self.count -= taken
+        return taken
+
+    def _values(self) -> tuple:
+        return (self.item, self.count, self.max_count, self.regen_rate, self.stress)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResourceNode):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __repr__(self) -> str:
+        return "ResourceNode(item={!r}, count={}, max_count={}, regen_rate={}, stress={})".format(*self._values())
+
+
+class ResourceNodes(Mapping[str, ResourceNode]):
+    """Mapping view of one environment's nodes, keyed by item name."""
+
+    __slots__ = ("_store", "row")
+
+    def __init__(self, store: ResourceStore, row: int) -> None:
+        self._store = store
+        self.row = row
+
+    def __getitem__(self, item: str) -> ResourceNode:
+        if item not in self._store.layouts[self.row]:
+            raise KeyError(item)
+        return ResourceNode(self._store, self.row, item)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.layouts[self.row])
+
+    def __len__(self) -> int:
+        return len(self._store.layouts[self.row])
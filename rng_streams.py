@@ -0,0 +1,145 @@
+"""Seedable, splittable random streams so every game owns its own randomness.
+
+Each `RngStream` is counter based (SplitMix64): draw `n` of a stream is a pure
+function of `(key, n)`, so skipping ahead is O(1) and the whole state is two
+integers. `GameRng` bundles one independent stream per subsystem, which keeps a
+change in one subsystem (an extra ambience roll, say) from shifting the draws
+every other subsystem sees.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Dict, Tuple
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+DOUBLE_UNIT = 2.0 ** -53
+STREAMS = ("weather", "events", "hunt", "gather", "ambience", "survival", "travel")
+_Random = random.Random
+
+
+def derive_key(seed: int | str) -> int:
+    """Turn any int or string seed into a well-mixed 64-bit stream key, identically in every process."""
+    if isinstance(seed, int):
+        seed = str(seed)
+    return int.from_bytes(hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class RngStream:
+    """A SplitMix64 counter stream offering the `random.Random` methods the game uses.
+
+    It deliberately does not subclass `random.Random`, whose instances carry
+    ~2.5 KB of Mersenne Twister state; the helpers below are the standard
+    library's own pure-Python implementations, driven by `getrandbits`.
+    """
+
+    # `__dict__` stays unallocated unless a method is overridden on one stream (as tests do).
+    __slots__ = ("key", "position", "__dict__")
+
+    def __init__(self, seed: int | str | None = 0) -> None:
+        self.seed(seed)
+
+    def seed(self, a: int | str | None = 0) -> None:
+        self.key = derive_key(a if a is not None else random.SystemRandom().getrandbits(64))
+        self.position = 0
+
+    def _next64(self) -> int:
+        self.position += 1
+        z = (self.key + self.position * GOLDEN_GAMMA) & MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * DOUBLE_UNIT
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        if k <= 64:
+            return self._next64() >> (64 - k)
+        words, extra = divmod(k, 64)
+        value = 0
+        for _ in range(words):
+            value = (value << 64) | self._next64()
+        if extra:
+            value = (value << extra) | (self._next64() >> (64 - extra))
+        return value
+
+    _randbelow = _Random._randbelow_with_getrandbits
+    randrange = _Random.randrange
+    randint = _Random.randint
+    choice = _Random.choice
+    sample = _Random.sample
+    shuffle = _Random.shuffle
+    uniform = _Random.uniform
+
+    def getstate(self) -> Tuple[int, int]:
+        return self.key, self.position
+
+    def setstate(self, state: Tuple[int, int]) -> None:
+        self.key, self.position = state
+
+    def jump(self, draws: int) -> None:
+        """Skip `draws` 64-bit outputs in constant time."""
+        self.position += draws
+
+    def split(self, label: int | str) -> RngStream:
+        """Derive an independent child stream; the same label always yields the same child."""
+        return RngStream(f"{self.key}/{label}")
+
+
+class GameRng:
+    """One independent `RngStream` per game subsystem, all derived from a single seed.
+
+    `seed=None` draws a fresh seed from the OS, like an unseeded `random.Random`;
+    the chosen seed is kept on `seed` so the run can be recreated.
+    """
+
+    def __init__(self, seed: int | str | None = None) -> None:
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.weather = RngStream(f"{seed}:weather")
+        self.events = RngStream(f"{seed}:events")
+        self.hunt = RngStream(f"{seed}:hunt")
+        self.gather = RngStream(f"{seed}:gather")
+        self.ambience = RngStream(f"{seed}:ambience")
+        self.survival = RngStream(f"{seed}:survival")
+        self.travel = RngStream(f"{seed}:travel")
+
+    def streams(self) -> Dict[str, RngStream]:
+        return {name: getattr(self, name) for name in STREAMS}
+
+    def copy(self) -> GameRng:
+        """An independent `GameRng` at the same positions, without deriving the stream keys again."""
+        clone = GameRng.__new__(GameRng)
+        clone.seed = self.seed
+        for name, stream in self.streams().items():
+            twin = RngStream.__new__(RngStream)
+            twin.key, twin.position = stream.key, stream.position
+            setattr(clone, name, twin)
+        return clone
+
+    def split(self, label: int | str) -> GameRng:
+        """Derive an independent `GameRng`, e.g. one per worker or per Monte Carlo run."""
+        return GameRng(f"{self.seed}/{label}")
+
+    def getstate(self) -> Dict[str, int]:
+        """Draw positions per stream; with `seed` this is the complete state."""
+        return {name: stream.position for name, stream in self.streams().items()}
+
+    def setstate(self, positions: Dict[str, int]) -> None:
+        for name, stream in self.streams().items():
+            stream.position = positions.get(name, 0)
+
+    def to_payload(self) -> dict:
+        return {"seed": self.seed, "positions": self.getstate()}
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> GameRng:
+        rng = cls(payload["seed"])
+        rng.setstate(payload["positions"])
+        return rng
@@ -0,0 +1,131 @@
+"""Statistical profiler for long simulations, writing flamegraph-ready collapsed stacks.
+
+Instead of hooking every call like `cProfile`, the sampler looks at the main
+thread's Python stack every `interval` seconds and counts what it sees, so the
+game runs at full speed between samples. Each stack is rooted at the game
+command being executed (`command:gather`, or `command:-` outside any command),
+found by looking for `SurvivalGame.execute_command` on the stack.
+
+Two samplers are available: `thread` (wall-clock, portable) wakes a
+background thread, `signal` (CPU time, Unix main thread only) uses a
+`SIGPROF` interval timer. Output is one `frame;frame;... count` line per
+distinct stack, as read by `flamegraph.pl` and speedscope:
+
+    python survival_moo.py --profile-sample game.folded
+    python montecarlo.py --workers 0 --runs 200 --profile-sample runs.folded --profile-interval 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Iterator, List
+
+MODES = ("thread", "signal")
+
+
+def _frame_name(code: CodeType) -> str:
+    return f"{Path(code.co_filename).stem}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def collapse(frame: FrameType | None) -> str:
+    """One collapsed stack, outermost frame first, under the command it belongs to."""
+    names: List[str] = []
+    command = "-"
+    while frame is not None:
+        code = frame.f_code
+        names.append(_frame_name(code))
+        if code.co_name == "execute_command" and command == "-":  # `SurvivalGame.execute_command` names its command
+            command = frame.f_locals.get("command") or "-"
+        frame = frame.f_back
+    names.append(f"command:{command}")
+    return ";".join(reversed(names)).replace(" ", "_")
+
+
+class SamplingProfiler:
+    """Counts the main thread's stacks every `interval` seconds between `start` and `stop`."""
+
+    def __init__(self, interval: float = 0.005, mode: str = "thread") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown sampling mode {mode!r}; use one of {MODES}")
+        if mode == "signal" and not hasattr(signal, "setitimer"):
+            raise ValueError("Signal sampling needs a Unix interval timer; use the thread sampler")
+        self.interval = interval
+        self.mode = mode
+        self.samples: Counter[str] = Counter()
+        self._target = threading.main_thread().ident
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> SamplingProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self.mode == "signal":
+            signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self.mode == "signal":
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+        elif self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:
+        self.samples[collapse(frame)] += 1
+
+    def _run(self) -> None:
+        deadline = time.perf_counter()
+        while not self._stopping.is_set():
+            frame = sys._current_frames().get(self._target)
+            if frame is not None:
+                self.samples[collapse(frame)] += 1
+            del frame
+            deadline += self.interval
+            self._stopping.wait(max(0.0, deadline - time.perf_counter()))
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+
+    def write(self, path: str | Path) -> None:
+        Path(path).write_text(self.collapsed(), encoding="utf-8")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """The `--profile-*` options every runner shares."""
+    parser.add_argument("--profile-sample", metavar="PATH", help="sample stacks, writing collapsed stacks here on exit")
+    parser.add_argument("--profile-interval", type=float, default=5.0, metavar="MS", help="time between samples")
+    parser.add_argument("--profile-mode", choices=MODES, default="thread", help="wall-clock thread or CPU-time signal")
+
+
+@contextlib.contextmanager
+def profiling(args: argparse.Namespace) -> Iterator[SamplingProfiler | None]:
+    """Sample for the duration of the block if `--profile-sample` was given, then write the stacks."""
+    if not args.profile_sample:
+        yield None
+        return
+    profiler = SamplingProfiler(args.profile_interval / 1000, args.profile_mode)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.write(args.profile_sample)
@@ -0,0 +1,311 @@
+"""Compact, versioned binary saves made of an append-only chain of frames.
+
+A save file is a header followed by frames. The first frame is a full
+checkpoint; each later frame is a delta holding only the fields and nodes that
+changed since the frame before it. Loading replays the chain. Once the deltas
+outgrow the checkpoint, the next save rewrites the file as one full frame.
+
+Each frame carries its own interned string table (field keys, string values
+and item names), then fixed-width field records and fixed-width node records.
+Game state travels as a flat `{dotted.key: value}` mapping (see `flatten`).
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from resource_store import RECORD_DTYPE
+
+MAGIC = b"CCSV"
+VERSION = 1
+BINARY_SUFFIX = ".ccsave"
+FULL, DELTA = 0, 1
+# Deltas are appended until they add up to this many times the checkpoint frame.
+DELTA_BUDGET = 1.0
+
+_HEADER = struct.Struct("<4sH")
+_FRAME = struct.Struct("<BI")
+_COUNT = struct.Struct("<I")
+_LENGTH = struct.Struct("<H")
+_FIELD = struct.Struct("<IB8s")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_NONE, _BOOL, _INTEGER, _REAL, _STRING, _EMPTY, _DELETED = range(7)
+
+DELETED = object()
+"""Field value marking a key that no longer exists, as written in deltas."""
+
+
+def flatten(payload: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Turn nested dicts into `{"a.b.c": value}`; empty or `None` sub-dicts stay as one key."""
+    flat: Dict[str, Any] = {}
+    for key, value in payload.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, path + "."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def unflatten(fields: Dict[str, Any]) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {}
+    for path, value in fields.items():
+        *parents, leaf = path.split(".")
+        node = payload
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+    return payload
+
+
+def _assign(fields: Dict[str, Any], path: str, value: Any) -> None:
+    """Set one flat field, dropping whatever it replaces (its old children or a collapsed parent)."""
+    for key in [k for k in fields if k.startswith(path + ".")]:
+        del fields[key]
+    parts = path.split(".")
+    for depth in range(1, len(parts)):
+        fields.pop(".".join(parts[:depth]), None)
+    if value is DELETED:
+        fields.pop(path, None)
+    else:
+        fields[path] = value
+
+
+def diff_fields(base: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    changed = {key: value for key, value in current.items() if key not in base or base[key] != value}
+    for key in base:
+        # A key replaced by its children or by a collapsed parent is dropped when those are assigned.
+        if key not in current and not any(_related(key, k) for k in changed):
+            changed[key] = DELETED
+    return changed
+
+
+def _related(a: str, b: str) -> bool:
+    return a.startswith(b + ".") or b.startswith(a + ".")
+
+
+def _record_keys(records: np.ndarray) -> np.ndarray:
+    return (records["env"].astype(np.int64) << 32) | records["item"].astype(np.int64)
+
+
+def _locate(base: np.ndarray, records: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return, for each record, whether `base` has its node and that node's index in `base`."""
+    if not len(base):
+        return np.zeros(len(records), dtype=bool), np.zeros(len(records), dtype=np.intp)
+    base_keys = _record_keys(base)
+    order = np.argsort(base_keys, kind="stable")
+    sorted_keys = base_keys[order]
+    keys = _record_keys(records)
+    pos = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return sorted_keys[pos] == keys, order[pos]
+
+
+def diff_records(base: np.ndarray, current: np.ndarray) -> np.ndarray:
+    found, index = _locate(base, current)
+    unchanged = found & (base[index] == current)
+    return current[~unchanged]
+
+
+def merge_records(base: np.ndarray, delta: np.ndarray) -> np.ndarray:
+    """Apply a delta's nodes; new nodes go after the existing ones to keep layout order."""
+    found, index = _locate(base, delta)
+    merged = base.copy()
+    merged[index[found]] = delta[found]
+    return np.concatenate([merged, delta[~found]])
+
+
+class _Strings:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, text: str) -> int:
+        return self.ids.setdefault(text, len(self.ids))
+
+
+def _encode_value(value: Any, strings: _Strings) -> Tuple[int, bytes]:
+    if value is DELETED:
+        return _DELETED, bytes(8)
+    if value is None:
+        return _NONE, bytes(8)
+    if isinstance(value, bool):
+        return _BOOL, _INT.pack(value)
+    if isinstance(value, int):
+        return _INTEGER, _INT.pack(value)
+    if isinstance(value, float):
+        return _REAL, _FLOAT.pack(value)
+    if isinstance(value, str):
+        return _STRING, _INT.pack(strings.intern(value))
+    if value == {}:
+        return _EMPTY, bytes(8)
+    raise TypeError(f"Cannot store {type(value).__name__} in a binary save")
+
+
+def _decode_value(kind: int, raw: bytes, table: List[str]) -> Any:
+    if kind == _NONE:
+        return None
+    if kind == _BOOL:
+        return bool(_INT.unpack(raw)[0])
+    if kind == _INTEGER:
+        return _INT.unpack(raw)[0]
+    if kind == _REAL:
+        return _FLOAT.unpack(raw)[0]
+    if kind == _STRING:
+        return table[_INT.unpack(raw)[0]]
+    if kind == _EMPTY:
+        return {}
+    if kind == _DELETED:
+        return DELETED
+    raise ValueError(f"Unknown field type {kind} in binary save")
+
+
+def encode_frame(kind: int, fields: Dict[str, Any], records: np.ndarray, items: Sequence[str]) -> bytes:
+    """One frame: header, string table, field records, node records (item = string id)."""
+    strings = _Strings()
+    item_ids = np.array([strings.intern(item) for item in items], dtype=np.uint32)
+    field_bytes = []
+    for key, value in fields.items():
+        key_id = strings.intern(key)
+        field_bytes.append(_FIELD.pack(key_id, *_encode_value(value, strings)))
+
+    nodes = records.copy()
+    nodes["item"] = item_ids[records["item"]]
+    table = []
+    for text in strings.ids:
+        encoded = text.encode("utf-8")
+        table.append(_LENGTH.pack(len(encoded)) + encoded)
+
+    body = b"".join(
+        [
+            _COUNT.pack(len(table)),
+            *table,
+            _COUNT.pack(len(field_bytes)),
+            *field_bytes,
+            _COUNT.pack(len(nodes)),
+            nodes.tobytes(),
+        ]
+    )
+    return _FRAME.pack(kind, len(body)) + body
+
+
+def decode_frame(body: bytes, items: Sequence[str]) -> Tuple[Dict[str, Any], np.ndarray]:
+    """Decode one frame body into flat fields and records indexed by `items`."""
+    offset = 0
+
+    def take(size: int) -> memoryview:
+        nonlocal offset
+        chunk = memoryview(body)[offset : offset + size]
+        offset += size
+        return chunk
+
+    table: List[str] = []
+    for _ in range(_COUNT.unpack(take(_COUNT.size))[0]):
+        length = _LENGTH.unpack(take(_LENGTH.size))[0]
+        table.append(bytes(take(length)).decode("utf-8"))
+
+    fields: Dict[str, Any] = {}
+    for _ in range(_COUNT.unpack(take(_COUNT.size))[0]):
+        key_id, kind, raw = _FIELD.unpack(take(_FIELD.size))
+        fields[table[key_id]] = _decode_value(kind, raw, table)
+
+    count = _COUNT.unpack(take(_COUNT.size))[0]
+    records = np.frombuffer(take(count * RECORD_DTYPE.itemsize), dtype=RECORD_DTYPE).copy()
+    index = {item: i for i, item in enumerate(items)}
+    item_map = np.array([index.get(text, -1) for text in table], dtype=np.int64)
+    mapped = item_map[records["item"]]
+    if np.any(mapped < 0):
+        raise ValueError("Binary save references items this world does not have")
+    records["item"] = mapped
+    return fields, records
+
+
+@dataclass
+class Checkpoint:
+    """What a game last wrote to (or read from) a binary save, so the next save can be a delta."""
+
+    path: Path
+    fields: Dict[str, Any]
+    records: np.ndarray
+    checkpoint_bytes: int
+    file_bytes: int
+
+
+def is_binary_save(path: Path) -> bool:
+    with open(path, "rb") as handle:
+        return handle.read(len(MAGIC)) == MAGIC
+
+
+def write_save(
+    path: Path,
+    fields: Dict[str, Any],
+    records: np.ndarray,
+    items: Sequence[str],
+    checkpoint: Checkpoint | None = None,
+) -> Checkpoint:
+    """Append a delta against `checkpoint` when it still describes `path`; otherwise write a full frame."""
+    can_append = (
+        checkpoint is not None
+        and checkpoint.path == path
+        and path.exists()
+        and path.stat().st_size == checkpoint.file_bytes
+        and checkpoint.file_bytes - checkpoint.checkpoint_bytes <= DELTA_BUDGET * checkpoint.checkpoint_bytes
+    )
+    if can_append:
+        frame = encode_frame(
+            DELTA,
+            diff_fields(checkpoint.fields, fields),
+            diff_records(checkpoint.records, records),
+            items,
+        )
+        with open(path, "ab") as handle:
+            handle.write(frame)
+        return Checkpoint(path, fields, records, checkpoint.checkpoint_bytes, checkpoint.file_bytes + len(frame))
+
+    data = encode_save(fields, records, items)
+    path.write_bytes(data)
+    return Checkpoint(path, fields, records, len(data), len(data))
+
+
+def encode_save(fields: Dict[str, Any], records: np.ndarray, items: Sequence[str]) -> bytes:
+    """A complete single-frame save, for files or for storing as a blob."""
+    return _HEADER.pack(MAGIC, VERSION) + encode_frame(FULL, fields, records, items)
+
+
+def read_save(path: Path, items: Sequence[str]) -> Tuple[Dict[str, Any], np.ndarray, Checkpoint]:
+    """Replay every frame in `path`; a torn final frame (e.g. a crash mid-append) is ignored."""
+    fields, records, checkpoint_bytes, valid_bytes = decode_save(path.read_bytes(), items)
+    return fields, records, Checkpoint(path, dict(fields), records, checkpoint_bytes, valid_bytes)
+
+
+def decode_save(data: bytes, items: Sequence[str]) -> Tuple[Dict[str, Any], np.ndarray, int, int]:
+    """Return the merged fields and records plus the byte lengths of the checkpoint and of all whole frames."""
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a binary save")
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary save version {version}")
+
+    fields: Dict[str, Any] = {}
+    records = np.zeros(0, dtype=RECORD_DTYPE)
+    offset = _HEADER.size
+    checkpoint_bytes = 0
+    while offset + _FRAME.size <= len(data):
+        kind, length = _FRAME.unpack_from(data, offset)
+        end = offset + _FRAME.size + length
+        if end > len(data):
+            break
+        frame_fields, frame_records = decode_frame(data[offset + _FRAME.size : end], items)
+        if kind == FULL:
+            fields, records = frame_fields, frame_records
+            checkpoint_bytes = end
+        else:
+            for key, value in frame_fields.items():
+                _assign(fields, key, value)
+            records = merge_records(records, frame_records)
+        offset = end
+    return fields, records, checkpoint_bytes, offset
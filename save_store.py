@@ -0,0 +1,114 @@
+"""Save slots in one SQLite database instead of a directory of loose files.
+
+Each row is one `(player_id, slot)` holding a binary save blob plus the
+metadata worth querying: in-game hours survived, season, health and when it
+was saved. The database runs in WAL mode so readers never block the writer,
+and saves are buffered and committed together in one transaction per `flush`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from survival_moo import SurvivalGame
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    player_id TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    hours INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    health INTEGER NOT NULL,
+    saved_at REAL NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (player_id, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS saves_recent ON saves (player_id, saved_at DESC);
+CREATE INDEX IF NOT EXISTS saves_hours ON saves (hours);
+CREATE INDEX IF NOT EXISTS saves_season ON saves (season);
+CREATE INDEX IF NOT EXISTS saves_health ON saves (health);
+"""
+
+_UPSERT = "INSERT OR REPLACE INTO saves (player_id, slot, hours, season, health, saved_at, data) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+
+@dataclass(frozen=True)
+class SlotInfo:
+    player_id: str
+    slot: str
+    hours: int
+    season: str
+    health: int
+    saved_at: float
+
+
+class SaveStore:
+    """Indexed save slots; `save` buffers, `flush` commits everything pending in one transaction.
+
+    Loads and listings are single index lookups, so their cost does not grow
+    with the number of saves beyond the B-tree depth.
+    """
+
+    def __init__(self, path: str | Path = "saves.db", batch_size: int = 256) -> None:
+        """Pending saves are committed automatically once `batch_size` of them have queued up."""
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.db = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self._pending: List[Tuple] = []
+
+    @property
+    def pending(self) -> int:
+        """Saves queued but not yet committed."""
+        return len(self._pending)
+
+    def save(self, player_id: str, slot: str, game: SurvivalGame) -> None:
+        p = game.player
+        self._pending.append(
+            (player_id, slot, game.elapsed_hours, game.current_season.name, p.health, time.time(), game.to_save_bytes())
+        )
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        with self.db:  # one transaction for the whole batch
+            self.db.execute("BEGIN")
+            self.db.executemany(_UPSERT, self._pending)
+        self._pending.clear()
+
+    def load(self, player_id: str, slot: str, game: SurvivalGame) -> bool:
+        """Restore a slot into `game`; False if the player has no such slot."""
+        self.flush()
+        row = self.db.execute("SELECT data FROM saves WHERE player_id = ? AND slot = ?", (player_id, slot)).fetchone()
+        if row is None:
+            return False
+        game.load_save_bytes(row[0])
+        return True
+
+    def recent(self, player_id: str, limit: int = 10) -> List[SlotInfo]:
+        """The player's `limit` most recently saved slots, newest first."""
+        self.flush()
+        rows = self.db.execute(
+            "SELECT player_id, slot, hours, season, health, saved_at FROM saves"
+            " WHERE player_id = ? ORDER BY saved_at DESC LIMIT ?",
+            (player_id, limit),
+        )
+        return [SlotInfo(*row) for row in rows]
+
+    def delete(self, player_id: str, slot: str) -> None:
+        self.flush()
+        with self.db:
+            self.db.execute("DELETE FROM saves WHERE player_id = ? AND slot = ?", (player_id, slot))
+
+    def close(self) -> None:
+        self.flush()
+        self.db.close()
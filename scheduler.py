@@ -0,0 +1,83 @@
+"""Wake-ups at absolute game hours on a priority queue.
+
+Subsystems schedule a named wake-up for a future hour instead of counting
+down a timer on every step. Advancing time pops only what has come due, so
+skipping 1000 hours costs one heap operation per wake-up that fires, not one
+per hour. The queue holds plain tuples, so it copies and pickles like data.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Iterator, List, Tuple
+
+
+class Scheduler:
+    """Named one-shot wake-ups; scheduling a name again replaces its pending wake-up."""
+
+    __slots__ = ("_queue", "_pending", "_seq")
+
+    def __init__(self) -> None:
+        self._queue: List[Tuple[int, int, int, str]] = []
+        self._pending: Dict[str, Tuple[int, int]] = {}  # name -> (hour, seq) of its live entry
+        self._seq = 0
+
+    def schedule(self, name: str, hour: int, priority: int = 0) -> None:
+        """Wake `name` at `hour`; among wake-ups due at the same hour, lower `priority` fires first."""
+        self._seq += 1
+        self._pending[name] = (hour, self._seq)
+        heapq.heappush(self._queue, (hour, priority, self._seq, name))
+        if len(self._queue) > 4 * len(self._pending) + 16:
+            self._compact()
+
+    def copy(self) -> Scheduler:
+        clone = Scheduler.__new__(Scheduler)
+        clone._queue = list(self._queue)
+        clone._pending = dict(self._pending)
+        clone._seq = self._seq
+        return clone
+
+    def cancel(self, name: str) -> None:
+        self._pending.pop(name, None)
+
+    def due(self, name: str) -> int | None:
+        """The hour `name` will wake at, or None if it is not scheduled."""
+        pending = self._pending.get(name)
+        return pending[0] if pending else None
+
+    def next_due(self) -> int | None:
+        """The hour of the earliest pending wake-up, or None if nothing is scheduled."""
+        queue = self._queue
+        while queue and self._pending.get(queue[0][3]) != (queue[0][0], queue[0][2]):
+            heapq.heappop(queue)
+        return queue[0][0] if queue else None
+
+    def take(self, name: str, until: int) -> int | None:
+        """Remove `name`'s wake-up and return its hour if it is due at or before `until`, else None."""
+        pending = self._pending.get(name)
+        if pending is None or pending[0] > until:
+            return None
+        del self._pending[name]
+        self.next_due()  # drops the stale entries that reach the front of the queue
+        return pending[0]
+
+    def pop_due(self, until: int) -> Iterator[Tuple[str, int]]:
+        """Yield `(name, hour)` for every wake-up due at or before `until`, earliest first.
+
+        Wake-ups scheduled while iterating are yielded too if they are due.
+        """
+        queue = self._queue
+        while queue and queue[0][0] <= until:
+            hour, _, seq, name = heapq.heappop(queue)
+            if self._pending.get(name) != (hour, seq):
+                continue  # replaced or cancelled
+            del self._pending[name]
+            yield name, hour
+
+    def _compact(self) -> None:
+        """Drop replaced and cancelled entries so the heap stays proportional to live wake-ups.
+
+        The list is rebuilt in place: a `pop_due` in progress holds on to it.
+        """
+        self._queue[:] = [entry for entry in self._queue if self._pending.get(entry[3]) == (entry[0], entry[2])]
+        heapq.heapify(self._queue)
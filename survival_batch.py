@@ -0,0 +1,321 @@
+"""Headless batched simulation: step many Campfire Cantos games at once with NumPy."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from survival_moo import Event, SurvivalGame
+
+EVENT_CHECK_HOURS = 24
+EVENT_CHANCE = 0.10
+
+
+@dataclass
+class StepDraws:
+    """Uniform [0, 1) draws consumed by one batched `advance` call, one per game.
+
+    Each field mirrors a random decision in `SurvivalGame.advance_time`: the
+    weather step (see `WeatherModel.step`), the daily event roll and pick, and
+    the fire failure roll. Picks map to `seq[int(u * len(seq))]`.
+    """
+
+    weather_roll: np.ndarray
+    event_roll: np.ndarray
+    event_pick: np.ndarray
+    fire_roll: np.ndarray
+
+    @classmethod
+    def sample(cls, rng: np.random.Generator, n: int) -> StepDraws:
+        u = rng.random((4, n))
+        return cls(u[0], u[1], u[2], u[3])
+
+    @classmethod
+    def constant(cls, values: Sequence[float]) -> StepDraws:
+        """Use the same draw for every decision of a game (handy for replaying scripted runs)."""
+        u = np.asarray(values, dtype=np.float64)
+        return cls(u, u, u, u)
+
+
+class BatchSimulation:
+    """Struct-of-arrays state for N independent games sharing one world layout.
+
+    Player fields, season/event clocks, weather and resource nodes are held in
+    arrays indexed by game (and by environment and item for nodes). `advance`
+    applies the same rules as `SurvivalGame.advance_time` and
+    `SurvivalGame.resolve_survival` to every game at once, without output.
+    Games that have died stay exactly as they were at death, as a scalar game
+    stops advancing once it is no longer running.
+    """
+
+    # Everything `advance` changes; a dead game's entries are put back afterwards.
+    STEPPED = (
+        "health",
+        "hunger",
+        "thirst",
+        "body_temp",
+        "hours",
+        "fire_lit",
+        "camp_comfort",
+        "weather_index",
+        "season_index",
+        "season_timer",
+        "event_index",
+        "event_timer",
+        "event_check_timer",
+        "node_count",
+        "node_stress",
+    )
+
+    def __init__(self, n: int, template: SurvivalGame | None = None) -> None:
+        template = template or SurvivalGame()
+        self.n = n
+        self._load_tables(template)
+
+        env_count, item_count = len(self.env_names), len(self.items)
+        self.health = np.full(n, 100, dtype=np.int64)
+        self.hunger = np.full(n, 25, dtype=np.int64)
+        self.thirst = np.full(n, 25, dtype=np.int64)
+        self.body_temp = np.full(n, 37, dtype=np.int64)
+        self.location = np.zeros(n, dtype=np.int64)
+        self.hours = np.full(n, 8, dtype=np.int64)
+        self.shelter_level = np.zeros(n, dtype=np.int64)
+        self.fire_lit = np.zeros(n, dtype=bool)
+        self.camp_comfort = np.zeros(n, dtype=np.int64)
+        self.running = np.ones(n, dtype=bool)
+
+        self.weather_index = np.zeros(n, dtype=np.int64)
+        self.season_index = np.zeros(n, dtype=np.int64)
+        self.season_timer = np.zeros(n, dtype=np.int64)
+        self.event_index = np.full(n, -1, dtype=np.int64)
+        self.event_timer = np.zeros(n, dtype=np.int64)
+        self.event_check_timer = np.zeros(n, dtype=np.int64)
+
+        shape = (n, env_count, item_count)
+        self.node_count = np.broadcast_to(self._base_count, shape).copy()
+        self.node_max = np.broadcast_to(self._base_max, shape).copy()
+        self.node_regen = np.broadcast_to(self._base_regen, shape).copy()
+        self.node_stress = np.broadcast_to(self._base_stress, shape).copy()
+
+    def _load_tables(self, game: SurvivalGame) -> None:
+        """Flatten the template game's static world, weather, season and event data into arrays."""
+        self.season_length_hours = game.season_length_hours
+        self.env_names = [env.name for env in game.world]
+        self.env_temp_bias = np.array([env.temp_bias for env in game.world], dtype=np.int64)
+
+        store = game.resources
+        store.settle_all()
+        self.items = list(store.items)
+        self._base_count = store.count.astype(np.int64)
+        self._base_max = store.max_count.astype(np.int64)
+        self._base_regen = store.regen_rate.astype(np.int64)
+        self._base_stress = store.stress.astype(np.int64)
+
+        self.weather_names = [w.name for w in game.weather_types]
+        self.weather_temp = np.array([w.temperature_shift for w in game.weather_types], dtype=np.int64)
+        self.weather_thirst = np.array([w.thirst_rate for w in game.weather_types], dtype=np.int64)
+        self.weather_fire = np.array([w.fire_modifier for w in game.weather_types], dtype=np.float64)
+        self.weather_model = game.weather_model
+        self.weather_tables = self.weather_model.stack(self.env_temp_bias)  # indexed by location
+
+        self.season_names = [s.name for s in game.seasons]
+        self.season_temp = np.array([s.temp_shift for s in game.seasons], dtype=np.int64)
+        self.season_regen = np.array([s.regen_modifier for s in game.seasons], dtype=np.int64)
+        self.winter_index = self.season_names.index("Winter")
+
+        # Row -1 (via the trailing zero entry) stands for "no active event".
+        self.events: List[Event] = game._build_events() + game._build_winter_events()
+        self.base_event_count = len(game._build_events())
+        self.event_duration = np.array([e.duration_hours for e in self.events], dtype=np.int64)
+        self.event_temp = np.array([int(e.temp_shift) for e in self.events] + [0], dtype=np.int64)
+        self.event_thirst = np.array([int(e.thirst_rate) for e in self.events] + [0], dtype=np.int64)
+        self.event_fire = np.array([float(e.fire_modifier) for e in self.events] + [0.0], dtype=np.float64)
+        self.event_regen = np.array([int(e.regen_modifier) for e in self.events] + [0], dtype=np.int64)
+
+    @classmethod
+    def from_games(cls, games: Sequence[SurvivalGame]) -> BatchSimulation:
+        """Capture the current state of existing scalar games into one batch."""
+        batch = cls(len(games), template=games[0])
+        for g, game in enumerate(games):
+            store = game.resources
+            store.settle_all()
+            p = game.player
+            batch.health[g] = p.health
+            batch.hunger[g] = p.hunger
+            batch.thirst[g] = p.thirst
+            batch.body_temp[g] = p.body_temp
+            batch.location[g] = p.location
+            batch.hours[g] = p.hours
+            batch.shelter_level[g] = p.shelter.level
+            batch.fire_lit[g] = p.fire_lit
+            batch.camp_comfort[g] = p.camp_comfort
+            batch.running[g] = game.running
+            batch.weather_index[g] = batch.weather_names.index(game.weather.name)
+            batch.season_index[g] = game.season_index
+            batch.season_timer[g] = game.season_timer
+            batch.event_index[g] = batch._event_row(game.active_event)
+            batch.event_timer[g] = game.event_timer
+            batch.event_check_timer[g] = game.event_check_timer
+            batch.node_count[g] = store.count
+            batch.node_max[g] = store.max_count
+            batch.node_regen[g] = store.regen_rate
+            batch.node_stress[g] = store.stress
+        return batch
+
+    @classmethod
+    def new(cls, n: int, rng: np.random.Generator, template: SurvivalGame | None = None) -> BatchSimulation:
+        """Start N fresh games with random start locations and weather, like `SurvivalGame()`."""
+        batch = cls(n, template=template)
+        batch.location = rng.integers(0, len(batch.env_names), size=n)
+        batch.weather_index = rng.integers(0, len(batch.weather_names), size=n)
+        return batch
+
+    def _event_row(self, event: Event | None) -> int:
+        if event is None:
+            return -1
+        return self.events.index(event)
+
+    def sync_to(self, game: SurvivalGame, g: int) -> None:
+        """Write game `g` of the batch back into a scalar `SurvivalGame`."""
+        p = game.player
+        p.health = int(self.health[g])
+        p.hunger = int(self.hunger[g])
+        p.thirst = int(self.thirst[g])
+        p.body_temp = int(self.body_temp[g])
+        p.location = int(self.location[g])
+        p.hours = int(self.hours[g])
+        p.shelter.level = int(self.shelter_level[g])
+        p.fire_lit = bool(self.fire_lit[g])
+        p.camp_comfort = int(self.camp_comfort[g])
+        game.running = bool(self.running[g])
+        game.weather = game.weather_types[int(self.weather_index[g])]
+        game.season_index = int(self.season_index[g])
+        game.season_timer = int(self.season_timer[g])
+        game.current_season = game.seasons[game.season_index]
+        row = int(self.event_index[g])
+        game.active_event = self.events[row] if row >= 0 else None
+        game.event_timer = int(self.event_timer[g])
+        game.event_check_timer = int(self.event_check_timer[g])
+        store = game.resources
+        store.count[:] = self.node_count[g]
+        store.stress[:] = self.node_stress[g]
+        store.mark_all()
+
+    def advance(self, hrs: int, draws: StepDraws) -> None:
+        """Advance every game by `hrs` hours using the scalar `advance_time` rules."""
+        if not 1 <= hrs <= EVENT_CHECK_HOURS:
+            raise ValueError(f"Batched steps must be 1-{EVENT_CHECK_HOURS} hours, got {hrs}")
+        dead = ~self.running
+        if dead.all():
+            return
+        # Every step below builds new arrays, so these still hold the state before it.
+        before = [(name, getattr(self, name)) for name in self.STEPPED] if dead.any() else []
+
+        self.hours = (self.hours + hrs) % 24
+        self._advance_season_clock(hrs)
+        self._update_event_clock(hrs, draws)
+        self._update_camp_comfort(hrs)
+
+        self.weather_index = self.weather_model.step_many(
+            self.weather_tables, self.location, self.season_index, self.weather_index, draws.weather_roll
+        )
+
+        event_row = self.event_index  # -1 picks the trailing "no event" entry
+        total_thirst_rate = self.weather_thirst[self.weather_index] + self.event_thirst[event_row]
+        self.hunger = np.minimum(100, self.hunger + (2 + np.maximum(0, total_thirst_rate // 2)) * hrs)
+        self.thirst = np.minimum(100, self.thirst + (3 + total_thirst_rate) * hrs)
+
+        ambient_temp = (
+            37
+            + self.env_temp_bias[self.location]
+            + self.weather_temp[self.weather_index]
+            + self.season_temp[self.season_index]
+            + self.event_temp[event_row]
+        )
+        exposure = np.where(ambient_temp < 34, -1, np.where(ambient_temp > 40, 1, 0))
+        self.body_temp = self.body_temp + np.where(self.fire_lit, 1, exposure)
+        sheltered = np.where(ambient_temp < 35, 1, np.where(ambient_temp > 39, -1, 0))
+        self.body_temp = self.body_temp + np.where(self.shelter_level > 0, sheltered, 0)
+
+        self._update_fire_from_weather(draws)
+        self._regenerate_world_resources(hrs)
+        midnight = self.hours == 0
+        self.node_stress = np.maximum(0, self.node_stress - midnight[:, None, None])
+        self.resolve_survival()
+        for name, frozen in before:
+            getattr(self, name)[dead] = frozen[dead]
+
+    def sample_weather(self, steps: int, rng: np.random.Generator, hrs: int = 1) -> np.ndarray:
+        """Draw every game's weather after each of the next `steps` calls of `advance(hrs)`, in one call.
+
+        Returns `(n, steps)` weather indexes, assuming games stay where they
+        are; seasons turn on their fixed schedule.
+        """
+        elapsed = hrs * np.arange(1, steps + 1)
+        turns = (self.season_timer[:, None] + elapsed) // self.season_length_hours
+        seasons = (self.season_index[:, None] + turns) % len(self.season_names)
+        temp_bias = self.env_temp_bias[self.location]
+        return self.weather_model.sample_paths(self.weather_index, seasons, temp_bias, rng.random((self.n, steps)))
+
+    def _advance_season_clock(self, hrs: int) -> None:
+        self.season_timer = self.season_timer + hrs
+        shifts = self.season_timer // self.season_length_hours
+        self.season_timer = self.season_timer - shifts * self.season_length_hours
+        self.season_index = (self.season_index + shifts) % len(self.season_names)
+        self.node_stress = np.maximum(0, self.node_stress - shifts[:, None, None])
+
+    def _update_event_clock(self, hrs: int, draws: StepDraws) -> None:
+        active = self.event_index >= 0
+        self.event_timer = np.where(active, self.event_timer - hrs, self.event_timer)
+        ended = active & (self.event_timer <= 0)
+        self.event_index = np.where(ended, -1, self.event_index)
+        self.event_timer = np.where(ended, 0, self.event_timer)
+
+        self.event_check_timer = self.event_check_timer + hrs
+        due = self.event_check_timer >= EVENT_CHECK_HOURS
+        self.event_check_timer = np.where(due, self.event_check_timer - EVENT_CHECK_HOURS, self.event_check_timer)
+
+        starts = due & (self.event_index < 0) & (draws.event_roll < EVENT_CHANCE)
+        option_count = np.where(self.season_index == self.winter_index, len(self.events), self.base_event_count)
+        picked = (draws.event_pick * option_count).astype(np.int64)
+        self.event_index = np.where(starts, picked, self.event_index)
+        self.event_timer = np.where(starts, self.event_duration[picked], self.event_timer)
+
+    def _update_camp_comfort(self, hrs: int) -> None:
+        decay = np.maximum(0, hrs - (self.shelter_level > 0))
+        self.camp_comfort = np.where(
+            self.fire_lit,
+            np.minimum(10, self.camp_comfort + hrs),
+            np.maximum(0, self.camp_comfort - decay),
+        )
+
+    def _update_fire_from_weather(self, draws: StepDraws) -> None:
+        fire_mod = self.weather_fire[self.weather_index] + self.event_fire[self.event_index]
+        failure_chance = np.maximum(0.0, 0.12 - fire_mod)
+        failure_chance = np.where(self.camp_comfort >= 6, np.maximum(0.0, failure_chance - 0.04), failure_chance)
+        self.fire_lit = self.fire_lit & ~(draws.fire_roll < failure_chance)
+
+    def _regenerate_world_resources(self, hrs: int) -> None:
+        """Closed-form equivalent of `hrs` hourly regen passes: the per-hour amount is fixed within a step."""
+        world_mod = self.season_regen[self.season_index] + self.event_regen[self.event_index]
+        regen = self.node_regen + world_mod[:, None, None] - self.node_stress // 3
+
+        games = np.arange(self.n)
+        comfort_bonus = (self.camp_comfort >= 7).astype(np.int64)
+        regen[games, self.location, :] += comfort_bonus[:, None]
+
+        regen = np.maximum(0, regen)
+        self.node_count = np.minimum(self.node_max, self.node_count + regen * hrs)
+
+    def resolve_survival(self) -> None:
+        damage = (
+            np.where(self.hunger >= 90, 2, 0)
+            + np.where(self.thirst >= 90, 3, 0)
+            + np.where(self.body_temp <= 34, 5, 0)
+            + np.where(self.body_temp >= 40, 5, 0)
+        )
+        self.health = self.health - damage
+        self.body_temp = np.clip(self.body_temp, 30, 42)
+        self.running = self.running & (self.health > 0)
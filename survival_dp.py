@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""Value iteration over a discretized survival state, exported as an O(1) policy lookup table.
+
+The model is the survival loop of `advance_time` and `resolve_survival` in one
+environment under fixed `Conditions`, averaged over its seasons and weather.
+Each command applies its effect, then one `advance_time` step and its survival
+check, using the game's own chances for hunts, gathers, bad water and the fire
+going out. Camp comfort, events, travel and building shelter are left out.
+Shelter is still part of the state, so the policy covers every shelter level.
+
+A state is split into the climate (how the weather moves body temperature),
+the needs and the inventory counts. Needs are health, hunger, thirst and body
+temperature on coarse grids, plus fire and shelter. Every command's chances act
+on the three parts independently, so its transition is a small sparse matrix
+per part instead of one over the product space. Value iteration applies them
+in turn to the `(climate, needs, inventory)` value array, so memory is that
+array plus a few entries per grid point.
+
+Needs that land between grid points are split over the enclosing simplex
+(Freudenthal interpolation), which keeps each step's expected change exact
+with d + 1 outcomes instead of 2 ** d. Death is not a state; its probability
+simply drops out of the sums. Example:
+
+    python survival_dp.py --seed 0 --output policy.npz --evaluate 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+import montecarlo
+import sampling_profiler
+from montecarlo import Observation, observe
+from survival_moo import RECIPES, REST_HOURS, RISKY_WATER, SurvivalGame
+
+ITEMS = ("cooked_meat", "raw_meat", "berries", "stick", "stone")  # the inventory the model tracks
+CAMPFIRE = RECIPES["campfire"]
+# How the ambient temperature moves body temperature per step, in the open and extra under a shelter (`_needs_rates`).
+CLIMATES = ((-1, 1), (0, 1), (0, 0), (0, -1), (1, -1))  # cold, cool, mild, warm, hot
+
+Ell = Tuple[np.ndarray, np.ndarray]  # (destination, probability) per row, padded to a fixed width with zero odds
+
+
+@dataclass(frozen=True)
+class Grid:
+    """Where the solver samples the state space; states, memory and time per iteration all grow with the product."""
+
+    health: Tuple[int, ...] = (5, 40, 70, 100)  # living players only
+    hunger: Tuple[int, ...] = (0, 50, 90, 100)
+    thirst: Tuple[int, ...] = (0, 50, 90, 100)
+    body_temp: Tuple[int, ...] = (33, 34, 37, 40, 41)
+    cooked_meat: int = 2  # inventory counts above these caps are treated as the cap
+    raw_meat: int = 2
+    berries: int = 2
+    stick: int = 3
+    stone: int = 2
+
+    def __post_init__(self) -> None:
+        if min(len(self.health), len(self.hunger), len(self.thirst), len(self.body_temp)) < 2:
+            raise ValueError("Each need's grid needs at least two points")
+        if self.health[0] <= 0:
+            raise ValueError("The health grid covers living players only")
+        if self.stick < CAMPFIRE["stick"] or self.stone < CAMPFIRE["stone"]:
+            raise ValueError("Stick and stone caps must allow crafting a campfire")
+
+    @property
+    def needs(self) -> Tuple[Tuple[int, ...], ...]:
+        return self.health, self.hunger, self.thirst, self.body_temp
+
+    @property
+    def needs_shape(self) -> Tuple[int, ...]:
+        return (*(len(points) for points in self.needs), 2, 3)  # then fire lit, shelter level
+
+    @property
+    def inventory_shape(self) -> Tuple[int, ...]:
+        return tuple(getattr(self, item) + 1 for item in ITEMS)
+
+
+def climate(ambient_temp: int) -> int:
+    """Index into `CLIMATES` for an ambient temperature."""
+    if ambient_temp < 34:
+        return 0
+    if ambient_temp < 35:
+        return 1
+    if ambient_temp < 40:
+        return 2
+    return 3 if ambient_temp == 40 else 4
+
+
+@dataclass(frozen=True)
+class Conditions:
+    """Rates and chances held fixed while solving; `from_game` reads them off a game's environment."""
+
+    hunger_rate: float = 3.0  # per hour; fractional rates are met exactly on average by the interpolation
+    thirst_rate: float = 4.0
+    climate_odds: Tuple[float, ...] = (0.0, 0.0, 1.0, 0.0, 0.0)  # long-run share of each of `CLIMATES`
+    climate_stay: float = 0.9  # chance a step keeps the climate; otherwise it is redrawn from `climate_odds`
+    fire_failure: float = 0.12
+    hunt_success: float = 0.45
+    bad_water: float = 0.0  # chance a drink costs 5 health
+    gather_odds: Tuple[Tuple[str, float], ...] = (("stick", 0.25), ("stone", 0.25), ("berries", 0.25), ("fiber", 0.25))
+
+    @classmethod
+    def from_game(cls, game: SurvivalGame) -> Conditions:
+        """The current environment, averaged over its seasons and their long-run weather; events are left out."""
+        view = game.fork()
+        view.active_event = None
+        env = view.current_env()
+        totals = np.zeros(4)
+        climate_odds = [0.0] * len(CLIMATES)
+        for index, season in enumerate(view.seasons):
+            odds = _stationary(view.weather_model.transitions(index, env.temp_bias))
+            for chance, weather in zip(odds / len(view.seasons), view.weather_types):
+                view.weather, view.current_season = weather, season
+                hunger_rate, thirst_rate, _ = view._needs_rates(env)
+                chances = (view._fire_failure_chance(0), view._hunt_success_chance(False))
+                totals += chance * np.array([hunger_rate, thirst_rate, *chances])
+                climate_odds[climate(view._ambient_temp(env))] += chance
+        risky = sum(source.quality in RISKY_WATER for source in env.water_sources) / len(env.water_sources)
+        items = list(env.resource_nodes)
+        return cls(
+            hunger_rate=float(totals[0]),
+            thirst_rate=float(totals[1]),
+            climate_odds=tuple(float(chance) for chance in climate_odds),
+            climate_stay=1.0 - view.weather_model.change_chance,
+            fire_failure=float(totals[2]),
+            hunt_success=float(totals[3]),
+            bad_water=0.25 * risky,
+            gather_odds=tuple((item, 1 / len(items)) for item in items),
+        )
+
+
+def _stationary(transitions: np.ndarray) -> np.ndarray:
+    """Long-run odds of a Markov chain's states."""
+    odds = np.full(len(transitions), 1 / len(transitions))
+    for _ in range(1_000):
+        odds = odds @ transitions
+    return odds
+
+
+@dataclass(frozen=True)
+class Mode:
+    """One way a command can play out, chosen by what the state allows."""
+
+    hours: int
+    needs: str  # key of the needs transition
+    inventory: Ell | None = None  # None: the inventory is unchanged
+    needs_mask: np.ndarray | None = None  # needs states it applies in (None: all)
+    inventory_mask: np.ndarray | None = None
+
+
+def simplex(coords: Sequence[np.ndarray], grids: Sequence[Sequence[int]]) -> Tuple[List[np.ndarray], np.ndarray]:
+    """The d + 1 grid points around each point (Freudenthal triangulation) and weights that average back to it.
+
+    Returns one `(n, d + 1)` index array per dimension and the `(n, d + 1)` weights.
+    Points outside a grid are clamped to its ends.
+    """
+    lows, fracs = [], []
+    for x, points in zip(coords, grids):
+        points = np.asarray(points, dtype=np.float64)
+        x = np.clip(x, points[0], points[-1])
+        lo = np.clip(np.searchsorted(points, x, side="right") - 1, 0, len(points) - 2)
+        lows.append(lo)
+        fracs.append((x - points[lo]) / (points[lo + 1] - points[lo]))
+    frac = np.stack(fracs, axis=1)
+    n, d = frac.shape
+    order = np.argsort(-frac, axis=1, kind="stable")
+    ranked = np.take_along_axis(frac, order, axis=1)
+    weights = np.empty((n, d + 1))
+    weights[:, 0] = 1 - ranked[:, 0]
+    weights[:, 1:d] = ranked[:, :-1] - ranked[:, 1:]
+    weights[:, d] = ranked[:, -1]
+    steps = np.zeros((n, d + 1, d), dtype=np.intp)  # vertex k steps up in the k largest fractions
+    for k in range(1, d + 1):
+        steps[:, k] = steps[:, k - 1]
+        steps[np.arange(n), k, order[:, k - 1]] += 1
+    return [lo[:, None] + steps[:, :, j] for j, lo in enumerate(lows)], weights
+
+
+def _ell(columns: List[Tuple[np.ndarray, np.ndarray]], rows: int) -> Ell:
+    """Pack `(destination, odds)` columns into rows, merging repeated destinations and dropping zero odds."""
+    dst = np.stack([np.broadcast_to(d, rows) for d, _ in columns], axis=1)
+    odds = np.stack([np.broadcast_to(p, rows) for _, p in columns], axis=1).astype(np.float64)
+    order = np.argsort(dst, axis=1, kind="stable")
+    dst = np.take_along_axis(dst, order, axis=1)
+    odds = np.take_along_axis(odds, order, axis=1)
+    starts = np.ones(dst.shape, dtype=bool)
+    starts[:, 1:] = dst[:, 1:] != dst[:, :-1]
+    slot = np.cumsum(starts, axis=1) - 1
+    row = np.broadcast_to(np.arange(rows)[:, None], dst.shape)
+    merged_dst = np.zeros_like(dst)
+    merged_dst[row, slot] = dst
+    merged = np.zeros_like(odds)
+    np.add.at(merged, (row, slot), odds)
+    order = np.argsort(merged <= 0, axis=1, kind="stable")  # live entries first
+    width = max(1, int((merged > 0).sum(axis=1).max()))
+    return (
+        np.take_along_axis(merged_dst, order, axis=1)[:, :width].astype(np.int32),
+        np.take_along_axis(merged, order, axis=1)[:, :width].astype(np.float32),
+    )
+
+
+@dataclass(frozen=True)
+class Solution:
+    policy: PolicyTable
+    values: np.ndarray  # expected discounted hours alive, shaped `SurvivalMdp.shape`
+    iterations: int
+    residual: float  # largest value change in the last iteration
+    seconds: float
+
+
+class SurvivalMdp:
+    """The command set as a factored Markov decision process over `grid` under fixed `conditions`."""
+
+    def __init__(self, conditions: Conditions = Conditions(), grid: Grid = Grid(), discount: float = 0.98) -> None:
+        """`discount` applies per game hour, so longer commands are discounted more."""
+        self.conditions = conditions
+        self.grid = grid
+        self.discount = discount
+        # Discounted hours alive while a command runs: 1 + d + ... + d ** (hours - 1).
+        self._reward = {hours: np.float32((1 - discount**hours) / (1 - discount)) for hours in (1, 2, REST_HOURS)}
+        # Climates that never occur are left out.
+        self.climates = tuple(i for i, chance in enumerate(conditions.climate_odds) if chance > 0)
+        odds = np.array([conditions.climate_odds[i] for i in self.climates], dtype=np.float32)
+        self._climate_odds = odds / odds.sum()
+        n_needs, n_inventory = math.prod(grid.needs_shape), math.prod(grid.inventory_shape)
+        self.shape = (len(self.climates), n_needs, n_inventory)
+        needs = ("health", "hunger", "thirst", "body_temp", "fire", "shelter")
+        self._needs = dict(zip(needs, np.unravel_index(np.arange(n_needs), grid.needs_shape)))
+        self._inventory = dict(zip(ITEMS, np.unravel_index(np.arange(n_inventory), grid.inventory_shape)))
+        for name, points in zip(("health", "hunger", "thirst", "body_temp"), grid.needs):
+            self._needs[name] = np.asarray(points)[self._needs[name]]
+
+        inv = self._inventory
+        fire = self._needs["fire"]
+        effects = {
+            "wait": (1, {}),
+            "hunt": (2, {}),
+            "drink": (1, {"thirst_relief": 35, "bad_water": conditions.bad_water}),
+            "eat_meat": (1, {"hunger_relief": 35}),
+            "eat_berries": (1, {"hunger_relief": 15}),
+            "rest": (REST_HOURS, {"rest": True}),
+            "light_fire": (1, {"light_fire": True}),
+        }
+        self.needs_steps: Dict[str, Tuple[int, Tuple[Ell, ...]]] = {
+            key: (hours, tuple(self._needs_step(hours, CLIMATES[i], **effect) for i in self.climates))
+            for key, (hours, effect) in effects.items()
+        }
+        has_kit = (inv["stick"] >= CAMPFIRE["stick"]) & (inv["stone"] >= CAMPFIRE["stone"])
+        self.commands: Dict[str, Tuple[Mode, ...]] = {
+            "gather": (Mode(1, "wait", self._gather()),),
+            "hunt": (Mode(2, "hunt", self._hunt()),),
+            "drink": (Mode(1, "drink"),),
+            "eat": (
+                Mode(1, "eat_meat", self._take({"cooked_meat": -1}), inventory_mask=inv["cooked_meat"] > 0),
+                Mode(
+                    1,
+                    "eat_berries",
+                    self._take({"berries": -1}),
+                    inventory_mask=(inv["cooked_meat"] == 0) & (inv["berries"] > 0),
+                ),
+            ),
+            "cook": (Mode(1, "wait", self._cook(), needs_mask=fire == 1, inventory_mask=inv["raw_meat"] > 0),),
+            "rest": (Mode(REST_HOURS, "rest"),),
+            "craft campfire": (
+                Mode(
+                    1,
+                    "light_fire",
+                    self._take({k: -v for k, v in CAMPFIRE.items()}),
+                    needs_mask=fire == 0,
+                    inventory_mask=has_kit,
+                ),
+            ),
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the transition model; value iteration adds a few value arrays of `shape` on top."""
+        ells = [ell for _, ells in self.needs_steps.values() for ell in ells]
+        ells += [mode.inventory for modes in self.commands.values() for mode in modes if mode.inventory is not None]
+        return sum(dst.nbytes + odds.nbytes for dst, odds in ells)
+
+    def _needs_step(
+        self,
+        hours: int,
+        temp_steps: Tuple[int, int],
+        *,
+        hunger_relief: int = 0,
+        thirst_relief: int = 0,
+        bad_water: float = 0.0,
+        rest: bool = False,
+        light_fire: bool = False,
+    ) -> Ell:
+        """Transition of the needs for a command's own effect followed by one `advance_time(hours)` in one climate."""
+        c = self.conditions
+        s = self._needs
+        health, fire, shelter = s["health"], s["fire"], s["shelter"]
+        if rest:  # `_recover_rest_health`, without camp comfort
+            health = np.minimum(100, health + 8 + 4 * shelter + 4 * fire)
+        if light_fire:
+            fire = np.ones_like(fire)
+        hunger = np.minimum(100, np.maximum(0, s["hunger"] - hunger_relief) + c.hunger_rate * hours)
+        thirst = np.minimum(100, np.maximum(0, s["thirst"] - thirst_relief) + c.thirst_rate * hours)
+        exposed, sheltered = temp_steps
+        body_temp = s["body_temp"] + np.where(fire == 1, 1, exposed) + np.where(shelter > 0, sheltered, 0)
+        damage = 2 * (hunger >= 90) + 3 * (thirst >= 90) + 5 * (body_temp <= 34) + 5 * (body_temp >= 40)
+        body_temp = np.clip(body_temp, 30, 42)
+
+        columns = []
+        water = [(1.0 - bad_water, 0), (bad_water, 5)] if bad_water else [(1.0, 0)]
+        fire_odds = [
+            (np.where(fire == 1, 1.0 - c.fire_failure, 1.0), fire),
+            (np.where(fire == 1, c.fire_failure, 0.0), np.zeros_like(fire)),
+        ]
+        grids = ((0, *self.grid.health), *self.grid.needs[1:])
+        for water_chance, water_damage in water:
+            left = health - damage - water_damage
+            # Health 0 is an extra grid point that stands for death, so low health is not rounded up.
+            indices, weights = simplex((left, hunger, thirst, body_temp), grids)
+            alive = (indices[0] > 0) & (left > 0)[:, None]
+            indices[0] = np.maximum(indices[0] - 1, 0)
+            for fire_chance, fire_after in fire_odds:
+                for k in range(weights.shape[1]):
+                    vertex = (*(index[:, k] for index in indices), fire_after, shelter)
+                    dst = np.ravel_multi_index(vertex, self.grid.needs_shape)
+                    columns.append((dst, water_chance * fire_chance * weights[:, k] * alive[:, k]))
+        return _ell(columns, len(health))
+
+    def _inventory_branches(self, branches: List[Tuple[float | np.ndarray, Mapping[str, np.ndarray | int]]]) -> Ell:
+        """Build an inventory transition from `(odds, {item: change})` branches, clamping counts to their caps."""
+        inv = self._inventory
+        columns = []
+        for odds, change in branches:
+            counts = [np.clip(inv[item] + change.get(item, 0), 0, getattr(self.grid, item)) for item in ITEMS]
+            columns.append((np.ravel_multi_index(counts, self.grid.inventory_shape), odds))
+        return _ell(columns, len(inv["stick"]))
+
+    def _take(self, change: Mapping[str, int]) -> Ell:
+        return self._inventory_branches([(1.0, change)])
+
+    def _gather(self) -> Ell:
+        """An item picked by `gather_odds`, 1-3 of it; items the model does not track change nothing."""
+        return self._inventory_branches(
+            [
+                (odds / 3, {item: amount} if item in ITEMS else {})
+                for item, odds in self.conditions.gather_odds
+                for amount in (1, 2, 3)
+            ]
+        )
+
+    def _hunt(self) -> Ell:
+        success = self.conditions.hunt_success
+        caught = [(success / 3, {"raw_meat": meat}) for meat in (1, 2, 3)]
+        return self._inventory_branches([(1.0 - success, {}), *caught])
+
+    def _cook(self) -> Ell:
+        raw = self._inventory["raw_meat"]
+        return self._inventory_branches(
+            [(0.5, {"raw_meat": -np.minimum(raw, n), "cooked_meat": np.minimum(raw, n)}) for n in (1, 2)]
+        )
+
+    def _step(self, hours: int, ells: Tuple[Ell, ...], values: np.ndarray) -> np.ndarray:
+        """Discounted expected value after a needs step: the weather shifts first, then the needs move under it."""
+        after = np.stack([_apply_needs(ell, values[i]) for i, ell in enumerate(ells)])
+        redrawn = np.tensordot(self._climate_odds, after, axes=1)
+        stay = self.conditions.climate_stay
+        after *= np.float32(stay * self.discount**hours)
+        after += np.float32((1 - stay) * self.discount**hours) * redrawn
+        return after
+
+    def solve(self, tolerance: float = 0.1, max_iterations: int = 2_000) -> Solution:
+        """Value iteration until no state's value moves by more than `tolerance` hours."""
+        started = time.perf_counter()
+        values = np.zeros(self.shape, dtype=np.float32)
+        choice = np.zeros(self.shape, dtype=np.uint8)
+        names = list(self.commands)
+        residual = math.inf
+        iterations = 0
+        while residual > tolerance and iterations < max_iterations:
+            best = np.full_like(values, -np.inf)
+            stepped = {key: self._step(hours, ells, values) for key, (hours, ells) in self.needs_steps.items()}
+            for index, name in enumerate(names):
+                for mode in self.commands[name]:
+                    q = stepped[mode.needs]
+                    if mode.inventory is not None:
+                        q = _apply_inventory(mode.inventory, q)
+                    q = q + self._reward[mode.hours]
+                    better = q > best
+                    if mode.needs_mask is not None:
+                        better &= mode.needs_mask[None, :, None]
+                    if mode.inventory_mask is not None:
+                        better &= mode.inventory_mask
+                    best = np.where(better, q, best)
+                    choice[better] = index
+            residual = float(np.abs(best - values).max())
+            values = best
+            iterations += 1
+        policy = PolicyTable(self.grid, names, self.climates, choice.ravel())
+        return Solution(policy, values, iterations, residual, time.perf_counter() - started)
+
+
+def _apply_needs(ell: Ell, values: np.ndarray) -> np.ndarray:
+    """`P @ values` for a needs transition `P` held as fixed-width rows."""
+    dst, odds = ell
+    out = odds[:, 0, None] * values[dst[:, 0]]
+    for k in range(1, dst.shape[1]):
+        out += odds[:, k, None] * values[dst[:, k]]
+    return out
+
+
+def _apply_inventory(ell: Ell, values: np.ndarray) -> np.ndarray:
+    """`values @ P.T` over the last axis for an inventory transition `P` held as fixed-width rows."""
+    dst, odds = ell
+    out = values[..., dst[:, 0]] * odds[:, 0]
+    for k in range(1, dst.shape[1]):
+        out += values[..., dst[:, k]] * odds[:, k]
+    return out
+
+
+def _nearest(points: Sequence[int], lo: int, hi: int) -> List[int]:
+    """For every integer `lo..hi`, the index of the closest of `points`."""
+    values = np.arange(lo, hi + 1)[:, None]
+    return np.abs(values - np.asarray(points)[None, :]).argmin(axis=1).tolist()
+
+
+NEEDS_RANGES = ((0, 100), (0, 100), (0, 100), (30, 42))  # health, hunger, thirst, body temperature
+
+
+class PolicyTable:
+    """The solved command for every grid state, queried by snapping each value to its nearest grid point in O(1).
+
+    Instances are picklable, so a table works as a `montecarlo` policy on worker processes.
+    """
+
+    def __init__(self, grid: Grid, commands: Sequence[str], climates: Sequence[int], actions: np.ndarray) -> None:
+        self.grid = grid
+        self.commands = tuple(commands)
+        self.climates = tuple(climates)
+        self.actions = actions  # uint8 command index per state, flattened from `SurvivalMdp.shape`
+        self._climate_slot = _nearest(self.climates, 0, len(CLIMATES) - 1)  # climates not solved for use the closest
+        self._nearest = [_nearest(points, lo, hi) for points, (lo, hi) in zip(grid.needs, NEEDS_RANGES)]
+        shape = (len(self.climates), *grid.needs_shape, *grid.inventory_shape)
+        self._strides = [math.prod(shape[i + 1 :]) for i in range(len(shape))]
+        self._caps = [getattr(grid, item) for item in ITEMS]
+
+    def command(
+        self,
+        ambient_temp: int,
+        health: int,
+        hunger: int,
+        thirst: int,
+        body_temp: int,
+        fire_lit: bool,
+        shelter_level: int,
+        inventory: Mapping[str, int],
+    ) -> str:
+        strides = self._strides
+        index = strides[0] * self._climate_slot[climate(ambient_temp)]
+        needs = (health, hunger, thirst, body_temp)
+        for stride, nearest, (lo, hi), value in zip(strides[1:], self._nearest, NEEDS_RANGES, needs):
+            index += stride * nearest[min(hi, max(lo, value)) - lo]
+        index += strides[5] * int(fire_lit) + strides[6] * min(2, shelter_level)
+        for stride, item, cap in zip(strides[7:], ITEMS, self._caps):
+            index += stride * min(cap, inventory.get(item, 0))
+        return self.commands[self.actions[index]]
+
+    def __call__(self, state: Observation) -> str:
+        return self.command(
+            state.ambient_temp,
+            state.health,
+            state.hunger,
+            state.thirst,
+            state.body_temp,
+            state.fire_lit,
+            state.shelter_level,
+            state.inventory,
+        )
+
+    def lookup(self, game: SurvivalGame) -> str:
+        return self(observe(game))
+
+    def save(self, path: Path) -> None:
+        np.savez_compressed(
+            path,
+            actions=self.actions,
+            commands=np.array(self.commands),
+            climates=np.array(self.climates),
+            grid=json.dumps(asdict(self.grid)),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> PolicyTable:
+        with np.load(path) as data:
+            fields = json.loads(str(data["grid"]))
+            grid = Grid(**{name: tuple(value) if isinstance(value, list) else value for name, value in fields.items()})
+            return cls(grid, data["commands"].tolist(), data["climates"].tolist(), data["actions"])
+
+
+def _seeds_starting_in(environment: str, start_seed: int) -> Iterator[int]:
+    for seed in itertools.count(start_seed):
+        if SurvivalGame(sink=montecarlo.NullSink(), seed=seed).current_env().name == environment:
+            yield seed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="solve for the starting environment of this game")
+    parser.add_argument("--discount", type=float, default=0.98, help="per game hour")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="stop when no value moves by more hours")
+    parser.add_argument("--output", metavar="PATH", help="write the policy table (.npz)")
+    parser.add_argument(
+        "--evaluate", type=int, metavar="RUNS", help="compare the table with forager on RUNS games starting there"
+    )
+    sampling_profiler.add_arguments(parser)
+    args = parser.parse_args()
+
+    with sampling_profiler.profiling(args):
+        game = SurvivalGame(sink=montecarlo.NullSink(), seed=args.seed)
+        conditions = Conditions.from_game(game)
+        mdp = SurvivalMdp(conditions, discount=args.discount)
+        solution = mdp.solve(tolerance=args.tolerance)
+    report = {
+        "environment": game.current_env().name,
+        "conditions": asdict(conditions),
+        "states": solution.values.size,
+        "model_bytes": mdp.nbytes,
+        "value_bytes": solution.values.nbytes,
+        "table_bytes": solution.policy.actions.nbytes,
+        "iterations": solution.iterations,
+        "residual": solution.residual,
+        "seconds": solution.seconds,
+    }
+    if args.output:
+        solution.policy.save(Path(args.output))
+    if args.evaluate:
+        # The table only knows its own environment, so compare on games that start there.
+        seeds = list(itertools.islice(_seeds_starting_in(report["environment"], args.seed), args.evaluate))
+        for name, policy in (("policy_table", solution.policy), ("forager", montecarlo.forager)):
+            aggregate = montecarlo.Aggregate()
+            for seed in seeds:
+                aggregate.add(montecarlo.play(policy, seed))
+            report[name] = aggregate.summary()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
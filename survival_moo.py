@@ -3,74 +3,116 @@
 
 from __future__ import annotations
 
+import argparse
+import functools
 import json
+import operator
 import random
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, TypeVar
 
-from world_data import WEATHER_DATA, WORLD_DATA
+import numpy as np
 
+import sampling_profiler
+import save_format
+import world_cache
+from fast_forward import comfort_after, first_hour_at_least, geometric_gap, integrate
+from instrumentation import Metrics
+from journal import CommandJournal
+from messages import MessageSink, Msg, NullSink, StdoutSink, stat_feedback
+from resource_store import ResourceNodes, ResourceStore, StoreSnapshot
+from rng_streams import GameRng
+from scheduler import Scheduler
+from text_table import TextTable
+from weather_model import WeatherModel
 
-@dataclass
+T = TypeVar("T")
+
+WEATHER_SHIFT_CHANCE = 0.35  # per `advance_time` call, for worlds without a weather model
+REST_HOURS = 3
+DAWN_HOUR = 6
+MAX_WAIT_HOURS = 7 * 24
+
+
+@dataclass(frozen=True, slots=True)
 class WaterSource:
     """Describes a single place where the player can drink water."""
 
     name: str
     quality: str
-    description: str
+    description_id: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Poi:
     """Describes a point of interest in an environment."""
 
     name: str
-    description: str
-
+    description_id: int
 
-@dataclass
-class ResourceNode:
-    """Tracks local gatherable resources with depletion, stress, and regeneration behavior."""
 
-    item: str
-    count: int
-    max_count: int
-    regen_rate: int
-    stress: int = 0
+@dataclass(frozen=True, slots=True, eq=False)
+class EnvironmentDefinition:
+    """The static part of an environment, shared by every session that plays it.
 
-    def harvest(self, amount: int) -> int:
-        """Take up to `amount` resources from the node and return actual harvested quantity."""
-        taken = min(self.count, amount)
-        self.count -= taken
-        return taken
+    Prose is held as ids into `text`; only `flavor` is resolved here, the
+    renderers resolve the rest when they format a message. Definitions compare
+    and hash by identity, so they can key render caches.
+    """
 
-
-@dataclass
-class Environment:
     name: str
     terrain: str
-    flavor: str
-    gatherables: List[str]
-    huntables: List[str]
-    water_sources: List[WaterSource]
-    pois: List[Poi]
+    gatherables: Sequence[str]
+    huntables: Sequence[str]
+    water_sources: Sequence[WaterSource]
     temp_bias: int
-    resource_nodes: Dict[str, ResourceNode]
-    soundscape: Dict[str, List[str]]
+    flavor_id: int
+    pois: Sequence[Poi]
+    soundscape: Mapping[str, Sequence[int]]
+    flavor_sections: Tuple[int, int, int, int]  # see world_cache.flavor_sections
+    text: TextTable
+
+    @property
+    def flavor(self) -> str:
+        return self.text[self.flavor_id]
+
+
+class Environment:
+    """One session's environment: a shared definition plus this session's resource nodes."""
+
+    __slots__ = ("definition", "resource_nodes")
+
+    def __init__(self, definition: EnvironmentDefinition, resource_nodes: ResourceNodes) -> None:
+        self.definition = definition
+        self.resource_nodes = resource_nodes
+
+    name = property(lambda self: self.definition.name)
+    terrain = property(lambda self: self.definition.terrain)
+    flavor = property(lambda self: self.definition.flavor)
+    gatherables = property(lambda self: self.definition.gatherables)
+    huntables = property(lambda self: self.definition.huntables)
+    water_sources = property(lambda self: self.definition.water_sources)
+    pois = property(lambda self: self.definition.pois)
+    temp_bias = property(lambda self: self.definition.temp_bias)
+    soundscape = property(lambda self: self.definition.soundscape)
+    text = property(lambda self: self.definition.text)
+
+    def __repr__(self) -> str:
+        return f"Environment({self.definition.name!r}, row={self.resource_nodes.row})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Weather:
     name: str
     temperature_shift: int
     thirst_rate: int
     fire_modifier: float
     hunt_modifier: float
-    mood: str
+    mood_id: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Season:
     """Defines macro-scale climate pressure that cycles over long play windows."""
 
@@ -81,7 +123,7 @@ class Season:
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Event:
     """Temporary world condition that stacks with weather and season effects."""
 
@@ -95,7 +137,7 @@ class Event:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Shelter:
     level: int = 0
     material: str = "none"
@@ -105,7 +147,57 @@ class Shelter:
         return ["No shelter", "Lean-to", "Wattle hut", "Enchanted cabin"][self.level]
 
 
-@dataclass
+@dataclass(slots=True)
+class Inventory:
+    """Counters for the fixed set of carryable items, used like the dict it replaced.
+
+    Every item has its own slot, so an inventory costs a few machine words
+    instead of a hash table; `asdict` still yields the `{item: count}` dict
+    that saves have always stored.
+    """
+
+    stick: int = 1
+    stone: int = 1
+    fiber: int = 0
+    berries: int = 0
+    raw_meat: int = 0
+    cooked_meat: int = 0
+    mushroom: int = 0
+    spark_crystal: int = 0
+    hide: int = 0
+    rope: int = 0
+
+    def __getitem__(self, item: str) -> int:
+        if item not in INVENTORY_ITEMS:
+            raise KeyError(item)
+        return getattr(self, item)
+
+    def __setitem__(self, item: str, count: int) -> None:
+        if item not in INVENTORY_ITEMS:
+            raise KeyError(item)
+        setattr(self, item, count)
+
+    def __contains__(self, item: object) -> bool:
+        return item in INVENTORY_ITEMS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(INVENTORY_ITEMS)
+
+    def get(self, item: str, default: int = 0) -> int:
+        return getattr(self, item) if item in INVENTORY_ITEMS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return INVENTORY_ITEMS
+
+    def items(self) -> Tuple[Tuple[str, int], ...]:
+        return tuple((item, getattr(self, item)) for item in INVENTORY_ITEMS)
+
+
+INVENTORY_ITEMS: Tuple[str, ...] = Inventory.__slots__
+_inventory_counts = operator.attrgetter(*INVENTORY_ITEMS)
+
+
+@dataclass(slots=True)
 class Player:
     health: int = 100
     hunger: int = 25
@@ -113,32 +205,244 @@ class Player:
     body_temp: int = 37
     location: int = 0
     hours: int = 8
-    inventory: Dict[str, int] = field(default_factory=lambda: {
-        "stick": 1,
-        "stone": 1,
-        "fiber": 0,
-        "berries": 0,
-        "raw_meat": 0,
-        "cooked_meat": 0,
-        "mushroom": 0,
-        "spark_crystal": 0,
-        "hide": 0,
-        "rope": 0,
-    })
+    inventory: Inventory = field(default_factory=Inventory)
     shelter: Shelter = field(default_factory=Shelter)
     fire_lit: bool = False
     camp_comfort: int = 0
 
+    def __post_init__(self) -> None:
+        if isinstance(self.inventory, dict):  # as stored in saves
+            self.inventory = Inventory(**self.inventory)
+
+    def copy(self) -> Player:
+        """An independent player; the inventory and shelter are copied too."""
+        return Player(
+            self.health,
+            self.hunger,
+            self.thirst,
+            self.body_temp,
+            self.location,
+            self.hours,
+            Inventory(*_inventory_counts(self.inventory)),
+            Shelter(self.shelter.level, self.shelter.material),
+            self.fire_lit,
+            self.camp_comfort,
+        )
+
+
+EVENTS: Tuple[Event, ...] = (
+    Event("Cold Snap", 18, -3, 0, 0.05, -0.05, -1, "A sharp cold front settles in and hardens surfaces."),
+    Event("Clear Night", 14, -1, -1, 0.1, 0.05, 0, "Skies clear after dusk, boosting visibility and dry fuel."),
+    Event("Animal Trail", 16, 0, 0, 0.0, 0.15, 0, "Fresh tracks cluster around passes and water edges."),
+    Event("Midge Bloom", 12, 1, 1, -0.05, -0.05, 0, "Dense insects rise from still water and open mud."),
+    Event("Berry Flush", 16, 0, 0, 0.0, 0.0, 1, "New berry growth appears along sunny margins."),
+    Event("Mineral Runoff", 20, -1, 0, -0.05, 0.0, -1, "Runoff clouds channels with suspended mineral fines."),
+)
+WINTER_EVENTS: Tuple[Event, ...] = (
+    Event("Cold Snap", 20, -3, 0, 0.05, -0.05, -1, "A sharp cold front settles in and hardens surfaces."),
+)
+RISKY_WATER = frozenset({"murky", "muddy", "risky", "salty"})  # a quarter of drinks from these cost 5 health
+RECIPES: Dict[str, Dict[str, int]] = {
+    "rope": {"fiber": 3},
+    "spark_crystal": {"stone": 2},
+    "campfire": {"stick": 3, "stone": 2},
+    "lean-to": {"stick": 5, "fiber": 4},
+    "hut": {"stick": 8, "fiber": 6, "hide": 2},
+}
+# Timer for each `advance_time` stage `SurvivalGame.instrument` wraps, by method (`fast_forward` calls some too).
+TIMED_STAGES = {
+    "_turn_season": "stage.season_clock",
+    "_roll_for_event": "stage.event_clock",
+    "_end_event": "stage.event_clock",
+    "_update_camp_comfort": "stage.camp_comfort",
+    "_update_fire_from_weather": "stage.fire_check",
+    "_regenerate_world_resources": "stage.world_regen",
+    "_reduce_node_stress": "stage.stress_reduction",
+    "_maybe_print_ambient": "stage.ambience",
+    "resolve_survival": "stage.survival",
+}
+
+
+def _intern(value: T, pool: Iterable[T]) -> T:
+    """Return the shared instance equal to `value` if `pool` has one, so loaded saves reuse it."""
+    for candidate in pool:
+        if candidate == value:
+            return candidate
+    return value
+
+
+_WARNINGS = {  # in `resolve_survival` order
+    "starvation": Msg.STARVING,
+    "dehydration": Msg.DEHYDRATED,
+    "hypothermia": Msg.HYPOTHERMIA,
+    "hyperthermia": Msg.HYPERTHERMIA,
+}
+
+SEASONS: Tuple[Season, ...] = (
+    Season("Spring", 0, 1, 0.0, "Meltwater rises and growth returns; supplies recover quickly."),
+    Season("Summer", 3, 0, 0.0, "Long dry days increase heat pressure and water demand."),
+    Season("Autumn", -1, 0, 0.05, "Cooler air and active game trails reward preparation."),
+    Season("Winter", -5, -1, -0.10, "Hard cold slows recovery and punishes poor stockpiles."),
+)
+
+
+@dataclass(frozen=True)
+class WorldDefinition:
+    """Everything about a hand-written world that never changes during play.
+
+    Build it once per process and hand it to every session: each `StaticWorld`
+    only adds its own copy of the resource arrays.
+    """
+
+    environments: Tuple[EnvironmentDefinition, ...]
+    weather_types: Tuple[Weather, ...]
+    weather_model: WeatherModel
+    resources: ResourceStore  # starting node state; sessions copy it, never mutate it
+    text: TextTable  # every text id in the definitions indexes this table
+
+    @classmethod
+    def from_data(
+        cls, world_data: Sequence[dict], weather_data: Sequence[dict], weather_model: dict | None = None
+    ) -> WorldDefinition:
+        """Build runtime definitions from `WORLD_DATA`-style entries; weather changes uniformly without a model."""
+        return cls.from_compiled(world_cache.CompiledWorld.from_data(world_data, weather_data, weather_model))
+
+    @classmethod
+    def from_compiled(cls, compiled: world_cache.CompiledWorld) -> WorldDefinition:
+        """Build definitions from a loaded world cache; its text stays in the table until rendered."""
+        environments = tuple(
+            EnvironmentDefinition(
+                name=name,
+                terrain=terrain,
+                gatherables=gatherables,
+                huntables=huntables,
+                water_sources=tuple(WaterSource(*water) for water in water_sources),
+                temp_bias=temp_bias,
+                flavor_id=flavor_id,
+                pois=tuple(Poi(*poi) for poi in pois),
+                soundscape=dict(soundscape),
+                flavor_sections=sections,
+                text=compiled.text,
+            )
+            for name, terrain, gatherables, huntables, water_sources, temp_bias, _, flavor_id, pois, soundscape, sections in compiled.environments
+        )
+        weather_types = tuple(Weather(*row) for row in compiled.weather)  # rows follow world_cache.WEATHER_FIELDS
+        weather_model = WeatherModel.from_odds(
+            [weather.name for weather in weather_types],
+            [season.name for season in SEASONS],
+            **(compiled.weather_model or {"change_chance": WEATHER_SHIFT_CHANCE}),
+        )
+        resources = ResourceStore.from_node_rows([env[6] for env in compiled.environments])
+        return cls(environments, weather_types, weather_model, resources, compiled.text)
+
+
+@functools.lru_cache(maxsize=None)
+def default_world_definition() -> WorldDefinition:
+    """The shared definition of `world_data.py`, loaded from its compiled cache on first use."""
+    return WorldDefinition.from_compiled(world_cache.default_world())
+
+
+class StaticWorld(list):
+    """The hand-written world: every environment stays resident and any other is one trip away.
+
+    Streamed worlds (see `world_gen.ProceduralWorld`) offer the same methods.
+    """
+
+    def __init__(self, environments: Sequence[Environment], resources: ResourceStore) -> None:
+        super().__init__(environments)
+        self.resources = resources
+
+    @classmethod
+    def from_definition(cls, definition: WorldDefinition) -> StaticWorld:
+        """A new session's world: shared definitions, private resource arrays."""
+        resources = definition.resources.copy()
+        environments = [Environment(env, resources.nodes(row)) for row, env in enumerate(definition.environments)]
+        return cls(environments, resources)
+
+    def destination(self, location: int, rng: random.Random) -> int:
+        """Pick a travel destination uniformly among all other environments."""
+        pick = rng.randrange(len(self) - 1)
+        return pick + 1 if pick >= location else pick
+
+    def visit(self, location: int) -> None:
+        """Nothing to stream in or evict: the whole world is always resident."""
+
+    def nodes_payload(self) -> List[Dict[str, dict]]:
+        return self.resources.to_payload()
+
+    def load_nodes_payload(self, payload: List[Dict[str, dict]]) -> None:
+        self.resources.load_payload(payload)
+
+    def node_records(self) -> np.ndarray:
+        rows = range(len(self))
+        return self.resources.to_records(rows, rows)
+
+    def load_node_records(self, records: np.ndarray) -> None:
+        self.resources.load_records(records, records["env"].astype(np.intp))
+
+    def snapshot(self) -> StoreSnapshot:
+        return self.resources.snapshot()
+
+    def restore(self, snapshot: StoreSnapshot) -> None:
+        self.resources.restore(snapshot)
+
+    def fork(self) -> StaticWorld:
+        """An independent copy of this world's resources around the same shared definitions."""
+        resources = self.resources.fork()
+        return StaticWorld([Environment(env.definition, resources.nodes(row)) for row, env in enumerate(self)], resources)
+
+
+@dataclass(frozen=True, slots=True)
+class GameSnapshot:
+    """Everything `SurvivalGame.restore` needs to put a game back the way it was.
+
+    Only mutable state is copied; weather, season and event values are the
+    game's own immutable instances, and `world` is whatever the world's
+    `snapshot` returned.
+    """
+
+    player: Player
+    weather: Weather
+    season_index: int
+    active_event: Event | None
+    clock: Scheduler
+    elapsed_hours: int
+    rng_seed: int | str
+    rng_positions: Mapping[str, int]
+    running: bool
+    cause_of_death: str | None
+    world: object
+
 
 class SurvivalGame:
     """Main game object that owns world state and executes command actions."""
 
-    def __init__(self) -> None:
-        self.world = self._load_world_from_data(WORLD_DATA)
-        self.weather_types = self._load_weather_from_data(WEATHER_DATA)
-        self.seasons = self._build_seasons()
-        self.player = Player(location=random.randint(0, len(self.world) - 1))
-        self.weather = random.choice(self.weather_types)
+    def __init__(
+        self,
+        world: StaticWorld | None = None,
+        sink: MessageSink | None = None,
+        seed: int | str | None = None,
+    ) -> None:
+        """Play the hand-written world unless another one (e.g. `world_gen.ProceduralWorld`) is given.
+
+        Feedback goes to `sink`, which prints to stdout by default. Every random
+        decision draws from `self.rng`, so the same seed and commands replay the
+        same game; `seed=None` picks a fresh one.
+        """
+        self.sink = sink if sink is not None else StdoutSink()
+        self.rng = GameRng(seed)
+        definition = default_world_definition()
+        self.world = world if world is not None else StaticWorld.from_definition(definition)
+        self.resources = self.world.resources
+        self.weather_types = definition.weather_types
+        self.weather_model = definition.weather_model
+        self.text = definition.text
+        self.seasons = SEASONS
+        self.player = Player(location=self.rng.travel.randint(0, len(self.world) - 1))
+        self.world.visit(self.player.location)
+        self.weather = self.rng.weather.choice(self.weather_types)
+        self.elapsed_hours = 0
+        self.clock = Scheduler()
         self.season_length_hours = 48
         self.season_index = 0
         self.season_timer = 0
@@ -146,61 +450,20 @@ class SurvivalGame:
         self.active_event: Event | None = None
         self.event_timer = 0
         self.event_check_timer = 0
+        self.cause_of_death: str | None = None
+        self._checkpoint: save_format.Checkpoint | None = None
+        self.journal: CommandJournal | None = None
+        self.metrics: Metrics | None = None
         self.running = True
         self.commands = self._build_command_table()
 
-    def _load_world_from_data(self, world_data: List[dict]) -> List[Environment]:
-        """Build runtime environments from data definitions to improve maintainability."""
-        world: List[Environment] = []
-        for entry in world_data:
-            world.append(
-                Environment(
-                    name=entry["name"],
-                    terrain=entry["terrain"],
-                    flavor=entry["flavor"],
-                    gatherables=entry["gatherables"],
-                    huntables=entry["huntables"],
-                    water_sources=[WaterSource(**w) for w in entry["water_sources"]],
-                    pois=[Poi(**p) for p in entry["pois"]],
-                    temp_bias=entry["temp_bias"],
-                    resource_nodes={
-                        item: ResourceNode(
-                            item=item,
-                            count=node["count"],
-                            max_count=node["max"],
-                            regen_rate=node["regen"],
-                            stress=node.get("stress", 0),
-                        )
-                        for item, node in entry["resource_nodes"].items()
-                    },
-                    soundscape=entry.get("soundscape", {}),
-                )
-            )
-        return world
-
-    def _load_weather_from_data(self, weather_data: List[dict]) -> List[Weather]:
-        """Build Weather objects from data definitions."""
-        return [Weather(**entry) for entry in weather_data]
-
-    def _build_seasons(self) -> List[Season]:
-        """Create ordered season cycle for long-horizon survival pressure."""
-        return [
-            Season("Spring", 0, 1, 0.0, "Meltwater rises and growth returns; supplies recover quickly."),
-            Season("Summer", 3, 0, 0.0, "Long dry days increase heat pressure and water demand."),
-            Season("Autumn", -1, 0, 0.05, "Cooler air and active game trails reward preparation."),
-            Season("Winter", -5, -1, -0.10, "Hard cold slows recovery and punishes poor stockpiles."),
-        ]
-
     def _build_events(self) -> List[Event]:
         """Define low-frequency dynamic events that briefly reshape local conditions."""
-        return [
-            Event("Cold Snap", 18, -3, 0, 0.05, -0.05, -1, "A sharp cold front settles in and hardens surfaces."),
-            Event("Clear Night", 14, -1, -1, 0.1, 0.05, 0, "Skies clear after dusk, boosting visibility and dry fuel."),
-            Event("Animal Trail", 16, 0, 0, 0.0, 0.15, 0, "Fresh tracks cluster around passes and water edges."),
-            Event("Midge Bloom", 12, 1, 1, -0.05, -0.05, 0, "Dense insects rise from still water and open mud."),
-            Event("Berry Flush", 16, 0, 0, 0.0, 0.0, 1, "New berry growth appears along sunny margins."),
-            Event("Mineral Runoff", 20, -1, 0, -0.05, 0.0, -1, "Runoff clouds channels with suspended mineral fines."),
-        ]
+        return list(EVENTS)
+
+    def _build_winter_events(self) -> List[Event]:
+        """Define events that only join the roll table while Winter holds."""
+        return list(WINTER_EVENTS)
 
     def _build_command_table(self) -> Dict[str, Callable[[str], None]]:
         """Map command names to handlers for clean and extensible command dispatch."""
@@ -216,6 +479,7 @@ class SurvivalGame:
             "cook": lambda _: self.cook(),
             "travel": lambda _: self.travel(),
             "rest": lambda _: self.rest(),
+            "wait": self.wait,
             "extinguish": lambda _: self.extinguish(),
             "save": lambda args: self.save_game(args or "savegame.json"),
             "load": lambda args: self.load_game(args or "savegame.json"),
@@ -223,13 +487,44 @@ class SurvivalGame:
             "quit": lambda _: self._quit(),
         }
 
+    def instrument(self, metrics: Metrics | None) -> None:
+        """Time every `advance_time` stage and command handler into `metrics`; None removes the timing.
+
+        Only this game's bound methods are wrapped, so games that are never
+        instrumented pay nothing. `hours_stepped` and `hours_fast_forwarded`
+        count game hours, so stage costs can be read per hour.
+        """
+        for method in (*TIMED_STAGES, "advance_time", "fast_forward"):
+            self.__dict__.pop(method, None)
+        self.metrics = metrics
+        self.commands = self._build_command_table()
+        if metrics is None:
+            return
+        for method, timer in TIMED_STAGES.items():
+            setattr(self, method, metrics.timed(timer, getattr(self, method)))
+        self.commands = {name: metrics.timed(f"command.{name}", handler) for name, handler in self.commands.items()}
+        advance_time = metrics.timed("advance_time", self.advance_time)
+        fast_forward = metrics.timed("fast_forward", self.fast_forward)
+
+        def counted_advance_time(hrs: int = 1) -> None:
+            metrics.count("hours_stepped", hrs)
+            advance_time(hrs)
+
+        def counted_fast_forward(hours: int, **options: object) -> Tuple[int, int]:
+            waited, healed = fast_forward(hours, **options)
+            metrics.count("hours_fast_forwarded", waited)
+            return waited, healed
+
+        self.advance_time = counted_advance_time
+        self.fast_forward = counted_fast_forward
+
     def _quit(self) -> None:
-        print("You leave the wilderness with stories and at least one mysterious rash.")
+        self.sink.emit(Msg.QUIT)
         self.running = False
 
     def _handle_craft(self, args: str) -> None:
         if not args:
-            print("Usage: craft <item>")
+            self.sink.emit(Msg.CRAFT_USAGE)
             return
         self.craft(args)
 
@@ -238,165 +533,161 @@ class SurvivalGame:
         command, _, args = raw.partition(" ")
         handler = self.commands.get(command)
         if handler is None:
-            print("Unknown command. Type 'help' for options.")
+            self.sink.emit(Msg.UNKNOWN_COMMAND)
             return
+        if self.journal is not None:
+            self.journal.record(self, command, raw)
         handler(args.strip())
+        if self.journal is not None:
+            self.journal.committed(self, command)
 
     def current_env(self) -> Environment:
         return self.world[self.player.location]
 
     def describe_location(self) -> None:
-        env = self.current_env()
-        print(f"\n== {env.name} ==")
-        print(f"Terrain: {env.terrain}")
-        print(f"Season: {self.current_season.name} ({self.season_timer}/{self.season_length_hours}h)")
-        print(f"Season Note: {self.current_season.description}")
-
-        flavor_parts = [part.strip() for part in env.flavor.split("|") if part.strip()]
-        scene_setter = flavor_parts[0] if flavor_parts else env.flavor
-        terrain_cover = flavor_parts[1] if len(flavor_parts) > 1 else ""
-        ground_travel = flavor_parts[2] if len(flavor_parts) > 2 else ""
-        air_light = flavor_parts[3] if len(flavor_parts) > 3 else ""
-
-        print(f"\n{scene_setter}")
-        if terrain_cover:
-            print(f"\nTerrain & Cover: {terrain_cover}")
-        if ground_travel:
-            print(f"Ground & Travel: {ground_travel}")
-        if air_light:
-            print(f"Air & Light: {air_light}")
-
-        print(f"\nWeather — {self.weather.name}: {self.weather.mood}")
-        if self.active_event:
-            print(f"Active Event — {self.active_event.name}: {self.active_event.description}")
-
-        print("\nWater:")
-        for w in env.water_sources:
-            print(f" - {w.name} ({w.quality}): {w.description}")
-
-        print("\nPoints of Interest:")
-        for p in env.pois:
-            print(f" - {p.name}: {p.description}")
-
-        notes: List[str] = []
-        if env.temp_bias <= -5:
-            notes.append("Exposure risk increases quickly if you are wet or inactive.")
-        elif env.temp_bias >= 3:
-            notes.append("Heat stress risk rises at midday; shade and pace matter.")
-
-        if self.weather.name in {"Rain", "Storm"}:
-            notes.append("Fire is harder to maintain in current conditions.")
-        elif self.weather.name == "Frostwind":
-            notes.append("Wind chill can outpace clothing insulation.")
-
-        if notes:
-            print("\nNotes:")
-            for note in notes[:2]:
-                print(f" - {note}")
+        self.sink.emit(
+            Msg.LOCATION,
+            env=self.current_env().definition,
+            season=self.current_season,
+            season_timer=self.season_timer,
+            season_length=self.season_length_hours,
+            weather=self.weather,
+            event=self.active_event,
+            text=self.text,
+        )
 
     def status(self) -> None:
         p = self.player
-        print(
-            f"\nHealth:{p.health} Hunger:{p.hunger}/100 Thirst:{p.thirst}/100 "
-            f"BodyTemp:{p.body_temp}C Time:{p.hours:02d}:00"
+        self.sink.emit(
+            Msg.STATUS,
+            health=p.health,
+            hunger=p.hunger,
+            thirst=p.thirst,
+            body_temp=p.body_temp,
+            hours=p.hours,
+            shelter=p.shelter.label,
+            fire_lit=p.fire_lit,
+            season=self.current_season.name,
+            event=self.active_event.name if self.active_event else None,
+            event_timer=self.event_timer,
+            camp_comfort=p.camp_comfort,
         )
-        print(
-            f"Shelter: {p.shelter.label} | Fire: {'lit' if p.fire_lit else 'out'} | "
-            f"Season: {self.current_season.name}"
-        )
-        if self.active_event:
-            print(f"Event: {self.active_event.name} ({self.event_timer}h left)")
-
-        tier = "Cold Camp" if p.camp_comfort <= 2 else "Settled Camp" if p.camp_comfort <= 6 else "Cozy Camp"
-        print(f"Camp Comfort: {p.camp_comfort}/10 ({tier})")
-        for msg in self._stat_feedback():
-            print(f" - {msg}")
 
     def _stat_feedback(self) -> List[str]:
         """Return threshold-based survival feedback for hunger/thirst/temperature."""
         p = self.player
-        feedback: List[str] = []
-        if p.hunger >= 80:
-            feedback.append("Your stomach is painfully empty.")
-        elif p.hunger >= 60:
-            feedback.append("You are hungry.")
-
-        if p.thirst >= 80:
-            feedback.append("Your mouth is desert dry.")
-        elif p.thirst >= 60:
-            feedback.append("You are thirsty.")
-
-        if p.body_temp <= 35:
-            feedback.append("You are chilled and shivering.")
-        elif p.body_temp >= 39:
-            feedback.append("You feel overheated.")
-
-        return feedback
+        return stat_feedback(p.hunger, p.thirst, p.body_temp)
 
     def inventory(self) -> None:
-        print("\nInventory:")
-        for item, count in sorted(self.player.inventory.items()):
-            if count > 0:
-                print(f" - {item}: {count}")
+        self.sink.emit(Msg.INVENTORY, items=tuple(self.player.inventory.items()))
 
     def _event_modifier(self, attr: str, default: float = 0.0) -> float:
         if self.active_event is None:
             return default
         return float(getattr(self.active_event, attr))
 
-    def _seasonal_regen_amount(self, node: ResourceNode, env: Environment) -> int:
-        """Return per-hour regeneration under season/event pressure and local stress."""
-        regen = node.regen_rate + self.current_season.regen_modifier + int(self._event_modifier("regen_modifier", 0))
-        regen -= node.stress // 3
+    def _settle_environment(self, env: Environment) -> None:
+        """Bring an environment's lazily regenerated nodes up to the current hour."""
+        self.resources.settle(env.resource_nodes.row)
 
-        if self.player.location == self.world.index(env) and self.player.camp_comfort >= 7:
-            regen += 1
-
-        return max(0, regen)
+    def _settle_world(self) -> None:
+        self.resources.settle_all()
 
     def _regenerate_world_resources(self, hrs: int) -> None:
-        """Regenerate resources in all environments per hour to keep exploration valuable."""
-        for _ in range(hrs):
-            for env in self.world:
-                for node in env.resource_nodes.values():
-                    regen_amount = self._seasonal_regen_amount(node, env)
-                    node.count = min(node.max_count, node.count + regen_amount)
+        """Log this step's season/event regen pressure; nodes settle lazily when next read.
+
+        Only a cozy camp is settled eagerly, because its comfort bonus applies to
+        the player's current environment for this step alone.
+        """
+        modifier = self.current_season.regen_modifier + int(self._event_modifier("regen_modifier", 0))
+        row = self.current_env().resource_nodes.row
+        cozy = self.player.camp_comfort >= 7
+        if cozy:
+            self.resources.settle(row)
+        self.resources.record(hrs, modifier)
+        if cozy:
+            self.resources.settle(row, bonus=1)
 
     def _reduce_node_stress(self, amount: int = 1) -> None:
         """Gradually recover stressed resource nodes over time."""
-        for env in self.world:
-            for node in env.resource_nodes.values():
-                node.stress = max(0, node.stress - amount)
+        self.resources.decay(amount)
+
+    # Clocks are wake-ups on `self.clock` at absolute `elapsed_hours`. The timers
+    # below are views of them, so saves, status and the batch engine see the same
+    # numbers the old per-step countdowns produced. Within a step, seasons turn
+    # before an event ends, and an event ends before the daily roll for a new one.
+
+    @property
+    def season_timer(self) -> int:
+        """Hours into the current season."""
+        return self.season_length_hours - (self.clock.due("season") - self.elapsed_hours)
+
+    @season_timer.setter
+    def season_timer(self, hours: int) -> None:
+        self.clock.schedule("season", self.elapsed_hours + self.season_length_hours - hours, priority=0)
+
+    @property
+    def event_timer(self) -> int:
+        """Hours left on the active event (0 when there is none)."""
+        due = self.clock.due("event_end")
+        return 0 if due is None else due - self.elapsed_hours
+
+    @event_timer.setter
+    def event_timer(self, hours: int) -> None:
+        if self.active_event is None:
+            self.clock.cancel("event_end")
+        else:
+            self.clock.schedule("event_end", self.elapsed_hours + hours, priority=1)
 
-    def _advance_season_clock(self, hrs: int) -> None:
+    @property
+    def event_check_timer(self) -> int:
+        """Hours since the last daily roll for a new event."""
+        return 24 - (self.clock.due("event_check") - self.elapsed_hours)
+
+    @event_check_timer.setter
+    def event_check_timer(self, hours: int) -> None:
+        self.clock.schedule("event_check", self.elapsed_hours + 24 - hours, priority=2)
+
+    def _run_clocks(self) -> None:
+        """Fire every wake-up due by `elapsed_hours` one phase at a time, as the batch engine does.
+
+        All season turns in the step come first, then the event end, then the
+        daily rolls, so an event ending anywhere in a multi-hour step no longer
+        blocks a roll that fell due earlier in it.
+        """
+        now = self.elapsed_hours
+        while (hour := self.clock.take("season", now)) is not None:
+            self._turn_season(hour)
+        if self.clock.take("event_end", now) is not None:
+            self._end_event()
+        while (hour := self.clock.take("event_check", now)) is not None:
+            self._roll_for_event(hour)
+
+    def _turn_season(self, hour: int) -> None:
         """Rotate seasons after fixed in-game hour windows and ease over-harvest stress."""
-        self.season_timer += hrs
-        while self.season_timer >= self.season_length_hours:
-            self.season_timer -= self.season_length_hours
-            self.season_index = (self.season_index + 1) % len(self.seasons)
-            self.current_season = self.seasons[self.season_index]
-            self._reduce_node_stress(1)
-            print(f"\nSeason shift! {self.current_season.name} settles over the land.")
-
-    def _update_event_clock(self, hrs: int) -> None:
-        """Advance active events and roll for rare new events every 24 hours."""
-        if self.active_event:
-            self.event_timer -= hrs
-            if self.event_timer <= 0:
-                print(f"\nEvent fades: {self.active_event.name} passes.")
-                self.active_event = None
-                self.event_timer = 0
-
-        self.event_check_timer += hrs
-        while self.event_check_timer >= 24:
-            self.event_check_timer -= 24
-            if self.active_event is None and random.random() < 0.10:
-                options = self._build_events()
-                if self.current_season.name == "Winter":
-                    options.append(Event("Cold Snap", 20, -3, 0, 0.05, -0.05, -1, "A sharp cold front settles in and hardens surfaces."))
-                self.active_event = random.choice(options)
-                self.event_timer = self.active_event.duration_hours
-                print(f"\nEvent begins: {self.active_event.name}. {self.active_event.description}")
+        self.clock.schedule("season", hour + self.season_length_hours, priority=0)
+        self.season_index = (self.season_index + 1) % len(self.seasons)
+        self.current_season = self.seasons[self.season_index]
+        self.sink.invalidate()
+        self._reduce_node_stress(1)
+        self.sink.emit(Msg.SEASON_SHIFT, season=self.current_season.name)
+
+    def _end_event(self) -> None:
+        self.sink.emit(Msg.EVENT_FADES, event=self.active_event.name)
+        self.active_event = None
+        self.sink.invalidate()
+
+    def _roll_for_event(self, hour: int) -> None:
+        """Roll for a rare new event once every 24 hours; it runs from the end of the current step."""
+        self.clock.schedule("event_check", hour + 24, priority=2)
+        if self.active_event is None and self.rng.events.random() < 0.10:
+            options = self._build_events()
+            if self.current_season.name == "Winter":
+                options.extend(self._build_winter_events())
+            self.active_event = self.rng.events.choice(options)
+            self.sink.invalidate()
+            self.event_timer = self.active_event.duration_hours
+            self.sink.emit(Msg.EVENT_BEGINS, event=self.active_event.name, description=self.active_event.description)
 
     def _update_camp_comfort(self, hrs: int) -> None:
         """Track earned camp comfort from sustained fire and shelter stability."""
@@ -414,19 +705,21 @@ class SurvivalGame:
         if not self.player.fire_lit:
             return
 
+        if self.rng.survival.random() < self._fire_failure_chance(self.player.camp_comfort):
+            self.player.fire_lit = False
+            self.sink.emit(Msg.FIRE_FAILS)
+
+    def _fire_failure_chance(self, camp_comfort: int) -> float:
         fire_mod = self.weather.fire_modifier + self._event_modifier("fire_modifier", 0.0)
         failure_chance = max(0.0, 0.12 - fire_mod)
-        if self.player.camp_comfort >= 6:
+        if camp_comfort >= 6:
             failure_chance = max(0.0, failure_chance - 0.04)
-
-        if random.random() < failure_chance:
-            self.player.fire_lit = False
-            print("A wet gust strips heat from the coals and the ember bed collapses to a dull red.")
+        return failure_chance
 
     def _maybe_print_ambient(self, hrs: int) -> None:
         """Occasionally print lightweight biome ambience based on time, weather, and season."""
         checks = max(1, hrs // 3)
-        if random.random() > (0.20 * checks):
+        if self.rng.ambience.random() > (0.20 * checks):
             return
 
         env = self.current_env()
@@ -438,27 +731,60 @@ class SurvivalGame:
 
         lines = env.soundscape.get(mode) or env.soundscape.get("day") or []
         if lines:
-            print(f"Ambient: {random.choice(lines)}")
+            # The line id is drawn either way to keep the game repeatable; only sinks that show it decode it.
+            self.sink.emit(Msg.AMBIENT, text=env.text, line=self.rng.ambience.choice(lines))
 
     def advance_time(self, hrs: int = 1) -> None:
         p = self.player
         env = self.current_env()
         p.hours = (p.hours + hrs) % 24
-        self._advance_season_clock(hrs)
-        self._update_event_clock(hrs)
+        self.elapsed_hours += hrs
+        self._run_clocks()
         self._update_camp_comfort(hrs)
 
-        if random.random() < 0.35:
-            self.weather = random.choice(self.weather_types)
-            print(f"\nWeather shift! It is now {self.weather.name.lower()}.")
+        current = self.weather_model.index[self.weather.name]
+        following = self.weather_model.step(current, self.season_index, env.temp_bias, self.rng.weather.random())
+        if following != current:
+            self._shift_weather(self.weather_types[following])
+
+        hunger_rate, thirst_rate, temp_step = self._needs_rates(env)
+        p.hunger = min(100, p.hunger + hunger_rate * hrs)
+        p.thirst = min(100, p.thirst + thirst_rate * hrs)
+        p.body_temp += temp_step
+
+        self._update_fire_from_weather()
+        self._regenerate_world_resources(hrs)
+        if p.hours == 0:
+            self._reduce_node_stress(1)
+        self._maybe_print_ambient(hrs)
+        self.resolve_survival()
+
+    def _shift_weather(self, weather: Weather) -> None:
+        self.weather = weather
+        self.sink.invalidate()
+        self.sink.emit(Msg.WEATHER_SHIFT, weather=self.weather.name)
 
+    def _needs_rates(self, env: Environment) -> Tuple[int, int, int]:
+        """Hunger and thirst gained per hour, and the body temperature change per step."""
+        p = self.player
         total_thirst_rate = self.weather.thirst_rate + int(self._event_modifier("thirst_rate", 0))
+        ambient_temp = self._ambient_temp(env)
+
+        temp_step = 0
+        if p.fire_lit:
+            temp_step += 1
+        elif ambient_temp < 34:
+            temp_step -= 1
+        elif ambient_temp > 40:
+            temp_step += 1
+        if p.shelter.level > 0:
+            temp_step += 1 if ambient_temp < 35 else -1 if ambient_temp > 39 else 0
 
         # Balanced baseline progression: hunger rises more slowly than thirst.
-        p.hunger = min(100, p.hunger + (2 + max(0, total_thirst_rate // 2)) * hrs)
-        p.thirst = min(100, p.thirst + (3 + total_thirst_rate) * hrs)
+        return 2 + max(0, total_thirst_rate // 2), 3 + total_thirst_rate, temp_step
 
-        ambient_temp = (
+    def _ambient_temp(self, env: Environment) -> int:
+        return (
             37
             + env.temp_bias
             + self.weather.temperature_shift
@@ -466,72 +792,199 @@ class SurvivalGame:
             + int(self._event_modifier("temp_shift", 0))
         )
 
-        if p.fire_lit:
-            p.body_temp += 1
-        else:
-            if ambient_temp < 34:
-                p.body_temp -= 1
-            elif ambient_temp > 40:
-                p.body_temp += 1
-
-        if p.shelter.level > 0:
-            p.body_temp += 1 if ambient_temp < 35 else -1 if ambient_temp > 39 else 0
-
-        self._update_fire_from_weather()
-        self._regenerate_world_resources(hrs)
-        if p.hours == 0:
-            self._reduce_node_stress(1)
-        self._maybe_print_ambient(hrs)
-        self.resolve_survival()
+    def fast_forward(
+        self,
+        hours: int,
+        *,
+        resting: bool = False,
+        until_healed: bool = False,
+        thirst_limit: int | None = None,
+    ) -> Tuple[int, int]:
+        """Play out up to `hours` idle hours, matching hour-by-hour `advance_time(1)` in distribution.
+
+        Clocks fire at their hours, the weather for the whole stretch comes from
+        one `WeatherModel.changes` call, fire failures are sampled as geometric
+        gaps, and everything between them is integrated in
+        closed form (see `fast_forward.py`), so the cost follows the number of
+        events rather than hours. When `resting`, the player recovers rest
+        health at the start of every 3-hour block, as `rest` does. Stops early
+        at death, once health is full at a resting block (`until_healed`) or once
+        thirst reaches `thirst_limit`. Ambient lines are skipped and each
+        survival warning is reported once. Returns the hours passed and the
+        health recovered.
+        """
+        p = self.player
+        end = self.elapsed_hours + hours
+        weather_changes = iter(self._weather_changes(hours))
+        weather_at, following = next(weather_changes, (end + 1, 0))
+        rest_at = self.elapsed_hours
+        start, healed = self.elapsed_hours, 0
+        warnings: set[str] = set()
+        fatal = None
+        unsettled = 0  # hours of regrowth not logged yet; weather does not affect it, so stretches share a segment
+        while self.elapsed_hours < end and self.running:
+            # Stop before crediting a rest block, so no health is recovered without an hour passing.
+            if thirst_limit is not None and p.thirst >= thirst_limit:
+                break
+            if resting and self.elapsed_hours == rest_at:
+                if until_healed and p.health >= 100:
+                    break
+                healed += self._recover_rest_health()
+                rest_at += REST_HOURS
+
+            # The stretch opens with everything due at the start of its first hour...
+            p.hours = (p.hours + 1) % 24
+            self.elapsed_hours += 1
+            hour = self.elapsed_hours
+            if unsettled and self.clock.next_due() <= hour:  # seasons and events change regrowth
+                self._regenerate_world_resources(unsettled)
+                unsettled = 0
+            self._run_clocks()
+            if hour == weather_at:
+                self._shift_weather(self.weather_types[following])
+                weather_at, following = next(weather_changes, (end + 1, 0))
+
+            # ...and runs on until just before the next one, with every rate fixed.
+            limit = min(end, weather_at - 1, self.clock.next_due() - 1, hour + (-p.hours) % 24)
+            if resting or until_healed:
+                limit = min(limit, rest_at)
+            span = limit - hour + 1
+
+            # Comfort moves an hour at a time, but only its bands (a steadier fire at 6,
+            # a cozy camp at 7) matter, so the stretch ends where it crosses one.
+            sheltered = p.shelter.level > 0
+            comfort = comfort_after(p.camp_comfort, p.fire_lit, sheltered, 1)
+            if comfort_after(p.camp_comfort, p.fire_lit, sheltered, span) != comfort:
+                for k in range(2, min(span, 11) + 1):
+                    later = comfort_after(p.camp_comfort, p.fire_lit, sheltered, k)
+                    if (later >= 6, later >= 7) != (comfort >= 6, comfort >= 7):
+                        span = k - 1
+                        break
+            if unsettled and (comfort >= 7) != (p.camp_comfort >= 7):  # a cozy camp regrows faster
+                self._regenerate_world_resources(unsettled)
+                unsettled = 0
+
+            fire_fails_in = None
+            if p.fire_lit:
+                fire_fails_in = geometric_gap(self.rng.survival.random(), self._fire_failure_chance(comfort))
+                if fire_fails_in is not None:
+                    span = min(span, fire_fails_in)
+
+            hunger_rate, thirst_rate, temp_step = self._needs_rates(self.current_env())
+            if thirst_limit is not None:
+                reached = first_hour_at_least(p.thirst, thirst_rate, thirst_limit)
+                if reached is not None:
+                    span = min(span, reached)
+
+            stretch = integrate(span, p.health, p.hunger, p.thirst, p.body_temp, hunger_rate, thirst_rate, temp_step)
+            p.hours = (p.hours + stretch.hours - 1) % 24
+            self.elapsed_hours += stretch.hours - 1
+            p.camp_comfort = comfort_after(p.camp_comfort, p.fire_lit, sheltered, stretch.hours)
+            p.health, p.hunger, p.thirst, p.body_temp = stretch.health, stretch.hunger, stretch.thirst, stretch.body_temp
+            warnings.update(stretch.causes)
+            if fire_fails_in == stretch.hours:
+                p.fire_lit = False
+                self.sink.emit(Msg.FIRE_FAILS)
+            unsettled += stretch.hours
+            if p.hours == 0:
+                self._regenerate_world_resources(unsettled)
+                unsettled = 0
+                self._reduce_node_stress(1)
+            if stretch.fatal is not None:
+                fatal = stretch.fatal
+                self.running = False
+
+        if unsettled:
+            self._regenerate_world_resources(unsettled)
+        for cause, warning in _WARNINGS.items():
+            if cause in warnings:
+                self.sink.emit(warning)
+        if fatal is not None:
+            self.cause_of_death = "+".join(fatal) or "injury"
+            self.sink.emit(Msg.COLLAPSE)
+        return self.elapsed_hours - start, healed
+
+    def _weather_changes(self, hours: int) -> List[Tuple[int, int]]:
+        """`(hour, weather index)` for each weather change over the next `hours` hourly steps here.
+
+        Seasons turn on a fixed schedule, so the season each step sees is known
+        up front and the whole stretch is drawn in one call.
+        """
+        first = self.elapsed_hours + 1
+        steps = np.arange(first, first + hours)
+        turns = np.maximum(0, (steps - self.clock.due("season")) // self.season_length_hours + 1)
+        seasons = ((self.season_index + turns) % len(self.seasons)).tolist()
+        draws = np.random.default_rng(self.rng.weather.getrandbits(64)).random(hours)
+        model = self.weather_model
+        changes = model.changes(model.index[self.weather.name], seasons, self.current_env().temp_bias, draws)
+        return [(first + step, weather) for step, weather in changes]
 
     def resolve_survival(self) -> None:
         p = self.player
+        causes = []
         if p.hunger >= 90:
             p.health -= 2
-            print("You are starving. Your stomach grumbles in a low, hollow cadence.")
+            causes.append("starvation")
+            self.sink.emit(Msg.STARVING)
         if p.thirst >= 90:
             p.health -= 3
-            print("You are dangerously dehydrated. Your mouth is dry and your tongue sits thick against your palate.")
+            causes.append("dehydration")
+            self.sink.emit(Msg.DEHYDRATED)
         if p.body_temp <= 34:
             p.health -= 5
-            print("Hypothermia risk! Shivering intensifies and fine motor control begins to fade.")
+            causes.append("hypothermia")
+            self.sink.emit(Msg.HYPOTHERMIA)
         if p.body_temp >= 40:
             p.health -= 5
-            print("Hyperthermia risk! Heat stress builds and concentration becomes difficult.")
+            causes.append("hyperthermia")
+            self.sink.emit(Msg.HYPERTHERMIA)
 
         p.body_temp = max(30, min(42, p.body_temp))
         if p.health <= 0:
-            print("\nYou collapse from cumulative exposure and dehydration.")
+            # Damage taken outside the hourly checks (bad water) can finish a player off too.
+            self.cause_of_death = "+".join(causes) or "injury"
+            self.sink.emit(Msg.COLLAPSE)
             self.running = False
 
     def gather(self) -> None:
         env = self.current_env()
+        self._settle_environment(env)
         available_nodes = [n for n in env.resource_nodes.values() if n.count > 0]
         if not available_nodes:
-            print("Local resources are picked clean. Maybe travel and return later.")
+            self.sink.emit(Msg.PICKED_CLEAN)
             self.advance_time()
             return
 
-        node = random.choice(available_nodes)
-        requested = random.randint(1, 3)
+        node = self.rng.gather.choice(available_nodes)
+        requested = self.rng.gather.randint(1, 3)
         gathered = node.harvest(requested)
         self.player.inventory[node.item] += gathered
-        print(f"You gather {gathered} x {node.item} from the {env.terrain.lower()}.")
+        self.sink.emit(Msg.GATHERED, amount=gathered, item=node.item, terrain=env.terrain)
 
         if node.count == 0:
             node.stress = min(10, node.stress + 1)
-            print(f"The nearby {node.item} patch is temporarily depleted and shows little recent regrowth.")
+            self.sink.emit(Msg.PATCH_DEPLETED, item=node.item)
         if node.stress >= 6:
-            print("The patch looks thin from repeated harvesting and recovery is visibly slow.")
+            self.sink.emit(Msg.PATCH_STRESSED)
 
         self.advance_time()
 
     def hunt(self) -> None:
         env = self.current_env()
-        target = random.choice(env.huntables)
-        has_rope = self.player.inventory.get("rope", 0) > 0
+        target = self.rng.hunt.choice(env.huntables)
+        if self.rng.hunt.random() < self._hunt_success_chance(self.player.inventory.get("rope", 0) > 0):
+            meat = self.rng.hunt.randint(1, 3)
+            hide = self.rng.hunt.randint(0, 2)
+            self.player.inventory["raw_meat"] += meat
+            self.player.inventory["hide"] += hide
+            self.sink.emit(Msg.HUNT_SUCCESS, target=target, meat=meat, hide=hide)
+        else:
+            self.sink.emit(Msg.HUNT_ESCAPE, target=target, weather=self.weather.name)
+        self.advance_time(2)
+
+    def _hunt_success_chance(self, has_rope: bool) -> float:
         base_success = 0.45 + (0.15 if has_rope else 0)
-        success = max(
+        return max(
             0.1,
             min(
                 0.9,
@@ -541,42 +994,26 @@ class SurvivalGame:
                 + self._event_modifier("hunt_modifier", 0.0),
             ),
         )
-        if random.random() < success:
-            meat = random.randint(1, 3)
-            hide = random.randint(0, 2)
-            self.player.inventory["raw_meat"] += meat
-            self.player.inventory["hide"] += hide
-            print(f"Successful hunt: {target}. You recover {meat} raw meat and {hide} hide.")
-        else:
-            print(f"The {target} breaks cover and escapes in the current {self.weather.name.lower()} conditions.")
-        self.advance_time(2)
 
     def drink(self) -> None:
         env = self.current_env()
-        source = random.choice(env.water_sources)
-        print(f"You drink from {source.name}.")
-        if source.quality in {"murky", "muddy", "risky", "salty"} and random.random() < 0.25:
+        source = self.rng.survival.choice(env.water_sources)
+        self.sink.emit(Msg.DRINK, source=source.name)
+        if source.quality in RISKY_WATER and self.rng.survival.random() < 0.25:
             self.player.health -= 5
-            print("The water quality was poor; nausea and cramping set in.")
+            self.sink.emit(Msg.BAD_WATER)
         self.player.thirst = max(0, self.player.thirst - 35)
         self.advance_time(1)
 
     def craft(self, item: str) -> None:
         inv = self.player.inventory
-        recipes = {
-            "rope": {"fiber": 3},
-            "spark_crystal": {"stone": 2},
-            "campfire": {"stick": 3, "stone": 2},
-            "lean-to": {"stick": 5, "fiber": 4},
-            "hut": {"stick": 8, "fiber": 6, "hide": 2},
-        }
-        if item not in recipes:
-            print("Unknown craft. Try: rope, spark_crystal, campfire, lean-to, hut")
+        if item not in RECIPES:
+            self.sink.emit(Msg.UNKNOWN_CRAFT)
             return
 
-        need = recipes[item]
+        need = RECIPES[item]
         if any(inv.get(k, 0) < v for k, v in need.items()):
-            print(f"Missing materials for {item}: {need}")
+            self.sink.emit(Msg.MISSING_MATERIALS, item=item, need=need)
             return
 
         for k, v in need.items():
@@ -584,37 +1021,37 @@ class SurvivalGame:
 
         if item == "campfire":
             self.player.fire_lit = True
-            print("You build a campfire and establish a stable heat source.")
+            self.sink.emit(Msg.CAMPFIRE_BUILT)
         elif item == "lean-to":
             self.player.shelter.level = max(self.player.shelter.level, 1)
             self.player.shelter.material = "wood"
-            print("You build a lean-to shelter.")
+            self.sink.emit(Msg.LEAN_TO_BUILT)
         elif item == "hut":
             self.player.shelter.level = max(self.player.shelter.level, 2)
             self.player.shelter.material = "hide & wood"
-            print("You reinforce your camp into a sturdy hut.")
+            self.sink.emit(Msg.HUT_BUILT)
         else:
             inv[item] = inv.get(item, 0) + 1
-            print(f"You craft {item}.")
+            self.sink.emit(Msg.CRAFTED, item=item)
 
         self.advance_time(1)
 
     def cook(self) -> None:
         inv = self.player.inventory
         if not self.player.fire_lit:
-            print("You need a lit campfire to cook.")
+            self.sink.emit(Msg.COOK_NEEDS_FIRE)
             return
         if inv["raw_meat"] <= 0 and inv["mushroom"] <= 0:
-            print("Nothing to cook right now.")
+            self.sink.emit(Msg.NOTHING_TO_COOK)
             return
 
-        cooked = min(inv["raw_meat"], random.randint(1, 2))
+        cooked = min(inv["raw_meat"], self.rng.survival.randint(1, 2))
         inv["raw_meat"] -= cooked
         inv["cooked_meat"] += cooked
-        if inv["mushroom"] > 0 and random.random() < 0.5:
+        if inv["mushroom"] > 0 and self.rng.survival.random() < 0.5:
             inv["mushroom"] -= 1
-            print("You roast a mushroom cap; the aroma is earthy and clean.")
-        print(f"You cook {cooked} meat over the fire.")
+            self.sink.emit(Msg.MUSHROOM_ROASTED)
+        self.sink.emit(Msg.COOKED, amount=cooked)
         self.advance_time(1)
 
     def eat(self) -> None:
@@ -622,49 +1059,127 @@ class SurvivalGame:
         if inv["cooked_meat"] > 0:
             inv["cooked_meat"] -= 1
             self.player.hunger = max(0, self.player.hunger - 35)
-            print("You eat cooked meat and feel your energy return.")
+            self.sink.emit(Msg.ATE_MEAT)
         elif inv["berries"] > 0:
             inv["berries"] -= 1
             self.player.hunger = max(0, self.player.hunger - 15)
-            print("You snack on berries.")
+            self.sink.emit(Msg.ATE_BERRIES)
         elif inv["mushroom"] > 0:
             inv["mushroom"] -= 1
             self.player.hunger = max(0, self.player.hunger - 10)
-            print("You eat a mushroom with caution and monitor for any adverse effects.")
+            self.sink.emit(Msg.ATE_MUSHROOM)
         else:
-            print("You have nothing edible right now.")
+            self.sink.emit(Msg.NOTHING_EDIBLE)
             return
         self.advance_time(1)
 
     def rest(self) -> None:
+        heal = self._recover_rest_health()
+        self.sink.emit(Msg.RESTED, heal=heal)
+        self.advance_time(REST_HOURS)
+
+    def _recover_rest_health(self) -> int:
         heal = 8 + (4 * self.player.shelter.level)
         if self.player.fire_lit:
             heal += 4
         heal += self.player.camp_comfort // 3
         self.player.health = min(100, self.player.health + heal)
-        print(f"You rest in shelter and recover {heal} health.")
-        self.advance_time(3)
+        return heal
+
+    def wait(self, args: str) -> None:
+        """`wait <hours>` or `wait until dawn|healed|thirst <level>`: rest in place for a long stretch."""
+        words = args.split()
+        options: Dict[str, int | bool] = {}
+        if len(words) == 1 and words[0].isdigit():
+            hours = int(words[0])
+        elif words == ["until", "dawn"]:
+            hours = (DAWN_HOUR - self.player.hours) % 24 or 24
+        elif words == ["until", "healed"]:
+            hours, options["until_healed"] = MAX_WAIT_HOURS, True
+        elif len(words) == 3 and words[:2] == ["until", "thirst"] and words[2].isdigit():
+            hours, options["thirst_limit"] = MAX_WAIT_HOURS, int(words[2])
+        else:
+            self.sink.emit(Msg.WAIT_USAGE)
+            return
+        waited, healed = self.fast_forward(min(hours, MAX_WAIT_HOURS), resting=True, **options)
+        if self.running:
+            self.sink.emit(Msg.WAITED, hours=waited, heal=healed)
 
     def travel(self) -> None:
         old = self.current_env().name
-        choices = [i for i in range(len(self.world)) if i != self.player.location]
-        self.player.location = random.choice(choices)
-        print(f"You travel from {old} to {self.current_env().name}.")
+        self.player.location = self.world.destination(self.player.location, self.rng.travel)
+        self.world.visit(self.player.location)
+        self.sink.emit(Msg.TRAVELLED, origin=old, destination=self.current_env().name)
         self.describe_location()
         self.advance_time(2)
 
     def extinguish(self) -> None:
         if self.player.fire_lit:
             self.player.fire_lit = False
-            print("You extinguish the campfire and save some fuel for later.")
+            self.sink.emit(Msg.FIRE_EXTINGUISHED)
             self.advance_time(1)
         else:
-            print("Your fire is already out.")
+            self.sink.emit(Msg.FIRE_ALREADY_OUT)
+
+    def snapshot(self) -> GameSnapshot:
+        """Capture the game's mutable state, e.g. before trying out a command; see `restore`."""
+        return GameSnapshot(
+            player=self.player.copy(),
+            weather=self.weather,
+            season_index=self.season_index,
+            active_event=self.active_event,
+            clock=self.clock.copy(),
+            elapsed_hours=self.elapsed_hours,
+            rng_seed=self.rng.seed,
+            rng_positions=self.rng.getstate(),
+            running=self.running,
+            cause_of_death=self.cause_of_death,
+            world=self.world.snapshot(),
+        )
 
-    def save_game(self, filename: str) -> None:
-        """Serialize player and world progression (including resource depletion) to JSON."""
-        save_path = Path(filename)
-        payload = {
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Return to `snapshot`, which stays valid: restoring it again replays the same game.
+
+        The snapshot may come from this game or from one it was forked from.
+        """
+        self.player = snapshot.player.copy()
+        self.weather = snapshot.weather
+        self.season_index = snapshot.season_index
+        self.current_season = self.seasons[self.season_index]
+        self.active_event = snapshot.active_event
+        self.clock = snapshot.clock.copy()
+        self.elapsed_hours = snapshot.elapsed_hours
+        if self.rng.seed != snapshot.rng_seed:
+            self.rng = GameRng(snapshot.rng_seed)
+        self.rng.setstate(snapshot.rng_positions)
+        self.running = snapshot.running
+        self.cause_of_death = snapshot.cause_of_death
+        self.world.restore(snapshot.world)
+        self.sink.invalidate()
+
+    def fork(self, sink: MessageSink | None = None) -> SurvivalGame:
+        """An independent game in exactly this state, for search agents trying out commands.
+
+        Definitions, text and other immutable state are shared rather than
+        copied. Feedback goes to `sink`, or nowhere by default; the fork keeps
+        no journal or save checkpoint.
+        """
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.sink = sink if sink is not None else NullSink()
+        clone.world = self.world.fork()
+        clone.resources = clone.world.resources
+        clone.player = self.player.copy()
+        clone.clock = self.clock.copy()
+        clone.rng = self.rng.copy()
+        clone.journal = None
+        clone._checkpoint = None
+        clone.instrument(None)  # drops timers bound to this game and rebuilds the command table for the clone
+        return clone
+
+    def _state_payload(self) -> dict:
+        """Everything a save holds except the world's resource nodes."""
+        return {
             "player": {
                 **asdict(self.player),
                 "shelter": asdict(self.player.shelter),
@@ -679,26 +1194,24 @@ class SurvivalGame:
                 "timer": self.event_timer,
                 "check_timer": self.event_check_timer,
             },
-            "world_nodes": [
-                {item: asdict(node) for item, node in env.resource_nodes.items()} for env in self.world
-            ],
+            "elapsed_hours": self.elapsed_hours,
+            "rng": self.rng.to_payload(),
         }
-        save_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        print(f"Game saved to {save_path}.")
 
-    def load_game(self, filename: str) -> None:
-        """Load a prior save file and restore player and world progression."""
-        save_path = Path(filename)
-        if not save_path.exists():
-            print(f"No save file found at {save_path}.")
-            return
+    def _weather_type(self, name: str) -> Weather:
+        """Saves name their weather; its effects and text come from this world's definition."""
+        for weather in self.weather_types:
+            if weather.name == name:
+                return weather
+        raise ValueError(f"Save refers to weather {name!r}, which this world does not have")
 
-        payload = json.loads(save_path.read_text(encoding="utf-8"))
-        player_data = payload["player"]
+    def _apply_state_payload(self, payload: dict) -> None:
+        player_data = dict(payload["player"])
         shelter_data = player_data.pop("shelter")
         self.player = Player(**player_data)
         self.player.shelter = Shelter(**shelter_data)
-        self.weather = Weather(**payload["weather"])
+        self.weather = self._weather_type(payload["weather"]["name"])
+        self.elapsed_hours = payload.get("elapsed_hours", 0)  # first: the timers below count from it
 
         season_data = payload.get("season")
         if season_data:
@@ -711,62 +1224,92 @@ class SurvivalGame:
 
         event_data = payload.get("event", {})
         active = event_data.get("active") if isinstance(event_data, dict) else None
-        self.active_event = Event(**active) if active else None
+        self.active_event = _intern(Event(**active), EVENTS + WINTER_EVENTS) if active else None
         self.event_timer = event_data.get("timer", 0) if isinstance(event_data, dict) else 0
         self.event_check_timer = event_data.get("check_timer", 0) if isinstance(event_data, dict) else 0
+        self.sink.invalidate()
 
-        for env, env_nodes in zip(self.world, payload["world_nodes"]):
-            for item, node_data in env_nodes.items():
-                env.resource_nodes[item] = ResourceNode(**node_data)
-        print(f"Game loaded from {save_path}.")
+        if "rng" in payload:
+            self.rng = GameRng.from_payload(payload["rng"])
 
-    def help(self) -> None:
-        print(
-            """
-Commands:
- look, status, inventory
- gather, hunt, drink, eat, rest, travel
- craft <item>   (rope, spark_crystal, campfire, lean-to, hut)
- cook, extinguish, save [file], load [file], help, quit
-"""
-        )
+    def save_game(self, filename: str) -> None:
+        """Serialize player and world progression (including resource depletion).
 
-    def run(self) -> None:
-        print("\n🌲 Campfire Cantos: a tiny survival fantasy 🌲")
-        print("You awaken with one stone, one stick, and a clear need to make practical choices.")
-        self.describe_location()
-        self.help()
+        Files named `*.ccsave` use the compact binary format, where repeated
+        saves to the same file append deltas; anything else is written as JSON.
+        """
+        save_path = Path(filename)
+        if save_path.suffix == save_format.BINARY_SUFFIX:
+            self._checkpoint = self.write_binary_save(save_path, self._checkpoint)
+        else:
+            payload = self._state_payload()
+            payload["world_nodes"] = self.world.nodes_payload()
+            save_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            self._checkpoint = None
+        self.sink.emit(Msg.GAME_SAVED, path=save_path)
 
-        while self.running:
-            self.status()
-            cmd = input("\n> ").strip().lower()
-            if not cmd:
-                continue
-            self.execute_command(cmd)
+    def load_game(self, filename: str) -> None:
+        """Load a prior JSON or binary save file and restore player and world progression."""
+        save_path = Path(filename)
+        if not save_path.exists():
+            self.sink.emit(Msg.NO_SAVE_FILE, path=save_path)
+            return
 
+        if save_format.is_binary_save(save_path):
+            self._checkpoint = self.read_binary_save(save_path)
+        else:
+            payload = json.loads(save_path.read_text(encoding="utf-8"))
+            self._apply_state_payload(payload)
+            self.world.load_nodes_payload(payload["world_nodes"])
+            self.world.visit(self.player.location)
+            self._checkpoint = None
+        self.sink.emit(Msg.GAME_LOADED, path=save_path)
+
+    def write_binary_save(self, path: Path, checkpoint: save_format.Checkpoint | None = None) -> save_format.Checkpoint:
+        """Write the game in the binary format without emitting anything; a delta if `checkpoint` allows."""
+        return save_format.write_save(
+            path,
+            save_format.flatten(self._state_payload()),
+            self.world.node_records(),
+            self.resources.items,
+            checkpoint,
+        )
 
-def main() -> None:
-    SurvivalGame().run()
+    def read_binary_save(self, path: Path) -> save_format.Checkpoint:
+        """Restore a binary save without emitting anything."""
+        fields, records, checkpoint = save_format.read_save(path, self.resources.items)
+        self._apply_binary_state(fields, records)
+        return checkpoint
+
+    def to_save_bytes(self) -> bytes:
+        """The whole game as one binary save, e.g. for a database blob."""
+        return save_format.encode_save(
+            save_format.flatten(self._state_payload()),
+            self.world.node_records(),
+            self.resources.items,
+        )
 
+    def load_save_bytes(self, data: bytes) -> None:
+        fields, records, _, _ = save_format.decode_save(data, self.resources.items)
+        self._apply_binary_state(fields, records)
+        self._checkpoint = None
 
-if __name__ == "__main__":
-    main()
-    
-            """
-Commands:
- look, status, inventory
- gather, hunt, drink, eat, rest, travel
- craft <item>   (rope, spark_crystal, campfire, lean-to, hut)
- cook, extinguish, save [file], load [file], help, quit
-"""
-        )
+    def _apply_binary_state(self, fields: dict, records: np.ndarray) -> None:
+        self._apply_state_payload(save_format.unflatten(fields))
+        self.world.load_node_records(records)
+        self.world.visit(self.player.location)
 
-    def run(self) -> None:
-        print("\n🌲 Campfire Cantos: a tiny survival fantasy 🌲")
-        print("You awaken with one stone, one stick, and too much confidence.")
+    def help(self) -> None:
+        self.sink.emit(Msg.HELP)
+
+    def intro(self) -> None:
+        self.sink.emit(Msg.BANNER)
         self.describe_location()
         self.help()
 
+    def run(self) -> None:
+        self.intro()
+
         while self.running:
             self.status()
             cmd = input("\n> ").strip().lower()
@@ -776,7 +1319,23 @@ Commands:
 
 
 def main() -> None:
-    SurvivalGame().run()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, help="replay a specific game (default: a fresh random seed)")
+    parser.add_argument("--journal", metavar="DIR", help="journal commands here and resume from it after a crash")
+    parser.add_argument("--metrics", metavar="PATH", help="time stages and commands, writing a JSON snapshot on exit")
+    sampling_profiler.add_arguments(parser)
+    args = parser.parse_args()
+    game = SurvivalGame(seed=args.seed)
+    if args.metrics:
+        game.instrument(Metrics())
+    if args.journal:
+        CommandJournal(args.journal).recover(game)
+    try:
+        with sampling_profiler.profiling(args):
+            game.run()
+    finally:
+        if game.metrics is not None:
+            game.metrics.write(args.metrics)
 
 
 if __name__ == "__main__":
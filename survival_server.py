@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Asyncio line-protocol server hosting many Campfire Cantos sessions in one event loop.
+
+Connect with `telnet host port` or `nc host port`; every line is one command.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+import secrets
+import statistics
+import struct
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Set
+
+import sampling_profiler
+from instrumentation import Metrics
+from messages import BufferSink, Msg
+from save_store import SaveStore
+from survival_moo import SurvivalGame
+
+PROMPT = "\n> "
+MAX_LINE_BYTES = 1024
+FILE_COMMANDS = {"save", "load"}
+SESSION_COMMANDS = {"save", "load", "saves", "player"}
+# What reading a damaged, foreign or truncated save can raise, from the file system to the JSON and binary decoders.
+SAVE_ERRORS = (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError, struct.error)
+
+
+class LatencyStats:
+    """Collects per-command latencies in seconds and reports percentiles."""
+
+    def __init__(self) -> None:
+        self.samples: List[float] = []
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": len(self.samples),
+            "mean_ms": statistics.fmean(self.samples) * 1000 if self.samples else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": max(self.samples, default=0.0) * 1000,
+        }
+
+
+class GameSession:
+    """One connected player: owns a game and turns command lines into that game's output text.
+
+    File saves go to the player's own directory under `save_dir`. With a
+    `store`, `save`/`load` use the player's slots in it instead of files;
+    `player <name>` picks whose slots those are and `saves` lists them. Ids in
+    `claimed` (shared by a server's live sessions) belong to one session at a time.
+    """
+
+    def __init__(
+        self,
+        game: SurvivalGame,
+        save_dir: Path,
+        store: SaveStore | None = None,
+        player_id: str = "guest",
+        claimed: Set[str] | None = None,
+    ) -> None:
+        self.game = game
+        self.sink = game.sink = BufferSink()
+        self.save_dir = save_dir
+        self.store = store
+        self.player_id = player_id
+        self.claimed = set() if claimed is None else claimed
+        self.claimed.add(player_id)
+
+    def _capture(self, action: Callable[[], None]) -> str:
+        action()
+        if self.game.running:
+            self.game.status()
+        return self.sink.drain_text()
+
+    def opening(self) -> str:
+        return self._capture(self.game.intro) + PROMPT
+
+    def handle(self, line: str) -> str:
+        """Run one command line and return everything the session should see, ending in a prompt."""
+        cmd = line.strip().lower()
+        if not cmd:
+            return PROMPT.lstrip("\n")
+        command, _, args = cmd.partition(" ")
+        if self.store is not None and command in SESSION_COMMANDS:
+            text = self._capture(lambda: self._store_command(command, args.strip()))
+            return text + PROMPT
+        if command in FILE_COMMANDS:
+            return self._capture(lambda: self._file_command(command, args.strip())) + PROMPT
+        text = self._capture(lambda: self.game.execute_command(cmd))
+        return text if not self.game.running else text + PROMPT
+
+    def _file_command(self, command: str, args: str) -> None:
+        # Clients never choose server paths: saves live in this player's part of the save directory.
+        name = Path(args or "savegame.json").name
+        if name in ("", ".", ".."):
+            self.sink.emit(Msg.BAD_SAVE_NAME, name=args)
+            return
+        path = self.save_dir / self.player_id / name
+        before = self.game.snapshot()
+        try:
+            if command == "save":
+                path.parent.mkdir(parents=True, exist_ok=True)
+            self.game.execute_command(f"{command} {path}")
+        except SAVE_ERRORS as exc:
+            self.game.restore(before)
+            reason = (exc.strerror or "file error") if isinstance(exc, OSError) else "not a save file"
+            self.sink.emit(Msg.SAVE_FAILED, command=command, path=name, reason=reason)
+
+    def _store_command(self, command: str, args: str) -> None:
+        slot = args or "autosave"
+        if command == "player":
+            if args and args != self.player_id:
+                if args in self.claimed:
+                    self.sink.emit(Msg.PLAYER_TAKEN, player=args)
+                    return
+                self.claimed.discard(self.player_id)
+                self.claimed.add(args)
+                self.player_id = args
+            self.sink.emit(Msg.PLAYER, player=self.player_id)
+        elif command == "saves":
+            self.sink.emit(Msg.SAVE_SLOTS, slots=tuple(self.store.recent(self.player_id, 10)))
+        elif command == "save":
+            self.store.save(self.player_id, slot, self.game)
+            self.sink.emit(Msg.GAME_SAVED, path=f"slot {slot!r}")
+        elif self.store.load(self.player_id, slot, self.game):
+            self.sink.emit(Msg.GAME_LOADED, path=f"slot {slot!r}")
+        else:
+            self.sink.emit(Msg.NO_SAVE_FILE, path=f"slot {slot!r}")
+
+
+class GameServer:
+    """Accepts connections and gives each its own independent `SurvivalGame`."""
+
+    def __init__(
+        self,
+        game_factory: Callable[[], SurvivalGame] = SurvivalGame,
+        save_dir: str | Path = "saves",
+        max_sessions: int = 10_000,
+        store: SaveStore | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
+        """With a `store`, saves go to its slots and are committed once per event-loop pass.
+
+        With `metrics`, every session's stages and commands are timed into it.
+        """
+        self.game_factory = game_factory
+        self.metrics = metrics
+        self.save_dir = Path(save_dir)
+        self.store = store
+        self._flush_scheduled = False
+        self.max_sessions = max_sessions
+        self.sessions: Dict[int, GameSession] = {}
+        self.players: Set[str] = set()  # player ids held by live sessions
+        self.latency = LatencyStats()
+        self._next_id = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 4000, backlog: int = 1024) -> asyncio.Server:
+        self.save_dir.mkdir(parents=True, exist_ok=True)
+        return await asyncio.start_server(self._serve_client, host, port, limit=MAX_LINE_BYTES, backlog=backlog)
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(b"The campfire is full tonight. Try again later.\n")
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+            return
+
+        session_id = self._next_id
+        self._next_id += 1
+        game = self.game_factory()
+        if self.metrics is not None:
+            game.instrument(self.metrics)
+        # Guest ids are random so a restarted server never hands out an earlier guest's saves.
+        session = GameSession(game, self.save_dir, self.store, f"guest-{secrets.token_hex(4)}", self.players)
+        self.sessions[session_id] = session
+        try:
+            writer.write(session.opening().encode("utf-8"))
+            await writer.drain()
+            while session.game.running:
+                try:
+                    raw = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b"Line too long.\n")
+                    break
+                if not raw:
+                    break
+                started = time.perf_counter()
+                writer.write(session.handle(raw.decode("utf-8", errors="replace")).encode("utf-8"))
+                self._schedule_flush()
+                await writer.drain()
+                self.latency.add(time.perf_counter() - started)
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[session_id]
+            self.players.discard(session.player_id)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _schedule_flush(self) -> None:
+        """Commit every save queued during this pass of the event loop in one transaction."""
+        if self.store is None or self._flush_scheduled or not self.store.pending:
+            return
+        self._flush_scheduled = True
+
+        def flush() -> None:
+            self._flush_scheduled = False
+            self.store.flush()
+
+        asyncio.get_running_loop().call_soon(flush)
+
+
+async def _load_client(host: str, port: int, commands: List[str], latency: LatencyStats, think: float) -> None:
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+    await reader.readuntil(b"> ")
+    for command in commands:
+        if think:
+            await asyncio.sleep(random.uniform(0, 2 * think))
+        started = time.perf_counter()
+        writer.write(command.encode("utf-8") + b"\n")
+        await writer.drain()
+        await reader.readuntil(b"> ")
+        latency.add(time.perf_counter() - started)
+    writer.close()
+
+
+async def run_load_test(
+    sessions: int,
+    commands_per_session: int,
+    save_dir: str | Path = "saves",
+    think: float = 0.0,
+    metrics: Metrics | None = None,
+) -> Dict[str, Dict[str, float]]:
+    """Drive `sessions` concurrent clients against an in-process server on one event loop.
+
+    `server` latency is line received to reply flushed; `client_round_trip` also
+    includes queueing behind every other client sharing the loop. `think` is the
+    mean pause in seconds a client takes before each command. The server's
+    games are timed into `metrics` if given.
+    """
+    server = GameServer(save_dir=save_dir, max_sessions=sessions, metrics=metrics)
+    listener = await server.start("127.0.0.1", 0, backlog=sessions)
+    port = listener.sockets[0].getsockname()[1]
+    script = ["look", "gather", "status", "drink", "inventory", "craft rope", "hunt", "eat"]
+    commands = [script[i % len(script)] for i in range(commands_per_session)]
+    client_latency = LatencyStats()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_load_client("127.0.0.1", port, commands, client_latency, think) for _ in range(sessions)))
+    elapsed = time.perf_counter() - started
+    while server.sessions:
+        await asyncio.sleep(0.01)  # let handlers record their final replies and see EOF
+    listener.close()
+    await listener.wait_closed()
+    return {
+        "server": server.latency.summary(),
+        "client_round_trip": client_latency.summary(),
+        "totals": {"sessions": sessions, "seconds": elapsed, "commands_per_sec": sessions * commands_per_session / elapsed},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--save-dir", default="saves")
+    parser.add_argument("--save-db", metavar="PATH", help="keep save slots in this SQLite database")
+    parser.add_argument("--load-test", type=int, metavar="SESSIONS", help="measure latency with this many clients")
+    parser.add_argument("--commands", type=int, default=20, help="commands per load-test client")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean client pause before each command")
+    parser.add_argument("--metrics", metavar="PATH", help="time stages and commands across sessions, writing JSON on exit")
+    sampling_profiler.add_arguments(parser)
+    args = parser.parse_args()
+    metrics = Metrics() if args.metrics else None
+
+    if args.load_test:
+        load_test = run_load_test(args.load_test, args.commands, args.save_dir, args.think_ms / 1000, metrics)
+        with sampling_profiler.profiling(args):
+            report = asyncio.run(load_test)
+        for section, values in report.items():
+            print(section, " ".join(f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}" for k, v in values.items()))
+        if metrics is not None:
+            metrics.write(args.metrics)
+        return
+
+    async def serve() -> None:
+        store = SaveStore(args.save_db) if args.save_db else None
+        listener = await GameServer(save_dir=args.save_dir, store=store, metrics=metrics).start(args.host, args.port)
+        print(f"Campfire Cantos listening on {args.host}:{args.port}")
+        async with listener:
+            await listener.serve_forever()
+
+    try:
+        with sampling_profiler.profiling(args):
+            asyncio.run(serve())
+    finally:
+        if metrics is not None:
+            metrics.write(args.metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import benchmarks
+from world_gen import ProceduralWorld
+
+
+def test_suite_reports_every_case_and_size_as_json():
+    report = benchmarks.run_suite(sizes=["static", 400], cases=["advance_time_3h", "save_load_round_trip"], repeat=1, min_time=0)
+
+    rows = json.loads(json.dumps(report))["results"]
+    assert [(r["case"], r["world_size"]) for r in rows] == [
+        ("advance_time_3h", "static"),
+        ("save_load_round_trip", "static"),
+        ("advance_time_3h", 400),
+        ("save_load_round_trip", 400),
+    ]
+    assert all(r["best_us"] > 0 and r["number"] >= 1 for r in rows)
+
+
+def test_memory_report_counts_bytes_per_session():
+    report = benchmarks.run_suite(sizes=["static", 9], cases=["advance_time_1h"], repeat=1, min_time=0, memory_sessions=20)
+
+    row, procedural = report["memory"]
+    assert row["world_size"] == "static" and row["sessions"] == 20
+    assert 0 < row["bytes_per_session"] < 64_000
+    assert procedural["world_size"] == 9 and procedural["bytes_per_session"] > row["bytes_per_session"]
+
+
+def test_procedural_sessions_pay_for_their_own_world(monkeypatch):
+    worlds = []
+
+    def world(*args, **kwargs):
+        worlds.append(ProceduralWorld(*args, **kwargs))
+        return worlds[-1]
+
+    monkeypatch.setattr(benchmarks, "ProceduralWorld", world)
+    row = benchmarks.session_bytes(400, seed=0, sessions=3)
+
+    assert row["sessions"] == 3 and row["bytes_per_session"] > 0
+    assert len({id(w) for w in worlds}) == 1 + 3  # the warm-up game's, then one per measured session
@@ -0,0 +1,101 @@
+import random
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+from fast_forward import integrate
+from messages import BufferSink, Msg, NullSink
+from survival_moo import SurvivalGame
+
+
+def _hourly(hours, health, hunger, thirst, body_temp, hunger_rate, thirst_rate, temp_step):
+    for hour in range(1, hours + 1):
+        hunger = min(100, hunger + hunger_rate)
+        thirst = min(100, thirst + thirst_rate)
+        body_temp += temp_step
+        health -= 2 * (hunger >= 90) + 3 * (thirst >= 90) + 5 * (body_temp <= 34) + 5 * (body_temp >= 40)
+        body_temp = max(30, min(42, body_temp))
+        if health <= 0:
+            return hour, health, hunger, thirst, body_temp
+    return hours, health, hunger, thirst, body_temp
+
+
+def test_integrate_matches_hourly_steps():
+    rng = random.Random(11)
+    for _ in range(2000):
+        args = (
+            rng.randint(1, 40),
+            rng.randint(-5, 100),
+            rng.randint(0, 100),
+            rng.randint(0, 100),
+            rng.randint(30, 42),
+            rng.randint(2, 4),
+            rng.randint(-2, 6),
+            rng.randint(-2, 2),
+        )
+        stretch = integrate(*args)
+        assert (stretch.hours, stretch.health, stretch.hunger, stretch.thirst, stretch.body_temp) == _hourly(*args)
+        assert (stretch.fatal is not None) == (stretch.health <= 0)
+
+
+def _campfire_game(seed):
+    game = SurvivalGame(sink=NullSink(), seed=seed)
+    game.player.fire_lit = True
+    game.player.camp_comfort = 3
+    game.player.health = 10**6  # outlive the stretch, so every hour counts
+    return game
+
+
+def test_fast_forward_matches_hourly_stepping_in_distribution():
+    stepped, skipped = [], []
+    for seed in range(400):
+        game = _campfire_game(seed)
+        for _ in range(72):
+            game.advance_time(1)
+        stepped.append(game)
+        game = _campfire_game(10_000 + seed)
+        assert game.fast_forward(72) == (72, 0)
+        skipped.append(game)
+
+    for stat in (
+        lambda g: g.player.health,
+        lambda g: g.player.body_temp,
+        lambda g: g.player.camp_comfort,
+        lambda g: g.player.fire_lit,
+        lambda g: g.weather.thirst_rate,
+        lambda g: g.active_event is not None,
+    ):
+        a, b = [stat(g) for g in stepped], [stat(g) for g in skipped]
+        spread = ((statistics.pvariance(a) + statistics.pvariance(b)) / len(a)) ** 0.5
+        assert abs(statistics.mean(a) - statistics.mean(b)) <= 4 * spread + 1e-9
+
+
+def test_wait_until_conditions():
+    game = SurvivalGame(sink=BufferSink(), seed=2)
+    game.player.hours = 20
+    game.execute_command("wait until dawn")
+    assert game.player.hours == 6 and game.elapsed_hours == 10
+
+    game.player.thirst = 10
+    game.execute_command("wait until thirst 40")
+    assert game.player.thirst >= 40
+    assert [msg for msg, _ in game.sink.records][-1] is Msg.WAITED
+
+    game.execute_command("wait until noon")
+    assert game.sink.records[-1][0] is Msg.WAIT_USAGE
+
+
+def test_wait_until_reached_thirst_recovers_nothing():
+    game = SurvivalGame(sink=BufferSink(), seed=2)
+    game.player.health, game.player.thirst = 20, 50
+    for _ in range(3):
+        game.execute_command("wait until thirst 50")
+
+    assert game.player.health == 20 and game.elapsed_hours == 0
+    assert game.sink.records[-1] == (Msg.WAITED, {"hours": 0, "heal": 0})
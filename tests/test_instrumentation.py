@@ -0,0 +1,51 @@
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from instrumentation import Metrics
+from messages import NullSink
+from survival_moo import TIMED_STAGES, SurvivalGame
+
+SCRIPT = ["gather", "drink", "hunt", "rest", "wait 30", "eat", "look"]
+
+
+def _play(game):
+    for command in SCRIPT:
+        game.execute_command(command)
+    return game._state_payload()
+
+
+def test_instrumented_games_play_the_same_and_report_every_stage():
+    metrics = Metrics()
+    game = SurvivalGame(sink=NullSink(), seed=4)
+    game.instrument(metrics)
+
+    assert _play(game) == _play(SurvivalGame(sink=NullSink(), seed=4))
+    snapshot = json.loads(metrics.to_json())
+    timers = snapshot["timers"]
+    assert {f"command.{command.split()[0]}" for command in SCRIPT} <= set(timers)
+    assert {"stage.camp_comfort", "stage.fire_check", "stage.world_regen", "stage.survival"} <= set(timers)
+    assert timers["command.gather"]["calls"] == 1 and timers["command.gather"]["total_ms"] > 0
+    counters = snapshot["counters"]
+    assert counters["hours_fast_forwarded"] > 0
+    assert counters["hours_stepped"] + counters["hours_fast_forwarded"] == game.elapsed_hours
+
+
+def test_uninstrumenting_and_forking_leave_plain_methods():
+    metrics = Metrics()
+    game = SurvivalGame(sink=NullSink(), seed=4)
+    game.instrument(metrics)
+    fork = game.fork()
+    fork.execute_command("gather")
+    assert metrics.timers["command.gather"][0] == 0 and fork.metrics is None
+
+    game.instrument(None)
+    assert not set(TIMED_STAGES) & set(vars(game)) and "advance_time" not in vars(game)
+    game.execute_command("gather")
+    assert metrics.timers["command.gather"][0] == 0
+
+    metrics.count("x", 3)
+    metrics.reset()
+    assert metrics.snapshot()["counters"] == {}
@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import survival_moo
+from journal import CommandJournal
+from messages import BufferSink, NullSink
+
+SCRIPT = ["gather", "look", "hunt", "drink", "travel", "craft rope", "rest", "cook", "eat", "status"] * 5
+
+
+def test_recovery_replays_journal_tail_silently(tmp_path):
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=11)
+    CommandJournal(tmp_path, snapshot_every=7).attach(game)
+    for command in SCRIPT:
+        game.execute_command(command)
+    # Simulated crash: the game object is simply abandoned.
+
+    sink = BufferSink()
+    recovered = survival_moo.SurvivalGame(sink=sink, seed=0)
+    journal = CommandJournal(tmp_path, snapshot_every=7)
+
+    assert journal.recover(recovered)
+    assert sink.records == []
+    assert recovered._state_payload() == game._state_payload()
+    assert (recovered.world.node_records() == game.world.node_records()).all()
+    assert len(list(tmp_path.glob("snapshot-*"))) == 1
+
+
+def test_torn_last_entry_is_dropped(tmp_path):
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=12)
+    CommandJournal(tmp_path, snapshot_every=100).attach(game)
+    for command in SCRIPT[:6]:
+        game.execute_command(command)
+    expected = game._state_payload()
+    game.execute_command("rest")
+    log = next(tmp_path.glob("journal-*.log"))
+    log.write_bytes(log.read_bytes()[:-4])
+
+    recovered = survival_moo.SurvivalGame(sink=NullSink(), seed=0)
+    CommandJournal(tmp_path).recover(recovered)
+
+    assert recovered._state_payload() == expected
@@ -0,0 +1,99 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import messages
+import survival_moo
+from messages import BufferSink, Msg, NullSink
+
+
+def test_stdout_sink_reproduces_console_text(monkeypatch, capsys):
+    game = survival_moo.SurvivalGame()
+    monkeypatch.setattr(game, "advance_time", lambda hrs=1: None)
+    node = next(iter(game.current_env().resource_nodes.values()))
+    monkeypatch.setattr(game.rng.gather, "choice", lambda seq: node)
+    monkeypatch.setattr(game.rng.gather, "randint", lambda a, b: 1)
+
+    game.gather()
+    game.execute_command("craft")
+
+    assert capsys.readouterr().out == (
+        f"You gather 1 x {node.item} from the {game.current_env().terrain.lower()}.\n"
+        "Usage: craft <item>\n"
+    )
+
+
+def test_null_sink_never_formats(monkeypatch, capsys):
+    def explode(msg, params):
+        raise AssertionError(f"{msg} was rendered")
+
+    monkeypatch.setattr(messages, "render", explode)
+    game = survival_moo.SurvivalGame(sink=NullSink())
+    for command in ["look", "status", "inventory", "gather", "hunt", "drink", "travel", "rest", "help"]:
+        game.execute_command(command)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_buffer_sink_keeps_typed_records_until_rendered():
+    sink = BufferSink()
+    game = survival_moo.SurvivalGame(sink=sink)
+
+    game.execute_command("bogus")
+
+    assert sink.records == [(Msg.UNKNOWN_COMMAND, {})]
+    assert sink.drain_text() == "Unknown command. Type 'help' for options.\n"
+    assert sink.records == []
+
+
+def test_repeated_look_renders_once_until_conditions_change(monkeypatch):
+    sink = BufferSink()
+    game = survival_moo.SurvivalGame(sink=sink, seed=5)
+    calls = []
+    real_render = messages.render
+    monkeypatch.setattr(messages, "render", lambda msg, params: calls.append(msg) or real_render(msg, params))
+
+    game.describe_location()
+    first = sink.drain_text()
+    for _ in range(3):
+        game.describe_location()
+        assert sink.drain_text() == first
+    assert calls == [Msg.LOCATION]
+
+    game.weather = next(w for w in game.weather_types if w is not game.weather)
+    game.sink.invalidate()
+    game.describe_location()
+    assert sink.drain_text() != first
+    assert calls == [Msg.LOCATION, Msg.LOCATION]
+
+
+def test_render_cache_is_lru_bounded():
+    cache = messages.RenderCache(maxsize=2)
+    status = dict(health=100, hunger=0, thirst=0, body_temp=37, shelter="None", fire_lit=False, season="Spring",
+                  event=None, event_timer=0, camp_comfort=0)
+    for hours in (1, 2, 1, 3):
+        cache.render(Msg.STATUS, dict(status, hours=hours))
+
+    assert [key[-1] for key, _ in cache.entries.values()] == [1, 3]
+
+
+def test_ambient_lines_are_decoded_only_when_shown(monkeypatch):
+    loud = survival_moo.SurvivalGame(sink=BufferSink(), seed=8)
+    quiet = survival_moo.SurvivalGame(sink=NullSink(), seed=8)
+    for _ in range(60):
+        loud.advance_time(1)
+    ambient = [params for msg, params in loud.sink.records if msg is Msg.AMBIENT]
+    assert ambient and f"Ambient: {ambient[0]['text'][ambient[0]['line']]}" in loud.sink.drain_text()
+
+    def explode(table, text_id):
+        raise AssertionError("a silent game decoded text")
+
+    monkeypatch.setattr(type(quiet.current_env().text), "__getitem__", explode)
+    for _ in range(60):
+        quiet.advance_time(1)
+    assert quiet.elapsed_hours == loud.elapsed_hours
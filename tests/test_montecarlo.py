@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import montecarlo
+
+
+def test_sharding_is_deterministic_across_worker_counts():
+    kwargs = dict(runs=12, start_seed=100, shard_size=5, max_hours=150)
+    serial, _ = montecarlo.run_monte_carlo(montecarlo.forager, workers=0, **kwargs)
+    pooled, runs_per_sec = montecarlo.run_monte_carlo(montecarlo.forager, workers=2, **kwargs)
+
+    assert serial.summary() == pooled.summary()
+    assert serial.runs == 12 and runs_per_sec > 0
+    assert [len(s) for s in montecarlo.shard_seeds(100, 12, 5)] == [5, 5, 2]
+
+
+def test_idle_policy_dies_reproducibly():
+    result = montecarlo.play(montecarlo.idle, seed=3)
+
+    assert result.cause_of_death != "survived"
+    assert result.hours_survived > 0
+    assert result == montecarlo.play(montecarlo.idle, seed=3)
@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import planner
+from messages import NullSink
+from survival_moo import SurvivalGame
+
+
+def test_search_is_silent_repeatable_and_reuses_its_tree():
+    game = SurvivalGame(sink=NullSink(), seed=5)
+    before = game._state_payload()
+    choices = [planner.MctsPlanner(iterations=40, horizon_hours=24, seed=1) for _ in range(2)]
+    commands = [p.choose(game) for p in choices]
+
+    assert game._state_payload() == before
+    assert commands[0] == commands[1] and commands[0] in planner.legal_commands(game)
+    stats = choices[0].last_stats
+    assert stats.rollouts == 40 and stats.rollouts_per_sec > 0
+    assert sum(stats.visits.values()) == 40
+
+    subtree = choices[0].root.children[commands[0]]
+    game.execute_command(commands[0])
+    choices[0].advance(commands[0])
+    assert choices[0].root is subtree and subtree.visits == stats.visits[commands[0]]
+
+
+def test_planner_drinks_before_dying_of_thirst():
+    game = SurvivalGame(sink=NullSink(), seed=6)
+    game.player.thirst = 95
+    game.player.health = 12
+
+    assert planner.MctsPlanner(iterations=60, horizon_hours=12).choose(game) == "drink"
+
+
+def test_rollouts_run_on_worker_processes():
+    game = SurvivalGame(sink=NullSink(), seed=7)
+    with planner.MctsPlanner(iterations=16, horizon_hours=12, workers=2, batch=2) as search:
+        command = search.step(game)
+
+    assert command in search.last_stats.visits
+    assert search.last_stats.rollouts == 16
+    assert game.elapsed_hours > 0
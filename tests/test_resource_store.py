@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import resource_store
+from resource_store import ResourceStore
+from world_data import WORLD_DATA
+
+
+def _hourly_reference(count, max_count, regen, stress, steps):
+    """Walk the original hour-by-hour rules for one node."""
+    for hrs, modifier, decays_before, decays_after in steps:
+        stress = max(0, stress - decays_before)
+        for _ in range(hrs):
+            count = min(max_count, count + max(0, regen + modifier - stress // 3))
+        stress = max(0, stress - decays_after)
+    return count, stress
+
+
+def test_settle_matches_hourly_regen_across_stress_phases():
+    store = ResourceStore(2, ["berries", "stick"])
+    store.set_node(0, "berries", 0, 40, 1, stress=10)
+    store.set_node(1, "stick", 3, 40, 2, stress=5)
+    steps = [(3, 1, 0, 0), (2, -1, 1, 0), (1, 0, 0, 1), (3, -2, 2, 0), (3, 1, 0, 1), (2, 0, 3, 0), (1, 2, 0, 0)]
+    for hrs, modifier, decays_before, decays_after in steps:
+        store.decay(decays_before)
+        store.record(hrs, modifier)
+        store.decay(decays_after)
+
+    store.settle_all()
+
+    berries = store.nodes(0)["berries"]
+    stick = store.nodes(1)["stick"]
+    assert (berries.count, berries.stress) == _hourly_reference(0, 40, 1, 10, steps)
+    assert (stick.count, stick.stress) == _hourly_reference(3, 40, 2, 5, steps)
+
+
+def test_compaction_keeps_lazy_results(monkeypatch):
+    monkeypatch.setattr(resource_store, "LEDGER_COMPACT_SEGMENTS", 4)
+    lazy = ResourceStore.from_world_data(WORLD_DATA)
+    eager = ResourceStore.from_world_data(WORLD_DATA)
+    lazy.count[:] = 0
+    eager.count[:] = 0
+    lazy.mark_all()
+    eager.mark_all()
+
+    for step in range(10):
+        for store in (lazy, eager):
+            store.record(1, step % 3 - 1)
+            store.decay(step % 2)
+        eager.settle_all()
+
+    lazy.settle_all()
+    assert lazy.ledger.position < 10
+    assert (lazy.count == eager.count).all()
+    assert (lazy.stress == eager.stress).all()
+
+
+def test_payload_round_trip_keeps_definition_order():
+    store = ResourceStore.from_world_data(WORLD_DATA)
+    store.nodes(1)["stone"].count = 2
+
+    restored = ResourceStore.from_world_data(WORLD_DATA)
+    restored.load_payload(store.to_payload())
+
+    assert list(restored.nodes(0)) == list(WORLD_DATA[0]["resource_nodes"])
+    assert restored.nodes(1)["stone"].count == 2
+    assert restored.to_payload() == store.to_payload()
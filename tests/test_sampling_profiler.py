@@ -0,0 +1,58 @@
+import signal
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from messages import NullSink
+from sampling_profiler import SamplingProfiler, collapse
+from survival_moo import SurvivalGame
+
+
+def _busy(seconds):
+    deadline = time.process_time() + seconds
+    while time.process_time() < deadline:
+        pass
+
+
+def _game_with_slow_gather():
+    game = SurvivalGame(sink=NullSink(), seed=3)
+    gather = game.commands["gather"]
+
+    def slow_gather(args):
+        _busy(0.1)
+        gather(args)
+
+    game.commands["gather"] = slow_gather
+    return game
+
+
+def test_collapse_roots_stacks_at_the_running_command():
+    game = SurvivalGame(sink=NullSink(), seed=3)
+    seen = []
+    game.commands["look"] = lambda args: seen.append(collapse(sys._getframe()))
+    game.execute_command("look around")
+
+    frames = seen[0].split(";")
+    assert frames[0] == "command:look"
+    assert any(frame.startswith("survival_moo.") and frame.endswith("execute_command") for frame in frames)
+    assert collapse(sys._getframe()).startswith("command:-;")
+
+
+@pytest.mark.parametrize("mode", ["thread", "signal"])
+def test_samples_land_under_the_command_being_executed(tmp_path, mode):
+    if mode == "signal" and not hasattr(signal, "setitimer"):
+        pytest.skip("no interval timers on this platform")
+    game = _game_with_slow_gather()
+    with SamplingProfiler(interval=0.002, mode=mode) as profiler:
+        game.execute_command("gather")
+    profiler.write(tmp_path / "game.folded")
+
+    lines = (tmp_path / "game.folded").read_text(encoding="utf-8").splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    gathering = sum(int(line.rsplit(" ", 1)[1]) for line in lines if line.startswith("command:gather;"))
+    assert gathering >= 5 and gathering >= 0.5 * sum(profiler.samples.values())
+    assert any("test_sampling_profiler._busy" in line for line in lines)
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import save_format
+import survival_moo
+from messages import NullSink
+
+
+def _play(game, rounds):
+    for _ in range(rounds):
+        for command in ["gather", "hunt", "drink", "travel", "craft rope", "rest"]:
+            game.execute_command(command)
+
+
+def test_binary_saves_append_deltas_and_load_like_json(tmp_path):
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=4)
+    binary = tmp_path / "slot.ccsave"
+    _play(game, 2)
+    game.save_game(str(binary))
+    full_size = binary.stat().st_size
+    _play(game, 1)
+    game.save_game(str(binary))
+    assert full_size < binary.stat().st_size < 2 * full_size
+    game.save_game(str(tmp_path / "slot.json"))
+
+    from_binary = survival_moo.SurvivalGame(sink=NullSink(), seed=0)
+    from_binary.load_game(str(binary))
+    from_json = survival_moo.SurvivalGame(sink=NullSink(), seed=0)
+    from_json.load_game(str(tmp_path / "slot.json"))
+
+    assert from_binary._state_payload() == from_json._state_payload() == game._state_payload()
+    assert (from_binary.world.node_records() == game.world.node_records()).all()
+
+
+def test_torn_delta_frame_is_ignored(tmp_path):
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=5)
+    path = tmp_path / "slot.ccsave"
+    game.save_game(str(path))
+    expected = game._state_payload()
+    _play(game, 1)
+    game.save_game(str(path))
+    path.write_bytes(path.read_bytes()[:-3])
+
+    restored = survival_moo.SurvivalGame(sink=NullSink(), seed=0)
+    restored.load_game(str(path))
+
+    assert restored._state_payload() == expected
+
+
+def test_field_deltas_handle_values_that_collapse_to_none():
+    active = save_format.flatten({"event": {"active": {"name": "Cold Snap", "duration_hours": 18}, "timer": 3}})
+    ended = save_format.flatten({"event": {"active": None, "timer": 0}})
+    fields = dict(active)
+
+    for base, current in ((active, ended), (ended, active)):
+        for key, value in save_format.diff_fields(base, current).items():
+            save_format._assign(fields, key, value)
+        assert fields == current
@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import survival_moo
+from messages import NullSink
+from save_store import SaveStore
+from survival_server import GameSession
+
+
+def test_slots_round_trip_and_list_newest_first(tmp_path):
+    store = SaveStore(tmp_path / "saves.db", batch_size=100)
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=8)
+    for slot in ["morning", "noon", "night"]:
+        game.execute_command("rest")
+        store.save("ana", slot, game)
+    store.save("bo", "morning", survival_moo.SurvivalGame(sink=NullSink(), seed=9))
+    assert store.pending == 4
+
+    recent = store.recent("ana", 2)
+    assert store.pending == 0
+    assert [s.slot for s in recent] == ["night", "noon"]
+    assert recent[0].hours == game.elapsed_hours
+
+    restored = survival_moo.SurvivalGame(sink=NullSink(), seed=0)
+    assert store.load("ana", "night", restored)
+    assert restored._state_payload() == game._state_payload()
+    assert not store.load("ana", "missing", restored)
+    assert store.db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    store.close()
+
+
+def test_recent_saves_use_the_player_index(tmp_path):
+    store = SaveStore(tmp_path / "saves.db")
+    plan = " ".join(
+        row[-1]
+        for row in store.db.execute(
+            "EXPLAIN QUERY PLAN SELECT slot FROM saves WHERE player_id = ? ORDER BY saved_at DESC LIMIT 5", ("x",)
+        )
+    )
+    assert "saves_recent" in plan and "TEMP B-TREE" not in plan
+
+
+def test_session_saves_into_store_slots(tmp_path):
+    store = SaveStore(tmp_path / "saves.db")
+    session = GameSession(survival_moo.SurvivalGame(), tmp_path, store)
+
+    session.handle("player ana")
+    session.handle("save camp")
+    reply = session.handle("saves")
+
+    assert "camp:" in reply
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_player_ids_belong_to_one_live_session(tmp_path):
+    store, claimed = SaveStore(tmp_path / "saves.db"), set()
+    ana = GameSession(survival_moo.SurvivalGame(), tmp_path, store, "ana", claimed)
+    intruder = GameSession(survival_moo.SurvivalGame(), tmp_path, store, "guest-1", claimed)
+    ana.handle("save camp")
+
+    assert "already connected" in intruder.handle("player ana")
+    assert intruder.player_id == "guest-1" and "camp" not in intruder.handle("saves")
+
+    claimed.discard(ana.player_id)  # ana disconnects
+    assert "Saving as player ana" in intruder.handle("player ana")
+    assert claimed == {"ana"}
@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+from messages import BufferSink, Msg
+from scheduler import Scheduler
+from survival_moo import EVENTS, SurvivalGame
+
+
+def test_wakeups_fire_in_time_then_priority_order():
+    clock = Scheduler()
+    clock.schedule("b", 5, priority=1)
+    clock.schedule("a", 5, priority=0)
+    clock.schedule("later", 9)
+    clock.schedule("gone", 3)
+    clock.cancel("gone")
+    clock.schedule("moved", 2)
+    clock.schedule("moved", 4)
+
+    fired = []
+    for name, hour in clock.pop_due(6):
+        fired.append((name, hour))
+        if name == "a":
+            clock.schedule("a", hour + 1)  # still due within this advance
+    assert fired == [("moved", 4), ("a", 5), ("b", 5), ("a", 6)]
+    assert clock.due("later") == 9 and clock.due("moved") is None
+
+
+def test_long_skip_fires_each_wakeup_once():
+    game = SurvivalGame(sink=BufferSink(), seed=3)
+    game.rng.events.random = lambda: 1.0  # no events, so only season turns are reported
+
+    game.advance_time(1000)
+
+    shifts = [params for msg, params in game.sink.records if msg is Msg.SEASON_SHIFT]
+    assert len(shifts) == 1000 // game.season_length_hours
+    assert game.season_timer == 1000 % game.season_length_hours
+    assert game.event_check_timer == 1000 % 24
+    assert len(game.clock._queue) <= 8
+
+
+def _pad_to_compaction(clock, name):
+    """Replace `name` with itself until the queue is one stale entry short of compacting."""
+    while len(clock._queue) < 4 * len(clock._pending) + 16:
+        clock.schedule(name, clock.due(name))
+
+
+def test_compaction_while_popping_keeps_due_wakeups():
+    clock = Scheduler()
+    clock.schedule("tick", 1)
+    clock.schedule("padding", 1000)
+    _pad_to_compaction(clock, "padding")
+
+    fired = []
+    for name, hour in clock.pop_due(5):
+        fired.append(hour)
+        clock.schedule("padding", 1000)
+        clock.schedule(name, hour + 1)  # the first of these compacts
+    assert fired == [1, 2, 3, 4, 5]
+    assert clock.due("tick") == 6 and len(clock._queue) < 10
+
+
+@pytest.mark.parametrize("skip", ["advance_time", "fast_forward"])
+def test_compaction_during_a_multi_day_skip(skip):
+    games = [SurvivalGame(sink=BufferSink(), seed=3) for _ in range(2)]
+    for game in games:
+        game.rng.events.random = lambda: 1.0  # no new events
+        game.active_event = EVENTS[0]
+        game.event_timer = game.clock.due("event_check") - game.elapsed_hours  # ends on a daily roll...
+    _pad_to_compaction(games[0].clock, "season")  # ...which then compacts the queue while it is being popped
+
+    for game in games:
+        getattr(game, skip)(24 * 10)
+    assert len(games[0].clock._queue) <= 4
+    assert games[0]._state_payload() == games[1]._state_payload()
+    assert [msg for msg, _ in games[0].sink.records] == [msg for msg, _ in games[1].sink.records]
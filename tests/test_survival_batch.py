@@ -0,0 +1,118 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+np = pytest.importorskip("numpy")
+
+import survival_moo
+from survival_batch import BatchSimulation, StepDraws
+
+
+def _scripted_games():
+    games = [survival_moo.SurvivalGame() for _ in range(4)]
+    games[0].player.fire_lit = True
+    games[0].player.camp_comfort = 6
+    games[1].player.shelter.level = 1
+    games[1].player.hunger = 85
+    for env in games[1].world:
+        for stress, node in enumerate(env.resource_nodes.values(), start=4):
+            node.count = 0
+            node.stress = stress
+    games[2].season_index = 3
+    games[2].current_season = games[2].seasons[3]
+    games[2].season_timer = 46
+    games[2].event_check_timer = 23
+    games[3].active_event = survival_moo.EVENTS[1]
+    games[3].event_timer = 3  # ends in the same 3-hour step as the daily roll after it
+    games[3].event_check_timer = 23
+    return games
+
+
+def _feed_draw(monkeypatch, game, u):
+    for stream in game.rng.streams().values():
+        monkeypatch.setattr(stream, "random", lambda: u)
+        monkeypatch.setattr(stream, "choice", lambda seq: seq[int(u * len(seq))])
+
+
+def test_batch_matches_scalar_advance_time(monkeypatch, capsys):
+    games = _scripted_games()
+    batch = BatchSimulation.from_games(games)
+    rng = np.random.default_rng(7)
+
+    for hrs in [1, 3, 2, 1, 3, 3, 1, 2] * 6:
+        draws = rng.random(len(games)) ** 3  # skew low so shifts, events and fire failures happen
+        batch.advance(hrs, StepDraws.constant(draws))
+        for game, u in zip(games, draws):
+            if game.running:  # as in the game loop: a dead game takes no more steps
+                _feed_draw(monkeypatch, game, float(u))
+                game.advance_time(hrs)
+
+    capsys.readouterr()
+    for g, game in enumerate(games):
+        expected = survival_moo.SurvivalGame()
+        batch.sync_to(expected, g)
+        assert expected.player == game.player
+        assert expected.weather == game.weather
+        assert (expected.season_index, expected.season_timer) == (game.season_index, game.season_timer)
+        assert expected.active_event == game.active_event
+        assert (expected.event_timer, expected.event_check_timer) == (game.event_timer, game.event_check_timer)
+        game._settle_world()
+        for env, expected_env in zip(game.world, expected.world):
+            assert env.resource_nodes == expected_env.resource_nodes
+
+
+def test_event_ending_late_in_a_step_does_not_block_an_earlier_roll(monkeypatch, capsys):
+    game = _scripted_games()[3]
+    batch = BatchSimulation.from_games([game])
+    _feed_draw(monkeypatch, game, 0.01)
+
+    game.advance_time(3)
+    batch.advance(3, StepDraws.constant([0.01]))
+
+    capsys.readouterr()
+    expected = survival_moo.SurvivalGame()
+    batch.sync_to(expected, 0)
+    assert game.active_event is not None and game.active_event == expected.active_event
+    assert game.event_timer == expected.event_timer == game.active_event.duration_hours
+
+
+def test_batch_tracks_deaths_without_output(capsys):
+    batch = BatchSimulation.new(4, np.random.default_rng(0))
+    batch.thirst[:] = 95
+    batch.health[:] = 3
+
+    batch.advance(1, StepDraws.constant([0.99] * 4))
+
+    assert not batch.running.any()
+    assert capsys.readouterr().out == ""
+
+
+def test_dead_games_stay_as_they_died():
+    batch = BatchSimulation.new(3, np.random.default_rng(0))
+    batch.thirst[1] = 95
+    batch.health[1] = 3
+    batch.advance(1, StepDraws.constant([0.99] * 3))
+    died = {name: getattr(batch, name)[1].copy() for name in BatchSimulation.STEPPED}
+    hours = batch.hours.copy()
+
+    for hrs in [3, 24, 5]:
+        batch.advance(hrs, StepDraws.constant([0.01] * 3))
+
+    assert batch.running.tolist() == [True, False, True]
+    assert all(np.array_equal(getattr(batch, name)[1], value) for name, value in died.items())
+    assert batch.hours[0] == batch.hours[2] == (hours[0] + 32) % 24
+
+
+def test_weather_forecast_matches_stepping():
+    batch = BatchSimulation.new(20, np.random.default_rng(3))
+    batch.health[:] = 10**6  # dead games stop, and the forecast covers all 120 steps
+    forecast = batch.sample_weather(120, np.random.default_rng(4))
+    u = np.random.default_rng(4).random((20, 120))
+    calm = np.full(20, 0.99)  # no events or fire failures
+
+    for t in range(120):
+        batch.advance(1, StepDraws(u[:, t], calm, calm, calm))
+        assert (batch.weather_index == forecast[:, t]).all()
@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+np = pytest.importorskip("numpy")
+
+import survival_dp
+from messages import NullSink
+from survival_dp import Conditions, Grid, PolicyTable, SurvivalMdp
+from survival_moo import SurvivalGame
+
+TINY = Grid(
+    health=(5, 50, 100),
+    hunger=(0, 90, 100),
+    thirst=(0, 45, 90, 100),
+    body_temp=(34, 37, 40),
+    cooked_meat=1,
+    raw_meat=1,
+    berries=1,
+)
+COLD = Conditions(climate_odds=(1.0, 0.0, 0.0, 0.0, 0.0), climate_stay=1.0)
+
+
+def test_simplex_weights_average_back_to_the_point():
+    rng = np.random.default_rng(0)
+    grids = ((0, 5, 50, 100), (0, 90, 100), (33, 37, 41))
+    points = [rng.uniform(g[0], g[-1], 200) for g in grids]
+    indices, weights = survival_dp.simplex(points, grids)
+
+    assert weights.shape == (200, 4) and (weights >= -1e-12).all()
+    assert np.allclose(weights.sum(axis=1), 1)
+    for x, index, g in zip(points, indices, grids):
+        assert np.allclose((np.asarray(g)[index] * weights).sum(axis=1), x)
+
+
+def test_needs_transitions_lose_only_the_odds_of_dying():
+    mdp = SurvivalMdp(Conditions(bad_water=0.25), TINY)
+    for _, ells in mdp.needs_steps.values():
+        for _, odds in ells:
+            assert odds.sum(axis=1).max() <= 1 + 1e-5
+    _, odds = mdp.needs_steps["drink"][1][0]
+    healthy = mdp._needs["health"] == 100
+    assert np.allclose(odds.sum(axis=1)[healthy], 1, atol=1e-5)
+
+
+def test_solved_table_drinks_when_parched_and_survives_a_round_trip(tmp_path):
+    solution = SurvivalMdp(COLD, TINY).solve()
+    policy = solution.policy
+    assert solution.residual <= 0.1 and policy.actions.dtype == np.uint8
+    assert policy.command(20, 60, 10, 95, 37, False, 0, {}) == "drink"
+
+    actions = policy.actions.reshape(1, *TINY.needs_shape, *TINY.inventory_shape)
+    inventory = {"cooked_meat": 1, "berries": 4, "stick": 3, "stone": 2}
+    expected = policy.commands[actions[0, 2, 1, 3, 0, 1, 2, 1, 0, 1, 3, 2]]
+    assert policy.command(20, 100, 90, 100, 34, True, 2, inventory) == expected
+
+    game = SurvivalGame(sink=NullSink(), seed=2)
+    game.player.health, game.player.hunger, game.player.thirst = 60, 10, 95
+    assert policy.lookup(game) == "drink"  # any climate falls back to the only one solved for
+
+    policy.save(tmp_path / "policy.npz")
+    loaded = PolicyTable.load(tmp_path / "policy.npz")
+    assert loaded.grid == TINY and loaded.commands == policy.commands and loaded.climates == policy.climates
+    assert np.array_equal(loaded.actions, policy.actions)
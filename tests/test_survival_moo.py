@@ -1,9 +1,11 @@
+import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import survival_moo
+from messages import BufferSink, NullSink
 
 
 def _stable_game(monkeypatch):
@@ -17,8 +19,8 @@ def test_gather_depletes_node(monkeypatch):
     env = game.current_env()
     node = next(iter(env.resource_nodes.values()))
     node.count = 1
-    monkeypatch.setattr(survival_moo.random, "choice", lambda seq: node)
-    monkeypatch.setattr(survival_moo.random, "randint", lambda a, b: 3)
+    monkeypatch.setattr(game.rng.gather, "choice", lambda seq: node)
+    monkeypatch.setattr(game.rng.gather, "randint", lambda a, b: 3)
 
     before = game.player.inventory[node.item]
     game.gather()
@@ -29,9 +31,9 @@ def test_gather_depletes_node(monkeypatch):
 
 def test_hunt_success_increases_raw_meat(monkeypatch):
     game = _stable_game(monkeypatch)
-    monkeypatch.setattr(survival_moo.random, "choice", lambda seq: seq[0])
-    monkeypatch.setattr(survival_moo.random, "random", lambda: 0.0)
-    monkeypatch.setattr(survival_moo.random, "randint", lambda a, b: 2)
+    monkeypatch.setattr(game.rng.hunt, "choice", lambda seq: seq[0])
+    monkeypatch.setattr(game.rng.hunt, "random", lambda: 0.0)
+    monkeypatch.setattr(game.rng.hunt, "randint", lambda a, b: 2)
 
     before = game.player.inventory["raw_meat"]
     game.hunt()
@@ -42,7 +44,7 @@ def test_hunt_success_increases_raw_meat(monkeypatch):
 def test_drink_reduces_thirst(monkeypatch):
     game = _stable_game(monkeypatch)
     game.player.thirst = 70
-    monkeypatch.setattr(survival_moo.random, "choice", lambda seq: seq[0])
+    monkeypatch.setattr(game.rng.survival, "choice", lambda seq: seq[0])
 
     game.drink()
 
@@ -69,3 +71,108 @@ def test_rest_recovers_health(monkeypatch):
     game.rest()
 
     assert game.player.health == 66
+
+
+def test_unvisited_nodes_regenerate_lazily(monkeypatch):
+    game = survival_moo.SurvivalGame()
+    for stream in game.rng.streams().values():
+        monkeypatch.setattr(stream, "random", lambda: 0.99)
+    far = game.world[(game.player.location + 1) % len(game.world)]
+    node = next(iter(far.resource_nodes.values()))
+    node.count = 0
+    node.stress = 4
+
+    for _ in range(5):
+        game.advance_time(1)
+
+    assert node.count == 0
+    game._settle_environment(far)
+    assert node.count == min(node.max_count, 5 * node.regen_rate)
+    assert node.stress == 4
+
+
+def test_same_seed_replays_the_same_game():
+    script = ["gather", "hunt", "drink", "travel", "rest", "gather", "cook", "travel", "hunt"] * 4
+    sinks = [BufferSink(), BufferSink()]
+    games = [survival_moo.SurvivalGame(sink=sink, seed=42) for sink in sinks]
+    for game in games:
+        for command in script:
+            game.execute_command(command)
+
+    assert sinks[0].drain_text() == sinks[1].drain_text()
+    assert games[0].player == games[1].player
+    assert games[0].rng.getstate() == games[1].rng.getstate()
+
+
+def test_save_resumes_rng_streams(tmp_path):
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=7)
+    game.execute_command("hunt")
+    game.save_game(str(tmp_path / "save.json"))
+    expected = [game.rng.hunt.random(), game.rng.weather.random()]
+
+    resumed = survival_moo.SurvivalGame(sink=NullSink(), seed=99)
+    resumed.load_game(str(tmp_path / "save.json"))
+
+    assert [resumed.rng.hunt.random(), resumed.rng.weather.random()] == expected
+
+
+def test_sessions_share_definitions_but_not_nodes():
+    first = survival_moo.SurvivalGame(sink=NullSink(), seed=1)
+    second = survival_moo.SurvivalGame(sink=NullSink(), seed=2)
+    node = next(iter(first.world[0].resource_nodes.values()))
+    node.count = 0
+
+    assert first.world[0].definition is second.world[0].definition
+    assert first.weather_types is second.weather_types
+    assert second.world[0].resource_nodes[node.item].count > 0
+
+
+def test_saves_with_weather_prose_still_load(tmp_path):
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=3)
+    game.save_game(str(tmp_path / "save.json"))
+    payload = json.loads((tmp_path / "save.json").read_text(encoding="utf-8"))
+    mood_id = payload["weather"].pop("mood_id")
+    payload["weather"]["mood"] = game.text[mood_id]  # as written before text ids
+    (tmp_path / "save.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    resumed = survival_moo.SurvivalGame(sink=NullSink(), seed=4)
+    resumed.load_game(str(tmp_path / "save.json"))
+
+    assert resumed.weather is game.weather
+
+
+def test_forks_and_restored_snapshots_replay_like_the_original():
+    script = ["gather", "hunt", "travel", "rest", "craft rope", "gather", "wait 30", "drink", "eat"] * 3
+    game = survival_moo.SurvivalGame(sink=BufferSink(), seed=11)
+    for command in script[:5]:
+        game.execute_command(command)
+    game.sink.drain_text()
+    snapshot = game.snapshot()
+    fork = game.fork(sink=BufferSink())
+    assert fork.world[0].definition is game.world[0].definition
+
+    runs = []
+    for played in (game, fork, "restored"):
+        if played == "restored":
+            game.restore(snapshot)
+            game.sink = BufferSink()
+            played = game
+        for command in script:
+            played.execute_command(command)
+        runs.append((played.sink.drain_text(), played._state_payload(), played.world.nodes_payload()))
+
+    assert runs[0] == runs[1] == runs[2]
+
+
+def test_forks_do_not_share_mutable_state():
+    game = survival_moo.SurvivalGame(sink=NullSink(), seed=12)
+    before = (game._state_payload(), game.world.nodes_payload())
+    fork = game.fork()
+    for node in fork.current_env().resource_nodes.values():
+        node.count = 0
+    fork.player.inventory["rope"] = 5
+    fork.player.shelter.level = 2
+    for command in ["travel", "wait 100", "gather"]:
+        fork.execute_command(command)
+
+    assert (game._state_payload(), game.world.nodes_payload()) == before
@@ -0,0 +1,97 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+from survival_server import GameServer, GameSession, run_load_test
+import survival_moo
+
+
+def test_session_output_goes_to_its_own_stream(tmp_path, capsys):
+    session = GameSession(survival_moo.SurvivalGame(), tmp_path)
+
+    reply = session.handle("inventory\n")
+
+    assert "Inventory:" in reply and reply.endswith("> ")
+    assert capsys.readouterr().out == ""
+
+
+def test_session_saves_stay_inside_save_dir(tmp_path):
+    session = GameSession(survival_moo.SurvivalGame(), tmp_path)
+
+    session.handle("save ../../escape.json")
+
+    assert (tmp_path / "guest" / "escape.json").exists()
+    assert not (tmp_path.parent.parent / "escape.json").exists()
+
+
+def test_sessions_keep_their_file_saves_apart(tmp_path):
+    ana = GameSession(survival_moo.SurvivalGame(seed=1), tmp_path, player_id="ana")
+    bo = GameSession(survival_moo.SurvivalGame(seed=2), tmp_path, player_id="bo")
+    ana.game.player.hunger = 70
+    ana.handle("save")
+
+    assert "No save file found" in bo.handle("load")
+    bo.handle("save")
+    ana.handle("load")
+    assert ana.game.player.hunger == 70
+
+
+def test_server_hosts_independent_sessions(tmp_path):
+    async def scenario():
+        server = GameServer(save_dir=tmp_path)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        clients = [await asyncio.open_connection("127.0.0.1", port) for _ in range(3)]
+        for reader, _ in clients:
+            await reader.readuntil(b"> ")
+        assert len(server.sessions) == 3
+
+        reader, writer = clients[0]
+        writer.write(b"quit\n")
+        farewell = await reader.read()
+        for _, other in clients[1:]:
+            other.close()
+        listener.close()
+        await listener.wait_closed()
+        return farewell
+
+    farewell = asyncio.run(scenario())
+    assert b"You leave the wilderness" in farewell
+
+
+def test_load_test_reports_latency_percentiles(tmp_path):
+    report = asyncio.run(run_load_test(sessions=20, commands_per_session=3, save_dir=tmp_path))
+
+    assert report["server"]["count"] == 60
+    assert report["server"]["p99_ms"] >= report["server"]["p50_ms"]
+
+
+@pytest.mark.parametrize(
+    "line, contents, reply",
+    [
+        ("save .", None, "not a save file name"),
+        ("load ..", None, "not a save file name"),
+        ("load notes.json", '{"notes": []}', "Could not load notes.json: not a save file."),
+        ("load empty.json", "", "Could not load empty.json: not a save file."),
+        ("load list.json", "[1, 2]", "Could not load list.json: not a save file."),
+        ("load torn.ccsave", "CCSV", "Could not load torn.ccsave: not a save file."),
+    ],
+)
+def test_bad_save_files_get_a_reply_not_a_dropped_session(tmp_path, line, contents, reply):
+    if contents is not None:
+        (tmp_path / "guest").mkdir()
+        (tmp_path / "guest" / line.split()[1]).write_text(contents, encoding="utf-8")
+    session = GameSession(survival_moo.SurvivalGame(seed=1), tmp_path)
+    before = session.game._state_payload()
+
+    text = session.handle(line)
+
+    assert reply in text and text.endswith("> ")
+    assert session.game._state_payload() == before
+    assert "Inventory:" in session.handle("inventory")
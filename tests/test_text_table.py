@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from text_table import TextPool, TextTable, encode_table, write_table
+
+
+def test_pool_dedupes_and_table_round_trips_utf8(tmp_path):
+    pool = TextPool()
+    ids = [pool.add(text) for text in ["Fairy Mist", "", "Weather — Storm", "Fairy Mist"]]
+    assert ids == [0, 1, 2, 0]
+
+    path = tmp_path / "text.strings"
+    write_table(path, pool.texts, tag=b"v1")
+    table = TextTable.open(path)
+
+    assert [table[i] for i in range(len(table))] == ["Fairy Mist", "", "Weather — Storm"]
+    assert table.tag.rstrip(b"\0") == b"v1"
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError, match="Not a text table"):
+        TextTable(b"CCSV" + bytes(40))
+    assert len(TextTable(encode_table([]))) == 0
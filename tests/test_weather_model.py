@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+np = pytest.importorskip("numpy")
+
+import world_cache
+from survival_moo import SEASONS, default_world_definition
+from weather_model import WeatherModel
+from world_data import WEATHER_DATA, WEATHER_MODEL, WORLD_DATA
+
+
+def test_sampled_paths_follow_the_transition_matrix():
+    model = default_world_definition().weather_model
+    games, steps, summer, temp_bias = 400, 500, 1, 3
+    start = np.zeros(games, dtype=np.int64)
+    u = np.random.default_rng(0).random((games, steps))
+    paths = model.sample_paths(start, np.full((games, steps), summer), np.full(games, temp_bias), u)
+
+    previous = np.concatenate([start[:, None], paths[:, :-1]], axis=1)
+    counts = np.zeros((len(model.names),) * 2)
+    np.add.at(counts, (previous.ravel(), paths.ravel()), 1)
+    visited = counts.sum(axis=1) > 5000  # rare weathers leave too few samples to judge
+    empirical = counts[visited] / counts[visited].sum(axis=1, keepdims=True)
+    assert visited.sum() >= 3
+    assert np.abs(empirical - model.transitions(summer, temp_bias)[visited]).max() < 0.02
+
+    # The scalar step and the single-game change list walk the same path.
+    current, walked = 0, []
+    for v in u[0]:
+        current = model.step(current, summer, temp_bias, float(v))
+        walked.append(current)
+    assert walked == paths[0].tolist()
+    changes = model.changes(0, [summer] * steps, temp_bias, u[0])
+    assert changes == [(t, w) for t, (before, w) in enumerate(zip([0, *walked], walked)) if w != before]
+
+
+def test_season_and_climate_shift_the_weather():
+    model = default_world_definition().weather_model
+    clear, heatwave = model.names.index("Clear"), model.names.index("Heatwave")
+    summer, winter = [season.name for season in SEASONS].index("Summer"), [season.name for season in SEASONS].index("Winter")
+    assert model.transitions(summer, 4)[clear, heatwave] > 10 * model.transitions(winter, -6)[clear, heatwave]
+
+    flat = WeatherModel.from_odds(model.names, [s.name for s in SEASONS], 0.35)
+    assert np.allclose(flat.transitions(0, 0), flat.transitions(3, -6))
+
+
+def test_invalid_weather_model_is_rejected():
+    broken = dict(WEATHER_MODEL, follows={"Drizzle": {"Clear": 1}})
+    with pytest.raises(ValueError, match="unknown weather"):
+        world_cache.compile_world(WORLD_DATA, WEATHER_DATA, broken)
+
+
+def test_weather_that_never_changes_stays_put():
+    model = default_world_definition().weather_model
+    still = WeatherModel.from_odds(model.names, [s.name for s in SEASONS], 0.0)
+    u = np.random.default_rng(1).random((5, 50))
+
+    with np.errstate(all="raise"):
+        paths = still.sample_paths(np.arange(5), np.zeros((5, 50), dtype=np.int64), np.zeros(5, dtype=np.int64), u)
+    assert (paths == np.arange(5)[:, None]).all()
+    assert still.changes(2, [0] * 50, 0, u[0]) == [] and still.step(2, 0, 0, 0.0) == 2
+    with pytest.raises(ValueError, match="change_chance"):
+        WeatherModel.from_odds(model.names, [s.name for s in SEASONS], -0.1)
@@ -0,0 +1,47 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import world_cache
+from survival_moo import WorldDefinition
+from world_data import WEATHER_DATA, WORLD_DATA
+
+
+def test_cache_is_reused_until_the_source_changes(tmp_path):
+    source = tmp_path / "world_data.py"
+    cache = tmp_path / "__pycache__" / "world_data.cache"
+    source.write_text(world_cache.SOURCE.read_text(encoding="utf-8"), encoding="utf-8")
+
+    first = world_cache.load(source, cache)
+    written = cache.stat().st_mtime_ns
+    assert world_cache.load(source, cache).environments == first.environments
+    assert cache.stat().st_mtime_ns == written
+
+    source.write_text(source.read_text(encoding="utf-8").replace("Emerald Pinewood", "Jade Pinewood"), encoding="utf-8")
+    os.utime(source, ns=(written + 10**9, written + 10**9))
+    assert world_cache.load(source, cache).environments[0][0] == "Jade Pinewood"
+
+
+def test_invalid_world_data_is_rejected():
+    broken = [dict(WORLD_DATA[0], resource_nodes={}), *WORLD_DATA[1:]]
+
+    with pytest.raises(ValueError, match="gatherables without resource nodes"):
+        world_cache.compile_world(broken, WEATHER_DATA)
+
+
+def test_definitions_hold_text_ids_into_the_string_table(tmp_path):
+    source = tmp_path / "world_data.py"
+    source.write_text(world_cache.SOURCE.read_text(encoding="utf-8"), encoding="utf-8")
+    definition = WorldDefinition.from_compiled(world_cache.load(source, tmp_path / "world_data.cache"))
+
+    env = definition.environments[2]
+    assert env.flavor == WORLD_DATA[2]["flavor"]
+    assert [env.text[p.description_id] for p in env.pois] == [p["description"] for p in WORLD_DATA[2]["pois"]]
+    assert [env.text[i] for i in env.soundscape["night"]] == WORLD_DATA[2]["soundscape"]["night"]
+    assert definition.text[definition.weather_types[0].mood_id] == WEATHER_DATA[0]["mood"]
@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("numpy")
+
+import survival_moo
+from world_gen import ProceduralWorld
+
+
+def test_environments_are_reproducible_from_seed():
+    first = ProceduralWorld(100_000, seed=5)
+    second = ProceduralWorld(100_000, seed=5)
+
+    for env_id in (0, 4_321, 99_999):
+        a, b = first[env_id], second[env_id]
+        assert (a.name, a.temp_bias, a.huntables, a.soundscape) == (b.name, b.temp_bias, b.huntables, b.soundscape)
+        assert dict(a.resource_nodes) == dict(b.resource_nodes)
+
+
+def test_far_chunks_are_evicted_but_played_rows_survive():
+    world = ProceduralWorld(100_000, seed=1, chunk_side=8)
+    world.visit(0)
+    node = next(iter(world[0].resource_nodes.values()))
+    node.count = 0
+
+    world.visit(world.size - 1)
+
+    assert list(world.chunks) == [world.chunk_of(world.size - 1)]
+    assert len(world.rows) == len(world.chunks[world.chunk_of(world.size - 1)]) + 1
+    assert world[0].resource_nodes[node.item].count == 0
+
+
+def test_game_travels_between_neighbours_and_round_trips_saves(monkeypatch, tmp_path):
+    world = ProceduralWorld(1_000_000, seed=2)
+    game = survival_moo.SurvivalGame(world=world)
+    monkeypatch.setattr(game, "advance_time", lambda hrs=1: None)
+    start = game.player.location
+
+    game.travel()
+    assert game.player.location in world.neighbours(start)
+
+    node = next(iter(game.current_env().resource_nodes.values()))
+    node.count = 0
+    save = tmp_path / "world.json"
+    game.save_game(str(save))
+    node.count = 1
+    game.load_game(str(save))
+
+    assert game.current_env().resource_nodes[node.item].count == 0
+
+
+def test_forks_rebind_resident_chunks_to_their_own_store():
+    game = survival_moo.SurvivalGame(world=ProceduralWorld(1_000_000, seed=3, chunk_side=4), seed=3)
+    snapshot = game.snapshot()
+    fork = game.fork()
+    for _ in range(12):
+        fork.execute_command("travel")
+        fork.execute_command("gather")
+
+    assert fork.world.nodes_payload() != game.world.nodes_payload() == {}
+    fork.restore(snapshot)
+    for played in (game, fork):
+        played.execute_command("gather")
+    assert fork._state_payload() == game._state_payload()
+    assert fork.world.nodes_payload() == game.world.nodes_payload() != {}
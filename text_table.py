@@ -0,0 +1,93 @@
+"""A read-only table of UTF-8 strings addressed by integer id, served straight from `mmap`.
+
+Layout: a header (magic, version, string count, 16-byte caller tag), then
+`count + 1` little-endian u32 byte offsets, then the concatenated UTF-8 text.
+String `i` is the bytes between offsets `i` and `i + 1`. Every process that
+maps the same file shares its physical pages, and a string is only decoded
+when it is read.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+MAGIC = b"CCTX"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHI16s")
+_OFFSET = struct.Struct("<I")
+_SPAN = struct.Struct("<II")
+
+
+class TextPool:
+    """Collects strings while building a table, handing out one id per distinct string."""
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+
+    def add(self, text: str) -> int:
+        return self.ids.setdefault(text, len(self.ids))
+
+    @property
+    def texts(self) -> List[str]:
+        return list(self.ids)
+
+
+def encode_table(texts: Sequence[str], tag: bytes = b"") -> bytes:
+    """Pack `texts` so that `TextTable(data)[i] == texts[i]`; `tag` (at most 16 bytes) is stored verbatim."""
+    if len(tag) > 16:
+        raise ValueError("A text table tag is at most 16 bytes")
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = [0]
+    for chunk in encoded:
+        offsets.append(offsets[-1] + len(chunk))
+    base = _HEADER.size + _OFFSET.size * len(offsets)
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION, len(texts), tag),
+            struct.pack(f"<{len(offsets)}I", *(base + offset for offset in offsets)),
+            *encoded,
+        ]
+    )
+
+
+def write_table(path: Path, texts: Sequence[str], tag: bytes = b"") -> None:
+    """Write atomically, so a process mapping the old file keeps reading consistent text."""
+    partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    partial.write_bytes(encode_table(texts, tag))
+    os.replace(partial, path)
+
+
+class TextTable:
+    """Strings by id over any buffer holding an encoded table: bytes in memory or a mapped file."""
+
+    __slots__ = ("_data", "_count", "tag")
+
+    def __init__(self, data: bytes | mmap.mmap) -> None:
+        magic, version, count, tag = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a text table")
+        if version != VERSION:
+            raise ValueError(f"Unsupported text table version {version}")
+        self._data = data
+        self._count = count
+        self.tag = tag
+
+    @classmethod
+    def open(cls, path: Path) -> TextTable:
+        """Map `path` read-only; the mapping stays valid even if the file is replaced later."""
+        with open(path, "rb") as handle:
+            return cls(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, text_id: int) -> str:
+        if not 0 <= text_id < self._count:
+            raise IndexError(text_id)
+        start, end = _SPAN.unpack_from(self._data, _HEADER.size + _OFFSET.size * text_id)
+        return str(self._data[start:end], "utf-8")
@@ -0,0 +1,161 @@
+"""Weather as a Markov chain conditioned on season and climate, sampled through alias tables.
+
+Each step the weather changes with `change_chance`. The next weather follows
+the current one with odds `follows[current]`, scaled by the season's odds and,
+once per degree of the environment's `temp_bias`, by each weather's
+per-degree climate factor. One uniform draw decides both: below
+`change_chance` it is rescaled and looks up a Walker alias table, so every
+draw is O(1), whether it is for one game or for a whole batch of them.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+AliasTables = Tuple[np.ndarray, np.ndarray]  # acceptance probability and alias, indexed [..., season, current, column]
+
+
+def alias_table(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Vose's alias method: column `i` keeps itself with probability `prob[i]`, otherwise yields `alias[i]`."""
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob, alias = [1.0] * n, list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        lo, hi = small.pop(), large.pop()
+        prob[lo], alias[lo] = scaled[lo], hi
+        scaled[hi] += scaled[lo] - 1.0
+        (small if scaled[hi] < 1.0 else large).append(hi)
+    return prob, alias
+
+
+class WeatherModel:
+    """Transition odds for `names` across `seasons`; alias tables are built lazily per `temp_bias`."""
+
+    __slots__ = ("names", "index", "change_chance", "follows", "season_odds", "climate_per_degree", "_tables", "_lists")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        change_chance: float,
+        follows: np.ndarray,
+        season_odds: np.ndarray,
+        climate_per_degree: np.ndarray,
+    ) -> None:
+        if not 0.0 <= change_chance <= 1.0:
+            raise ValueError(f"change_chance must be within 0-1, not {change_chance!r}")
+        self.names = tuple(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.change_chance = change_chance
+        self.follows = follows * (1 - np.eye(len(self.names)))  # (current, next); changes always change
+        self.season_odds = season_odds  # (season, next)
+        self.climate_per_degree = climate_per_degree  # (next,)
+        self._tables: Dict[int, AliasTables] = {}
+        self._lists: Dict[int, Tuple[list, list]] = {}
+
+    @classmethod
+    def from_odds(
+        cls,
+        names: Sequence[str],
+        seasons: Sequence[str],
+        change_chance: float,
+        follows: Mapping[str, Mapping[str, float]] | None = None,
+        season_odds: Mapping[str, Mapping[str, float]] | None = None,
+        climate_per_degree: Mapping[str, float] | None = None,
+    ) -> WeatherModel:
+        """Build from `WEATHER_MODEL`-style odds keyed by name; anything unlisted has odds 1."""
+        follows, season_odds, climate_per_degree = follows or {}, season_odds or {}, climate_per_degree or {}
+        return cls(
+            names,
+            change_chance,
+            np.array([[follows.get(a, {}).get(b, 1.0) for b in names] for a in names], dtype=np.float64),
+            np.array([[season_odds.get(s, {}).get(b, 1.0) for b in names] for s in seasons], dtype=np.float64),
+            np.array([climate_per_degree.get(b, 1.0) for b in names], dtype=np.float64),
+        )
+
+    def change_odds(self, temp_bias: int) -> np.ndarray:
+        """Relative odds of each next weather, given that it changes: [season, current, next]."""
+        climate = self.climate_per_degree**temp_bias
+        return self.follows[None, :, :] * (self.season_odds * climate)[:, None, :]
+
+    def transitions(self, season: int, temp_bias: int) -> np.ndarray:
+        """The full per-step transition matrix [current, next] for one season and climate."""
+        odds = self.change_odds(temp_bias)[season]
+        return self.change_chance * odds / odds.sum(axis=1, keepdims=True) + (1 - self.change_chance) * np.eye(len(self.names))
+
+    def tables(self, temp_bias: int) -> AliasTables:
+        """Alias tables for changes under `temp_bias`, indexed [season, current, column]."""
+        tables = self._tables.get(temp_bias)
+        if tables is None:
+            odds = self.change_odds(temp_bias)
+            rows = [alias_table(row) for row in odds.reshape(-1, len(self.names))]
+            prob = np.array([row[0] for row in rows]).reshape(odds.shape)
+            alias = np.array([row[1] for row in rows], dtype=np.int64).reshape(odds.shape)
+            tables = self._tables[temp_bias] = (prob, alias)
+            self._lists[temp_bias] = (prob.tolist(), alias.tolist())
+        return tables
+
+    def stack(self, temp_biases: Sequence[int]) -> AliasTables:
+        """Tables for several climates at once, indexed [climate, season, current, column]."""
+        tables = [self.tables(int(bias)) for bias in temp_biases]
+        return np.stack([t[0] for t in tables]), np.stack([t[1] for t in tables])
+
+    def step(self, current: int, season: int, temp_bias: int, u: float) -> int:
+        """The weather after one step from `current`, decided by a uniform `u` in [0, 1)."""
+        if u >= self.change_chance:
+            return current
+        if temp_bias not in self._lists:
+            self.tables(temp_bias)
+        prob, alias = self._lists[temp_bias]
+        v = u / self.change_chance * len(self.names)
+        column = min(int(v), len(self.names) - 1)
+        return column if v - column < prob[season][current][column] else alias[season][current][column]
+
+    def step_many(self, tables: AliasTables, climate: np.ndarray, season: np.ndarray, current: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """`step` for many games at once; `climate` indexes the first axis of `tables` (see `stack`)."""
+        if self.change_chance == 0:
+            return np.array(current, dtype=np.int64)
+        prob, alias = tables
+        v = u / self.change_chance * len(self.names)
+        column = np.minimum(v.astype(np.int64), len(self.names) - 1)
+        keep = v - column < prob[climate, season, current, column]
+        picked = np.where(keep, column, alias[climate, season, current, column])
+        return np.where(u < self.change_chance, picked, current)
+
+    def sample_paths(self, start: np.ndarray, seasons: np.ndarray, temp_bias: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Whole trajectories: the weather of each game `g` after each step `t`, shape `u.shape`.
+
+        `start` and `temp_bias` have one entry per game; `seasons` and `u` are
+        `(games, steps)`, giving the season in force at each step and its draw.
+        """
+        climates, climate = np.unique(np.asarray(temp_bias), return_inverse=True)
+        tables = self.stack(climates)
+        paths = np.empty(u.shape, dtype=np.int64)
+        current = np.asarray(start, dtype=np.int64)
+        for t in range(u.shape[1]):
+            current = paths[:, t] = self.step_many(tables, climate, seasons[:, t], current, u[:, t])
+        return paths
+
+    def changes(self, start: int, seasons: Sequence[int], temp_bias: int, u: np.ndarray) -> List[Tuple[int, int]]:
+        """One game's trajectory as `(step, new weather)` for each step that changes it.
+
+        Only the steps whose draw falls below `change_chance` are visited, so
+        a long stretch costs per change rather than per step.
+        """
+        if self.change_chance == 0:
+            return []
+        self.tables(temp_bias)
+        prob, alias = self._lists[temp_bias]
+        steps = np.flatnonzero(u < self.change_chance)
+        v = u[steps] / self.change_chance * len(self.names)
+        columns = np.minimum(v.astype(np.int64), len(self.names) - 1)
+        current, out = start, []
+        for step, column, fraction in zip(steps.tolist(), columns.tolist(), (v - columns).tolist()):
+            season = seasons[step]
+            current = column if fraction < prob[season][current][column] else alias[season][current][column]
+            out.append((step, current))
+        return out
@@ -0,0 +1,208 @@
+"""Compiled, validated cache of `world_data.py` for fast startup.
+
+Importing `world_data` builds every literal dict and list, and the game then
+converts all of them. Instead, the data is validated once, flattened into
+tuples and marshalled to `__pycache__/world_data.cache`, stamped with the
+source file's size and mtime the way a `.pyc` is. A stale or unreadable cache
+is rebuilt on the next load, or ahead of time with `python world_cache.py`.
+
+The weather Markov model (`WEATHER_MODEL`) is validated and cached with them.
+
+All prose (flavor, water and point-of-interest descriptions, soundscape lines
+and weather moods) goes into `__pycache__/world_data.strings`, a `TextTable`
+that every process maps read-only; the compiled tuples hold integer text ids.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import marshal
+import os
+import runpy
+import struct
+from pathlib import Path
+from typing import Any, Sequence, Tuple
+
+from text_table import TextPool, TextTable, encode_table, write_table
+
+FORMAT_VERSION = 4
+SOURCE = Path(__file__).with_name("world_data.py")
+CACHE = SOURCE.parent / "__pycache__" / "world_data.cache"
+
+WEATHER_FIELDS = ("name", "temperature_shift", "thirst_rate", "fire_modifier", "hunt_modifier", "mood")
+SOUNDSCAPE_MODES = ("day", "night", "winter", "storm")
+_ENVIRONMENT_KEYS = {"name", "terrain", "flavor", "gatherables", "huntables", "water_sources", "pois", "temp_bias", "resource_nodes"}
+
+# Python's bytecode magic (marshal output is version specific), format version, source mtime and size.
+_HEADER = struct.Struct("<4sHqq")
+_STAMP = struct.Struct("<qq")  # the string table's tag, tying it to the same source
+
+# Each environment: (name, terrain, gatherables, huntables, ((water, quality, description_id), ...),
+#     temp_bias, ((item, count, max, regen, stress), ...), flavor_id, ((poi, description_id), ...),
+#     ((mode, (line_id, ...)), ...), flavor_sections).
+# Each weather: WEATHER_FIELDS in order, with the mood as a text id.
+# The weather model is kept as the `WEATHER_MODEL` dict (None: flat odds).
+Core = Tuple[Tuple[Tuple[Any, ...], ...], Tuple[Tuple[Any, ...], ...], dict | None]
+
+
+def _require(condition: bool, message: str) -> None:
+    if not condition:
+        raise ValueError(f"Invalid world data: {message}")
+
+
+def validate(world_data: Sequence[dict], weather_data: Sequence[dict]) -> None:
+    """Raise `ValueError` naming the first problem that would otherwise surface mid-game."""
+    _require(len(world_data) > 0, "there must be at least one environment")
+    names = [entry.get("name") for entry in world_data]
+    _require(len(set(names)) == len(names), "environment names must be unique")
+    for entry in world_data:
+        name = entry.get("name")
+        missing = _ENVIRONMENT_KEYS - set(entry)
+        _require(not missing, f"{name}: missing {sorted(missing)}")
+        _require(isinstance(entry["temp_bias"], int), f"{name}: temp_bias must be an int")
+        _require(len(entry["water_sources"]) > 0, f"{name}: needs a water source")
+        _require(set(entry["gatherables"]) <= set(entry["resource_nodes"]), f"{name}: gatherables without resource nodes")
+        for item, node in entry["resource_nodes"].items():
+            _require(
+                all(isinstance(node.get(key), int) for key in ("count", "max", "regen"))
+                and 0 <= node["count"] <= node["max"],
+                f"{name}: bad resource node {item!r}",
+            )
+        unknown = set(entry.get("soundscape", {})) - set(SOUNDSCAPE_MODES)
+        _require(not unknown, f"{name}: unknown soundscape modes {sorted(unknown)}")
+    weather_names = [weather.get("name") for weather in weather_data]
+    _require(len(set(weather_names)) == len(weather_names), "weather names must be unique")
+    for weather in weather_data:
+        _require(set(weather) == set(WEATHER_FIELDS), f"weather {weather.get('name')}: fields must be {WEATHER_FIELDS}")
+
+
+def validate_weather_model(model: dict, weather_names: Sequence[str]) -> None:
+    known = set(weather_names)
+    _require(0.0 <= model.get("change_chance", -1.0) <= 1.0, "weather model: change_chance must be within 0-1")
+    _require(set(model.get("follows", {})) <= known, "weather model: follows names an unknown weather")
+    rows = [*model.get("follows", {}).values(), *model.get("season_odds", {}).values()]
+    for row in rows:
+        for name, odds in row.items():
+            _require(name in known and odds >= 0, f"weather model: bad odds {odds!r} for {name!r}")
+    for name, factor in model.get("climate_per_degree", {}).items():
+        _require(name in known and factor > 0, f"weather model: bad climate factor {factor!r} for {name!r}")
+
+
+def flavor_sections(flavor: str) -> Tuple[str, str, str, str]:
+    """Split flavor on `|` into scene, terrain & cover, ground & travel, and air & light ("" when absent)."""
+    parts = [part.strip() for part in flavor.split("|") if part.strip()]
+    scene = parts[0] if parts else flavor
+    return (scene, *(parts[i] if len(parts) > i else "" for i in (1, 2, 3)))
+
+
+def compile_world(
+    world_data: Sequence[dict], weather_data: Sequence[dict], weather_model: dict | None = None
+) -> Tuple[Core, Sequence[str]]:
+    """Validate the data and flatten it into the cached tuples plus the strings their text ids index."""
+    validate(world_data, weather_data)
+    if weather_model is not None:
+        validate_weather_model(weather_model, [weather["name"] for weather in weather_data])
+    pool = TextPool()
+    environments = tuple(
+        (
+            entry["name"],
+            entry["terrain"],
+            tuple(entry["gatherables"]),
+            tuple(entry["huntables"]),
+            tuple((w["name"], w["quality"], pool.add(w["description"])) for w in entry["water_sources"]),
+            entry["temp_bias"],
+            tuple(
+                (item, node["count"], node["max"], node["regen"], node.get("stress", 0))
+                for item, node in entry["resource_nodes"].items()
+            ),
+            pool.add(entry["flavor"]),
+            tuple((p["name"], pool.add(p["description"])) for p in entry["pois"]),
+            tuple((mode, tuple(pool.add(line) for line in lines)) for mode, lines in entry.get("soundscape", {}).items()),
+            tuple(pool.add(section) for section in flavor_sections(entry["flavor"])),
+        )
+        for entry in world_data
+    )
+    weather = tuple(
+        tuple(pool.add(entry[key]) if key == "mood" else entry[key] for key in WEATHER_FIELDS) for entry in weather_data
+    )
+    return (environments, weather, weather_model), pool.texts
+
+
+class CompiledWorld:
+    """The loaded cache: definition tuples plus the text table their ids refer to."""
+
+    __slots__ = ("environments", "weather", "weather_model", "text")
+
+    def __init__(self, core: Core, text: TextTable) -> None:
+        self.environments, self.weather, self.weather_model = core
+        self.text = text
+
+    @classmethod
+    def from_data(
+        cls, world_data: Sequence[dict], weather_data: Sequence[dict] = (), weather_model: dict | None = None
+    ) -> CompiledWorld:
+        """Compile in memory, without touching the cache files."""
+        core, texts = compile_world(world_data, weather_data, weather_model)
+        return cls(core, TextTable(encode_table(texts)))
+
+
+def _stamp(source: Path) -> Tuple[int, int]:
+    stat = source.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def strings_path(cache: Path) -> Path:
+    return cache.with_suffix(".strings")
+
+
+def _read(cache: Path, stamp: Tuple[int, int]) -> CompiledWorld | None:
+    try:
+        data = cache.read_bytes()
+        magic, version, mtime, size = _HEADER.unpack_from(data)
+        if (magic, version, (mtime, size)) != (importlib.util.MAGIC_NUMBER, FORMAT_VERSION, stamp):
+            return None
+        text = TextTable.open(strings_path(cache))
+        if text.tag != _STAMP.pack(*stamp):
+            return None
+        return CompiledWorld(marshal.loads(data[_HEADER.size :]), text)
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+
+
+def build(source: Path = SOURCE, cache: Path = CACHE) -> CompiledWorld:
+    """Compile `source` and write the cache and string table; works from memory if they cannot be written."""
+    stamp = _stamp(source)
+    namespace = runpy.run_path(str(source))
+    core, texts = compile_world(namespace["WORLD_DATA"], namespace["WEATHER_DATA"], namespace.get("WEATHER_MODEL"))
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        # Strings first: a reader pairing the new cache with the old strings sees mismatched tags and rebuilds.
+        write_table(strings_path(cache), texts, _STAMP.pack(*stamp))
+        partial = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        partial.write_bytes(_HEADER.pack(importlib.util.MAGIC_NUMBER, FORMAT_VERSION, *stamp) + marshal.dumps(core))
+        os.replace(partial, cache)
+        return CompiledWorld(core, TextTable.open(strings_path(cache)))
+    except OSError:  # read-only install
+        return CompiledWorld(core, TextTable(encode_table(texts)))
+
+
+def load(source: Path = SOURCE, cache: Path = CACHE) -> CompiledWorld:
+    """Load the compiled world, first rebuilding the cache if `source` changed since it was written."""
+    return _read(cache, _stamp(source)) or build(source, cache)
+
+
+@functools.lru_cache(maxsize=None)
+def default_world() -> CompiledWorld:
+    """`world_data.py` compiled, loaded once per process."""
+    return load()
+
+
+def main() -> None:
+    compiled = build()
+    print(f"{CACHE}: {len(compiled.environments)} environments, {len(compiled.weather)} weather types")
+    print(f"{strings_path(CACHE)}: {len(compiled.text)} strings, {strings_path(CACHE).stat().st_size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -504,3 +504,27 @@ WEATHER_DATA = [
         "mood": "Moist near-surface air condenses into low fog bands that narrow sightlines and mute distant contrast. A faint ozone-sweet note often accompanies this pattern, and occasional distant points of light are observable through shifting droplets, likely insects or reflective moisture effects.",
     },
 ]
+
+# Weather is a Markov chain. Each `advance_time` call the weather changes with
+# `change_chance`; the next weather is then drawn with odds `follows[current]`,
+# multiplied by the season's odds and, once per degree of the environment's
+# `temp_bias`, by `climate_per_degree` (so hot biomes favour heatwaves).
+# Unlisted pairs have odds 1; a weather never "changes" into itself.
+WEATHER_MODEL = {
+    "change_chance": 0.35,
+    "follows": {
+        "Clear": {"Rain": 3, "Storm": 1, "Heatwave": 3, "Frostwind": 1, "Fairy Mist": 2},
+        "Rain": {"Clear": 3, "Storm": 3, "Heatwave": 0.5, "Frostwind": 1, "Fairy Mist": 3},
+        "Storm": {"Clear": 2, "Rain": 4, "Heatwave": 0.5, "Frostwind": 2, "Fairy Mist": 1},
+        "Heatwave": {"Clear": 4, "Rain": 1, "Storm": 3, "Frostwind": 0.2, "Fairy Mist": 0.5},
+        "Frostwind": {"Clear": 4, "Rain": 1, "Storm": 2, "Heatwave": 0.2, "Fairy Mist": 1},
+        "Fairy Mist": {"Clear": 3, "Rain": 3, "Storm": 0.5, "Heatwave": 1, "Frostwind": 1},
+    },
+    "season_odds": {
+        "Spring": {"Rain": 1.5, "Fairy Mist": 1.5, "Frostwind": 0.5},
+        "Summer": {"Heatwave": 2.5, "Storm": 1.5, "Frostwind": 0.2},
+        "Autumn": {"Rain": 1.3, "Fairy Mist": 1.5, "Heatwave": 0.5},
+        "Winter": {"Frostwind": 3, "Storm": 0.7, "Heatwave": 0.1},
+    },
+    "climate_per_degree": {"Heatwave": 1.3, "Clear": 1.05, "Rain": 0.95, "Frostwind": 0.75},
+}
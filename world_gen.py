@@ -0,0 +1,271 @@
+"""Procedural worlds built from the hand-written biomes and streamed in chunks."""
+
+from __future__ import annotations
+
+import copy
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+import world_cache
+from resource_store import ResourceStore, StoreSnapshot
+from survival_moo import Environment, EnvironmentDefinition, Poi, WaterSource
+
+REGION_SIDE = 8
+HOME_BIOME_CHANCE = 0.75
+TEMP_JITTER = (-1, 0, 0, 1)
+REGION_PREFIXES = (
+    "Al", "Bri", "Cor", "Dun", "El", "Fen", "Gal", "Har", "Ist", "Kel", "Lorn",
+    "Mar", "Nor", "Ost", "Pell", "Quen", "Rav", "Sil", "Tor", "Ul", "Vey", "Wyn",
+)
+REGION_SUFFIXES = (
+    "a", "ach", "den", "dell", "ford", "gard", "holt", "ith", "mere", "moor",
+    "or", "reach", "rest", "ridge", "shaw", "stead", "wick", "wyn",
+)
+
+ChunkKey = Tuple[int, int]
+
+
+class BiomeTemplate:
+    """Static pieces of one compiled biome, shared by every environment generated from it."""
+
+    __slots__ = (
+        "name", "terrain", "gatherables", "huntables", "water_sources", "temp_bias", "nodes", "flavor_id", "pois", "soundscape",
+        "flavor_sections",
+    )
+
+    def __init__(self, entry: tuple) -> None:
+        name, terrain, gatherables, huntables, water_sources, temp_bias, nodes, flavor_id, pois, soundscape, sections = entry
+        self.name = name
+        self.terrain = terrain
+        self.gatherables = gatherables
+        self.huntables = list(huntables)
+        self.water_sources = [WaterSource(*w) for w in water_sources]
+        self.temp_bias = temp_bias
+        self.nodes = nodes
+        self.flavor_id = flavor_id
+        self.pois = [Poi(*p) for p in pois]
+        self.soundscape = [(mode, list(lines)) for mode, lines in soundscape]
+        self.flavor_sections = sections
+
+
+@dataclass(frozen=True, slots=True)
+class WorldSnapshot:
+    """A procedural world's rows and resident chunks, whose environments read `store`."""
+
+    store: ResourceStore
+    resources: StoreSnapshot
+    rows: Dict[int, int]
+    chunks: Dict[ChunkKey, Dict[int, Environment]]
+
+
+class ProceduralWorld:
+    """A square grid of generated environments, streamed in chunks around the player.
+
+    Every environment is a pure function of `(seed, env_id)`, so a chunk can be
+    built the first time anything in it is read and dropped again later. Only
+    rows whose resources were changed by play (`ResourceStore.dirty`) outlive
+    their chunk. `visit` evicts chunks farther than `radius` from the player,
+    so startup and resident memory depend on the chunk size, not the world size.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        seed: int = 0,
+        chunk_side: int = 16,
+        radius: int = 1,
+        templates: Sequence[dict] | None = None,
+    ) -> None:
+        """Biomes come from `world_data.py` unless `templates` gives other `WORLD_DATA`-style entries."""
+        if size < 2:
+            raise ValueError("A procedural world needs at least two environments")
+        self.size = size
+        self.seed = seed
+        self.chunk_side = chunk_side
+        self.radius = radius
+        self.width = math.isqrt(size - 1) + 1
+        compiled = world_cache.default_world() if templates is None else world_cache.CompiledWorld.from_data(templates)
+        self.text = compiled.text
+        self.templates = [BiomeTemplate(entry) for entry in compiled.environments]
+        items = sorted({node[0] for template in self.templates for node in template.nodes})
+        self.resources = ResourceStore(0, items)
+        self.rows: Dict[int, int] = {}
+        self.chunks: Dict[ChunkKey, Dict[int, Environment]] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, env_id: int) -> Environment:
+        if not 0 <= env_id < self.size:
+            raise IndexError(env_id)
+        key = self.chunk_of(env_id)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self._load_chunk(key)
+        return chunk[env_id]
+
+    def __iter__(self) -> Iterator[Environment]:
+        raise TypeError("Procedural worlds are streamed; index environments by id instead of iterating")
+
+    def coordinates(self, env_id: int) -> Tuple[int, int]:
+        return env_id % self.width, env_id // self.width
+
+    def chunk_of(self, env_id: int) -> ChunkKey:
+        x, y = self.coordinates(env_id)
+        return x // self.chunk_side, y // self.chunk_side
+
+    def neighbours(self, env_id: int) -> List[int]:
+        x, y = self.coordinates(env_id)
+        found = []
+        for nx, ny in ((x, y - 1), (x - 1, y), (x + 1, y), (x, y + 1)):
+            neighbour = ny * self.width + nx
+            if 0 <= nx < self.width and ny >= 0 and neighbour < self.size:
+                found.append(neighbour)
+        return found
+
+    def destination(self, location: int, rng: random.Random) -> int:
+        """Travel moves to an adjacent grid cell."""
+        return rng.choice(self.neighbours(location))
+
+    def visit(self, location: int) -> None:
+        """Make sure the player's chunk is resident and evict chunks out of range."""
+        cx, cy = self.chunk_of(location)
+        for key in [k for k in self.chunks if max(abs(k[0] - cx), abs(k[1] - cy)) > self.radius]:
+            self._evict_chunk(key)
+        if (cx, cy) not in self.chunks:
+            self._load_chunk((cx, cy))
+
+    def _chunk_env_ids(self, key: ChunkKey) -> Iterator[int]:
+        cx, cy = key
+        side = self.chunk_side
+        for y in range(cy * side, (cy + 1) * side):
+            for x in range(cx * side, min((cx + 1) * side, self.width)):
+                env_id = y * self.width + x
+                if env_id < self.size:
+                    yield env_id
+
+    def _load_chunk(self, key: ChunkKey) -> Dict[int, Environment]:
+        regions: Dict[ChunkKey, Tuple[int, str]] = {}
+        chunk = {env_id: self._generate(env_id, regions) for env_id in self._chunk_env_ids(key)}
+        self.chunks[key] = chunk
+        return chunk
+
+    def _evict_chunk(self, key: ChunkKey) -> None:
+        store = self.resources
+        for env_id in self.chunks.pop(key):
+            row = self.rows[env_id]
+            if not store.dirty[row]:
+                store.release_row(row)
+                del self.rows[env_id]
+
+    def _region(self, env_id: int, cache: Dict[ChunkKey, Tuple[int, str]]) -> Tuple[int, str]:
+        """Return the home biome index and name of the region around an environment."""
+        x, y = self.coordinates(env_id)
+        key = (x // REGION_SIDE, y // REGION_SIDE)
+        if key not in cache:
+            rng = random.Random(f"{self.seed}:region:{key[0]}:{key[1]}")
+            name = rng.choice(REGION_PREFIXES) + rng.choice(REGION_SUFFIXES)
+            cache[key] = (rng.randrange(len(self.templates)), name)
+        return cache[key]
+
+    def _generate(self, env_id: int, regions: Dict[ChunkKey, Tuple[int, str]]) -> Environment:
+        home_biome, region_name = self._region(env_id, regions)
+        rng = random.Random(f"{self.seed}:env:{env_id}")
+        biome = home_biome if rng.random() < HOME_BIOME_CHANCE else rng.randrange(len(self.templates))
+        template = self.templates[biome]
+
+        soundscape = {
+            mode: rng.sample(lines, rng.randint(1, len(lines)))
+            for mode, lines in template.soundscape
+            if lines
+        }
+        huntables = template.huntables
+        definition = EnvironmentDefinition(
+            name=f"{template.name} of {region_name}",
+            terrain=template.terrain,
+            gatherables=template.gatherables,
+            huntables=rng.sample(huntables, rng.randint(min(2, len(huntables)), len(huntables))),
+            water_sources=rng.sample(template.water_sources, rng.randint(1, len(template.water_sources))),
+            pois=rng.sample(template.pois, rng.randint(1, len(template.pois))),
+            temp_bias=template.temp_bias + rng.choice(TEMP_JITTER),
+            flavor_id=template.flavor_id,
+            soundscape=soundscape,
+            flavor_sections=template.flavor_sections,
+            text=self.text,
+        )
+        return Environment(definition, self.resources.nodes(self._row_for(env_id, template, rng)))
+
+    def _row_for(self, env_id: int, template: BiomeTemplate, rng: random.Random) -> int:
+        """Reuse the row of an environment changed by play, or allocate and stock a fresh one."""
+        row = self.rows.get(env_id)
+        if row is not None:
+            return row
+        row = self.resources.allocate_row()
+        self.rows[env_id] = row
+        for item, _, max_count, regen_rate, _ in template.nodes:
+            max_count = max(1, max_count + rng.randint(-2, 2))
+            self.resources.set_node(row, item, rng.randint(max_count // 2, max_count), max_count, regen_rate)
+        return row
+
+    def snapshot(self) -> WorldSnapshot:
+        """Resident chunks are never changed once loaded, so the snapshot shares them."""
+        return WorldSnapshot(self.resources, self.resources.snapshot(), dict(self.rows), dict(self.chunks))
+
+    def restore(self, snapshot: WorldSnapshot) -> None:
+        self.resources.restore(snapshot.resources)
+        self.rows = dict(snapshot.rows)
+        self.chunks = dict(snapshot.chunks) if snapshot.store is self.resources else self._rebind(snapshot.chunks)
+
+    def fork(self) -> ProceduralWorld:
+        """An independent copy sharing the templates and text; resident environments are rebound to its store."""
+        clone = copy.copy(self)
+        clone.resources = self.resources.fork()
+        clone.rows = dict(self.rows)
+        clone.chunks = clone._rebind(self.chunks)
+        return clone
+
+    def _rebind(self, chunks: Dict[ChunkKey, Dict[int, Environment]]) -> Dict[ChunkKey, Dict[int, Environment]]:
+        """Copies of `chunks` whose environments read this world's store, keeping their definitions."""
+        nodes = self.resources.nodes
+        return {
+            key: {env_id: Environment(env.definition, nodes(env.resource_nodes.row)) for env_id, env in chunk.items()}
+            for key, chunk in chunks.items()
+        }
+
+    def nodes_payload(self) -> Dict[str, Dict[str, dict]]:
+        """Serialize only environments whose resources were changed by play, keyed by env id."""
+        changed = [(env_id, row) for env_id, row in sorted(self.rows.items()) if self.resources.dirty[row]]
+        payload = self.resources.to_payload(row for _, row in changed)
+        return {str(env_id): nodes for (env_id, _), nodes in zip(changed, payload)}
+
+    def load_nodes_payload(self, payload: Dict[str, Dict[str, dict]]) -> None:
+        if not isinstance(payload, dict):
+            raise ValueError("Save was written for a hand-written world, not a procedural one")
+        env_ids = [int(env_id) for env_id in payload]
+        self.resources.load_payload(payload.values(), self._reset_rows(env_ids))
+
+    def node_records(self) -> np.ndarray:
+        """Records for environments changed by play, like `nodes_payload`."""
+        changed = [(env_id, row) for env_id, row in sorted(self.rows.items()) if self.resources.dirty[row]]
+        return self.resources.to_records([row for _, row in changed], [env_id for env_id, _ in changed])
+
+    def load_node_records(self, records: np.ndarray) -> None:
+        env_ids, inverse = np.unique(records["env"], return_inverse=True)
+        rows = np.array(self._reset_rows(env_ids.tolist()), dtype=np.intp)
+        self.resources.load_records(records, rows[inverse])
+
+    def _reset_rows(self, env_ids: List[int]) -> List[int]:
+        """Drop every resident chunk and row, then allocate fresh rows for `env_ids`."""
+        for key in list(self.chunks):
+            del self.chunks[key]
+        for row in self.rows.values():
+            self.resources.release_row(row)
+        self.rows.clear()
+
+        rows = [self.resources.allocate_row() for _ in env_ids]
+        self.rows.update(zip(env_ids, rows))
+        return rows